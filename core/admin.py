@@ -1,9 +1,110 @@
-from django.contrib import admin
+import json
+from functools import partial
+
+from django import forms
+from django.conf import settings
+from django.contrib import admin, messages
+from django.contrib.admin.helpers import ActionForm
+from django.contrib.admin.models import CHANGE, LogEntry
+from django.contrib.admin.widgets import AutocompleteSelect
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.http import Http404
+from django.template.response import TemplateResponse
 from django.utils.html import format_html
-from django.urls import path
+from django.urls import path, reverse
 from django.utils.timezone import now
-from .models import Task
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from .bulk import bulk_update_tasks, retag_tasks, update_tasks
+from .bulk_jobs import job_progress, start_job
+from .models import Task, Tag
+from .pagination import EstimatedCountPaginator
 from .profile import UserProfile
+from .stats import task_stats
+from .search import search_tasks
+
+
+class AutocompleteFilter(admin.RelatedFieldListFilter):
+    """Foreign key filter picked in an autocomplete box
+    
+    ``RelatedFieldListFilter`` lists every related row in the sidebar. This
+    searches the related model admin's ``search_fields`` instead and only
+    loads the selected row.
+    """
+    template = 'admin/core/autocomplete_filter.html'
+    
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        self.admin_site = model_admin.admin_site
+        super().__init__(field, request, params, model, model_admin, field_path)
+    
+    def field_choices(self, field, request, model_admin):
+        return []
+    
+    def has_output(self):
+        return True
+    
+    def choices(self, changelist):
+        # The picked value is applied on top of the other filters
+        self.base_query_string = changelist.get_query_string(remove=self.expected_parameters())
+        yield from super().choices(changelist)
+    
+    def widget(self):
+        field = forms.ModelChoiceField(
+            queryset=self.field.remote_field.model._default_manager.all(),
+            required=False,
+            widget=AutocompleteSelect(self.field, self.admin_site, attrs={
+                'data-filter-url': self.base_query_string,
+                'data-width': '100%',
+            }),
+        )
+        return field.widget.render(self.lookup_kwarg, self.lookup_val)
+
+
+class LabelledAutocompleteSelect(AutocompleteSelect):
+    """Autocomplete box that can take the selected option's label from ``labels``
+    
+    Without it every editable changelist row queries its selected user
+    again, although the changelist has already joined it.
+    """
+    labels = None
+    
+    def optgroups(self, name, value, attr=None):
+        selected = [str(v) for v in value if str(v) not in self.choices.field.empty_values]
+        if self.labels is None or not set(selected) <= self.labels.keys():
+            return super().optgroups(name, value, attr)
+        options = []
+        if not self.is_required:
+            options.append(self.create_option(name, '', '', False, 0))
+        for pk in selected:
+            options.append(self.create_option(name, pk, self.labels[pk], True, len(options)))
+        return [(None, options, 0)]
+
+
+class TaskChangeListForm(forms.ModelForm):
+    """Changelist row form labelling the assignee box with the row's joined user"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        field = self.fields.get('assigned_to')
+        task = self.instance
+        if field is not None and task.assigned_to_id and Task.assigned_to.is_cached(task):
+            # Unwrap the add/change links around the select
+            widget = getattr(field.widget, 'widget', field.widget)
+            widget.labels = {str(task.assigned_to_id): field.label_from_instance(task.assigned_to)}
+
+
+class TaskActionForm(ActionForm):
+    """Action bar with the values the bulk actions apply"""
+    priority = forms.ChoiceField(choices=[('', 'Priority')] + Task.PRIORITY_CHOICES, required=False)
+    assigned_to = forms.ModelChoiceField(
+        queryset=User.objects.all(),
+        required=False,
+        widget=AutocompleteSelect(Task._meta.get_field('assigned_to'), admin.site, attrs={'data-placeholder': 'Assignee'}),
+    )
+    tag = forms.CharField(required=False, max_length=50, widget=forms.TextInput(attrs={'placeholder': 'Tag'}))
+
 
 @admin.register(Task)
 class TaskAdmin(admin.ModelAdmin):
@@ -11,9 +112,17 @@ class TaskAdmin(admin.ModelAdmin):
         'title', 'status', 'priority', 'status_badge', 'priority_badge', 'created_by', 
         'assigned_to', 'due_date_formatted', 'is_overdue_indicator'
     ]
-    list_filter = ['status', 'priority', 'created_at', 'due_date', 'assigned_to']
+    list_filter = ['status', 'priority', 'created_at', 'due_date', ('assigned_to', AutocompleteFilter)]
     search_fields = ['title', 'description', 'tags']
     list_editable = ['status', 'priority', 'assigned_to']
+    # Users are picked by search rather than from a select of every user
+    autocomplete_fields = ['created_by', 'assigned_to']
+    # Counts on a large table: estimated or capped, and never the unfiltered
+    # total next to a filtered one
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    action_form = TaskActionForm
+    actions = ['mark_completed', 'mark_cancelled', 'set_priority', 'reassign', 'add_tag', 'remove_tag']
     readonly_fields = ['created_at', 'updated_at', 'completed_at']
     fieldsets = (
         ('Basic Information', {
@@ -77,29 +186,183 @@ class TaskAdmin(admin.ModelAdmin):
         return ''
     is_overdue_indicator.short_description = 'Alert'
     
+    @property
+    def media(self):
+        # The assignee filter's autocomplete box and the script applying it
+        autocomplete = AutocompleteSelect(Task._meta.get_field('assigned_to'), self.admin_site)
+        return super().media + autocomplete.media + forms.Media(js=['js/admin_filters.js'])
+    
     def get_queryset(self, request):
         return super().get_queryset(request).select_related('created_by', 'assigned_to')
     
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name in self.get_autocomplete_fields(request):
+            kwargs.setdefault('widget', LabelledAutocompleteSelect(db_field, self.admin_site, using=kwargs.get('using')))
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+    
+    def get_changelist_form(self, request, **kwargs):
+        return super().get_changelist_form(request, form=TaskChangeListForm, **kwargs)
+    
+    def get_search_results(self, request, queryset, search_term):
+        # Use the full-text index for search_fields instead of per-field icontains
+        if not search_term:
+            return queryset, False
+        return search_tasks(queryset, search_term), False
+    
+    def changelist_view(self, request, extra_context=None):
+        if request.method == 'POST' and '_save' in request.POST:
+            # list_editable save: save_model and log_change queue the edited
+            # rows, which are then written together
+            request.edited_tasks = []
+            with transaction.atomic():
+                response = super().changelist_view(request, extra_context)
+                self.save_edited_tasks(request)
+        else:
+            response = super().changelist_view(request, extra_context)
+        
+        # Summarize the filtered changelist with one aggregate query, unless
+        # it is too large to count exactly
+        changelist = getattr(response, 'context_data', {}).get('cl')
+        if changelist is not None:
+            paginator = changelist.paginator
+            if getattr(paginator, 'count_is_estimated', False) or getattr(paginator, 'count_is_capped', False):
+                response.context_data['task_count'] = paginator
+            else:
+                response.context_data['task_stats'] = task_stats(changelist.queryset)
+        return response
+    
+    def get_urls(self):
+        return [
+            path(
+                'bulk-jobs/<str:job_id>/',
+                self.admin_site.admin_view(self.bulk_job_view),
+                name='core_task_bulk_job',
+            ),
+        ] + super().get_urls()
+    
+    def bulk_job_view(self, request, job_id):
+        """Progress of a bulk action running in the background"""
+        progress = job_progress(job_id)
+        if progress is None:
+            raise Http404('Unknown or expired job')
+        return TemplateResponse(request, 'admin/core/task/bulk_job.html', {
+            **self.admin_site.each_context(request),
+            'opts': self.opts,
+            'title': progress['description'],
+            'job': progress,
+        })
+    
+    def run_bulk_action(self, request, queryset, description, run):
+        """Apply ``run`` to the selection now, or in the background when it is large"""
+        threshold = settings.TASK_BULK_BACKGROUND_THRESHOLD
+        run = partial(run, chunk_size=settings.TASK_BULK_CHUNK_SIZE)
+        # Counting stops past the threshold, as select-across may pick the whole table
+        if threshold and queryset.order_by()[:threshold + 1].count() > threshold:
+            job_id = start_job(description, queryset, run)
+            url = reverse('admin:core_task_bulk_job', args=[job_id])
+            self.message_user(request, format_html('{} is running in the background: <a href="{}">progress</a>.', description, url))
+            return
+        changed = run(queryset)
+        self.message_user(request, f'{description}: {changed} task(s) changed.', messages.SUCCESS)
+    
+    def action_value(self, request, field):
+        form = self.action_form(request.POST)
+        # The action choices are not set on this copy; only ``field`` matters
+        form.is_valid()
+        return form.cleaned_data.get(field)
+    
+    @admin.action(description='Mark selected tasks as completed', permissions=['change'])
+    def mark_completed(self, request, queryset):
+        self.run_bulk_action(request, queryset, 'Mark as completed', partial(update_tasks, values={'status': 'completed'}))
+    
+    @admin.action(description='Mark selected tasks as cancelled', permissions=['change'])
+    def mark_cancelled(self, request, queryset):
+        self.run_bulk_action(request, queryset, 'Mark as cancelled', partial(update_tasks, values={'status': 'cancelled'}))
+    
+    @admin.action(description='Set the chosen priority', permissions=['change'])
+    def set_priority(self, request, queryset):
+        priority = self.action_value(request, 'priority')
+        if not priority:
+            self.message_user(request, 'Choose a priority for the selected tasks.', messages.WARNING)
+            return
+        self.run_bulk_action(request, queryset, f'Set priority to {priority}', partial(update_tasks, values={'priority': priority}))
+    
+    @admin.action(description='Reassign to the chosen user', permissions=['change'])
+    def reassign(self, request, queryset):
+        user = self.action_value(request, 'assigned_to')
+        if user is None:
+            self.message_user(request, 'Choose an assignee for the selected tasks.', messages.WARNING)
+            return
+        self.run_bulk_action(request, queryset, f'Reassign to {user}', partial(update_tasks, values={'assigned_to': user}))
+    
+    @admin.action(description='Add the chosen tag', permissions=['change'])
+    def add_tag(self, request, queryset):
+        tag = (self.action_value(request, 'tag') or '').strip()
+        if not tag:
+            self.message_user(request, 'Enter a tag for the selected tasks.', messages.WARNING)
+            return
+        self.run_bulk_action(request, queryset, f'Add tag "{tag}"', partial(retag_tasks, add=[tag]))
+    
+    @admin.action(description='Remove the chosen tag', permissions=['change'])
+    def remove_tag(self, request, queryset):
+        tag = (self.action_value(request, 'tag') or '').strip()
+        if not tag:
+            self.message_user(request, 'Enter a tag for the selected tasks.', messages.WARNING)
+            return
+        self.run_bulk_action(request, queryset, f'Remove tag "{tag}"', partial(retag_tasks, remove=[tag]))
+    
     def save_model(self, request, obj, form, change):
+        edited = getattr(request, 'edited_tasks', None)
+        if change and edited is not None:
+            edited.append({'task': obj, 'fields': form.changed_data, 'message': None})
+            return
         if not change:  # Creating new task
             obj.created_by = request.user
-        super().save_model(request, obj, form, change)
         
         # Update completed_at if status changed to completed
         if obj.status == 'completed' and not obj.completed_at:
             obj.completed_at = now()
-            obj.save(update_fields=['completed_at'])
+        super().save_model(request, obj, form, change)
+    
+    def log_change(self, request, obj, message):
+        edited = getattr(request, 'edited_tasks', None)
+        if edited and edited[-1]['task'] is obj:
+            edited[-1]['message'] = message
+            return None
+        return super().log_change(request, obj, message)
+    
+    def save_edited_tasks(self, request):
+        """Write the rows queued by a list_editable save with one bulk_update"""
+        edited = request.edited_tasks
+        if not edited:
+            return
+        fields = {field for row in edited for field in row['fields']}
+        tasks = bulk_update_tasks([row['task'] for row in edited], fields)
+        content_type = ContentType.objects.get_for_model(Task)
+        LogEntry.objects.bulk_create([
+            LogEntry(
+                user_id=request.user.pk,
+                content_type_id=content_type.pk,
+                object_id=str(task.pk),
+                object_repr=str(task)[:200],
+                action_flag=CHANGE,
+                change_message=json.dumps(row['message']),
+            )
+            for task, row in zip(tasks, edited)
+        ])
 
 @admin.register(UserProfile)
 class UserProfileAdmin(admin.ModelAdmin):
     list_display = [
         'user', 'role_badge', 'department', 'phone', 'is_active_member',
-        'weekly_hours_available', 'availability_indicator'
+        'weekly_hours_available', 'open_tasks', 'open_hours', 'availability_indicator'
     ]
     list_filter = ['role', 'department', 'is_active_member', 'join_date']
     search_fields = ['user__first_name', 'user__last_name', 'user__email', 'department']
     list_editable = ['is_active_member', 'weekly_hours_available']
-    readonly_fields = ['join_date']
+    list_select_related = ['user']
+    # Maintained from the user's open tasks (core.workload)
+    readonly_fields = ['join_date', 'current_hours_allocated']
     
     fieldsets = (
         ('User Information', {
@@ -124,8 +387,28 @@ class UserProfileAdmin(admin.ModelAdmin):
         )
     role_badge.short_description = 'Role'
     
+    def get_queryset(self, request):
+        # Open task count from a correlated subquery on the assignee/status
+        # index, run for the page's rows only. The column isn't sortable:
+        # sorting would evaluate it for every profile. Hours come from the
+        # maintained current_hours_allocated column (core.workload), so
+        # sorting by them reads no tasks.
+        open_tasks = Task.objects.order_by().filter(assigned_to=OuterRef('user_id'), status__in=Task.OPEN_STATUSES)
+        return super().get_queryset(request).annotate(
+            open_task_count=Coalesce(Subquery(open_tasks.values('assigned_to').annotate(count=Count('pk')).values('count')), 0),
+        )
+    
+    def open_tasks(self, obj):
+        return obj.open_task_count
+    open_tasks.short_description = 'Open Tasks'
+    
+    def open_hours(self, obj):
+        return obj.current_hours_allocated
+    open_hours.short_description = 'Open Hours'
+    open_hours.admin_order_field = 'current_hours_allocated'
+    
     def availability_indicator(self, obj):
-        percentage = obj.availability_percentage
+        percentage = obj.workload_percentage(obj.current_hours_allocated)
         if percentage >= 100:
             return format_html('<span class="badge bg-danger">Overloaded</span>')
         elif percentage >= 80:
@@ -135,3 +418,17 @@ class UserProfileAdmin(admin.ModelAdmin):
         else:
             return format_html('<span class="badge bg-success">Free</span>')
     availability_indicator.short_description = 'Availability'
+
+
+@admin.register(Tag)
+class TagAdmin(admin.ModelAdmin):
+    list_display = ['name', 'task_count']
+    search_fields = ['name']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(task_count=Count('task_links'))
+    
+    def task_count(self, obj):
+        return obj.task_count
+    task_count.short_description = 'Tasks'
+    task_count.admin_order_field = 'task_count'
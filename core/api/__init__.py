@@ -0,0 +1 @@
+"""REST API for tasks and profiles, mounted at /api/"""
@@ -0,0 +1,106 @@
+"""Validation for the bulk task endpoint
+
+Rows are checked with the same field instances and ``validate_<field>``
+hooks as ``TaskSerializer`` (so with TaskForm's rules), but without
+building a serializer per row, and assignees for the whole request are
+looked up with a single query.
+"""
+from django.contrib.auth.models import User
+from rest_framework import serializers
+
+from core.forms import clean_task_due_date
+from .serializers import TaskSerializer, form_rule
+
+# Largest number of rows a single bulk request may carry
+MAX_BULK_ROWS = 5000
+
+# Fields a bulk request may set; others are ignored, as in TaskSerializer
+BULK_FIELDS = [
+    'title', 'description', 'status', 'priority', 'tags', 'due_date',
+    'estimated_hours', 'actual_hours', 'assigned_to',
+]
+
+
+def error_detail(error):
+    """Plain messages from a DRF ``ValidationError``"""
+    detail = error.detail
+    if isinstance(detail, dict):
+        return {key: [str(message) for message in messages] for key, messages in detail.items()}
+    return [str(message) for message in detail]
+
+
+class BulkTaskValidator:
+    """Validate many task rows at once
+
+    ``validate(rows, instances)`` returns ``(cleaned, errors)``: cleaned
+    rows map field names to Python values (``assigned_to`` becomes
+    ``assigned_to_id``), and errors is a list of ``{"index", "errors"}``.
+    For updates, ``instances`` holds the task each row edits; rows of a
+    create must include a title.
+    """
+
+    def __init__(self):
+        self.serializer = TaskSerializer()
+        self.fields = {name: self.serializer.fields[name] for name in BULK_FIELDS if name != 'assigned_to'}
+        self.hooks = {name: getattr(self.serializer, f'validate_{name}', None) for name in self.fields}
+
+    def validate(self, rows, instances=None):
+        cleaned, errors, assignees = [], {}, {}
+        for index, row in enumerate(rows):
+            if not isinstance(row, dict):
+                errors[index] = {'non_field_errors': ['Expected an object.']}
+                cleaned.append(None)
+                continue
+            data, row_errors = self.validate_fields(row)
+            if instances is None and 'title' not in row:
+                row_errors['title'] = ['This field is required.']
+            if 'due_date' in data and 'due_date' not in row_errors:
+                created_at = instances[index].created_at if instances is not None else None
+                try:
+                    form_rule(clean_task_due_date, data['due_date'], created_at)
+                except serializers.ValidationError as error:
+                    row_errors['due_date'] = error_detail(error)
+            if 'assigned_to' in row:
+                self.collect_assignee(row['assigned_to'], index, data, row_errors, assignees)
+            if row_errors:
+                errors[index] = row_errors
+            cleaned.append(data)
+
+        if assignees:
+            active = set(User.objects.filter(is_active=True, pk__in=list(assignees)).values_list('pk', flat=True))
+            for user_id, indexes in assignees.items():
+                if user_id not in active:
+                    for index in indexes:
+                        errors.setdefault(index, {})['assigned_to'] = [
+                            f'Invalid pk "{user_id}" - object does not exist.'
+                        ]
+        return cleaned, [{'index': index, 'errors': errors[index]} for index in sorted(errors)]
+
+    def validate_fields(self, row):
+        data, row_errors = {}, {}
+        for name, field in self.fields.items():
+            if name not in row:
+                continue
+            try:
+                value = field.run_validation(row[name])
+                if self.hooks[name]:
+                    value = self.hooks[name](value)
+            except serializers.ValidationError as error:
+                row_errors[name] = error_detail(error)
+            else:
+                data[name] = value
+        return data, row_errors
+
+    def collect_assignee(self, value, index, data, row_errors, assignees):
+        if value is None or value == '':
+            data['assigned_to_id'] = None
+            return
+        try:
+            if isinstance(value, bool):
+                raise TypeError
+            user_id = int(value)
+        except (TypeError, ValueError):
+            row_errors['assigned_to'] = [f'Incorrect type. Expected pk value, received {type(value).__name__}.']
+            return
+        data['assigned_to_id'] = user_id
+        assignees.setdefault(user_id, []).append(index)
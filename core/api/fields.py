@@ -0,0 +1,24 @@
+"""Sparse fieldsets (``?fields=a,b``) shared by the API serializers and list rows"""
+from rest_framework.exceptions import ValidationError
+
+
+def requested_fields(request, available):
+    """Fields named in ``?fields=``, in the order given, or all ``available`` ones"""
+    param = request.query_params.get('fields') if request is not None else None
+    if not param:
+        return list(available)
+    fields = list(dict.fromkeys(name.strip() for name in param.split(',') if name.strip()))
+    unknown = [name for name in fields if name not in available]
+    if unknown:
+        raise ValidationError({'fields': f"Unknown field(s): {', '.join(unknown)}"})
+    return fields
+
+
+class SparseFieldsMixin:
+    """Serializer mixin dropping the fields not listed in ``?fields=``"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        wanted = requested_fields(self.context.get('request'), self.fields)
+        for name in set(self.fields) - set(wanted):
+            self.fields.pop(name)
@@ -0,0 +1,27 @@
+from rest_framework import permissions
+
+
+def user_profile(user):
+    return getattr(user, 'profile', None)
+
+
+class TaskPermission(permissions.IsAuthenticated):
+    """The HTML views' rules: managers create, visible tasks are editable, creators delete"""
+
+    def has_permission(self, request, view):
+        if not super().has_permission(request, view):
+            return False
+        if view.action == 'create' or (view.action == 'bulk' and request.method == 'POST'):
+            profile = user_profile(request.user)
+            return request.user.is_superuser or (profile is not None and profile.can_manage_tasks())
+        return True
+
+    def has_object_permission(self, request, view, obj):
+        if request.user.is_superuser:
+            return True
+        if request.method == 'DELETE':
+            return obj.created_by_id == request.user.pk
+        if request.method in permissions.SAFE_METHODS:
+            return True
+        profile = user_profile(request.user)
+        return obj.is_visible_to(request.user) or (profile is not None and profile.can_manage_tasks())
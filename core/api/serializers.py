@@ -0,0 +1,136 @@
+from django import forms
+from django.contrib.auth.models import User
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+from core.forms import clean_task_due_date, clean_task_hours, clean_task_title
+from core.models import Task
+from core.profile import UserProfile
+from .fields import SparseFieldsMixin
+
+# List rows are built from ``values()`` with these ORM lookups, so they
+# match TaskSerializer's output without instantiating a field per value
+TASK_LIST_COLUMNS = {
+    'id': 'id',
+    'title': 'title',
+    'description': 'description',
+    'status': 'status',
+    'priority': 'priority',
+    'tags': 'tags',
+    'due_date': 'due_date',
+    'completed_at': 'completed_at',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+    'estimated_hours': 'estimated_hours',
+    'actual_hours': 'actual_hours',
+    'created_by': 'created_by_id',
+    'created_by_username': 'created_by__username',
+    'assigned_to': 'assigned_to_id',
+    'assigned_to_username': 'assigned_to__username',
+}
+
+# Columns the cursor paginator reads from every row
+ORDERING_COLUMNS = ['created_at', 'id']
+
+
+class TaskSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    created_by_username = serializers.CharField(source='created_by.username', read_only=True)
+    assigned_to_username = serializers.CharField(source='assigned_to.username', read_only=True, default=None)
+
+    class Meta:
+        model = Task
+        fields = list(TASK_LIST_COLUMNS)
+        read_only_fields = ['created_by', 'completed_at', 'created_at', 'updated_at']
+        # Same choices as TaskForm
+        extra_kwargs = {'assigned_to': {'queryset': User.objects.filter(is_active=True)}}
+
+    # TaskForm's rules, shared with the bulk endpoint
+
+    def validate_title(self, value):
+        return form_rule(clean_task_title, value)
+
+    def validate_estimated_hours(self, value):
+        return form_rule(clean_task_hours, value, 'Estimated')
+
+    def validate_actual_hours(self, value):
+        return form_rule(clean_task_hours, value, 'Actual')
+
+    def validate(self, attrs):
+        if 'due_date' in attrs:
+            created_at = self.instance.created_at if self.instance else None
+            form_rule(clean_task_due_date, attrs['due_date'], created_at, field='due_date')
+        return attrs
+
+
+def form_rule(rule, *args, field=None):
+    """Run a ``core.forms`` rule, re-raising its error the way DRF reports it"""
+    try:
+        return rule(*args)
+    except forms.ValidationError as error:
+        raise serializers.ValidationError({field: error.messages} if field else error.messages)
+
+
+# Converted to the same strings TaskSerializer produces
+DATETIME_FIELDS = {'due_date', 'completed_at', 'created_at', 'updated_at'}
+DECIMAL_FIELDS = {'estimated_hours', 'actual_hours'}
+
+
+def datetime_converter():
+    """Fast equivalent of ``DateTimeField().to_representation`` for ISO 8601 output"""
+    field = serializers.DateTimeField()
+    if api_settings.DATETIME_FORMAT != ISO_8601:
+        return field.to_representation
+    tz = field.default_timezone()
+
+    def convert(value):
+        if tz is not None:
+            value = value.astimezone(tz)
+        text = value.isoformat()
+        return text[:-6] + 'Z' if text.endswith('+00:00') else text
+    return convert
+
+
+def task_rows(rows, fields):
+    """Shape ``values()`` rows into API dicts with the requested fields
+
+    Output matches TaskSerializer, but only datetime and decimal columns
+    go through a converter; every other value is copied as is.
+    """
+    convert_datetime = datetime_converter()
+    columns = []
+    for field in fields:
+        if field in DATETIME_FIELDS:
+            convert = convert_datetime
+        elif field in DECIMAL_FIELDS:
+            convert = str
+        else:
+            convert = None
+        columns.append((field, TASK_LIST_COLUMNS[field], convert))
+    return [
+        {
+            field: convert(row[column]) if convert and row[column] is not None else row[column]
+            for field, column, convert in columns
+        }
+        for row in rows
+    ]
+
+
+def task_list_columns(fields):
+    return list(dict.fromkeys([TASK_LIST_COLUMNS[field] for field in fields] + ORDERING_COLUMNS))
+
+
+class ProfileSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    user = serializers.IntegerField(source='user_id', read_only=True)
+    username = serializers.CharField(source='user.username', read_only=True)
+    email = serializers.EmailField(source='user.email', read_only=True)
+    full_name = serializers.CharField(read_only=True)
+    availability_percentage = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = UserProfile
+        fields = [
+            'id', 'user', 'username', 'email', 'full_name', 'role', 'department',
+            'is_active_member', 'weekly_hours_available', 'current_hours_allocated',
+            'availability_percentage',
+        ]
+        read_only_fields = fields
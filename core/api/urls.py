@@ -0,0 +1,25 @@
+from django.urls import include, path
+from drf_yasg import openapi
+from drf_yasg.views import get_schema_view
+from rest_framework.routers import DefaultRouter
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+
+from . import views
+
+app_name = 'api'
+
+router = DefaultRouter()
+router.register('tasks', views.TaskViewSet, basename='task')
+router.register('profiles', views.ProfileViewSet, basename='profile')
+
+schema_view = get_schema_view(
+    openapi.Info(title='Task Manager Pro API', default_version='v1'),
+    public=False,
+)
+
+urlpatterns = [
+    path('', include(router.urls)),
+    path('token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
+    path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    path('docs/', schema_view.with_ui('swagger', cache_timeout=0), name='docs'),
+]
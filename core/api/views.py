@@ -0,0 +1,170 @@
+from django.utils import timezone
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from core.bulk import bulk_create_tasks, bulk_delete_tasks, bulk_update_tasks
+from core.conditional import make_etag, not_modified, set_validators, tasks_validator
+from core.filters import filter_tasks
+from core.models import Task
+from core.profile import UserProfile
+from .bulk import MAX_BULK_ROWS, BulkTaskValidator
+from .fields import requested_fields
+from .pagination import TaskCursorPagination, ProfileCursorPagination
+from .permissions import TaskPermission
+from .serializers import (
+    TASK_LIST_COLUMNS, ProfileSerializer, TaskSerializer, task_list_columns, task_rows,
+)
+
+
+class TaskViewSet(viewsets.ModelViewSet):
+    """Tasks the user can see; managers and admins see every task
+
+    Accepts the task list filters (``search``, ``status``, ``priority``,
+    ``tag``, ``assignment``) and ``?fields=`` to return only some fields.
+    """
+    serializer_class = TaskSerializer
+    pagination_class = TaskCursorPagination
+    permission_classes = [TaskPermission]
+
+    def get_queryset(self):
+        user = self.request.user
+        profile = getattr(user, 'profile', None)
+        if user.is_superuser or (profile is not None and profile.can_view_all_tasks()):
+            tasks = Task.objects.all()
+        else:
+            tasks = Task.objects.visible_to(user)
+        return tasks.with_people()
+
+    def filter_queryset(self, queryset):
+        queryset, _ = filter_tasks(queryset, self.request.query_params, self.request.user)
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        # Conditional GET: one aggregate over the visible tasks, with the
+        # filters, fields and cursor folded into the ETag via the query string
+        etag = make_etag(request, 'api:task-list', *tasks_validator(self.get_queryset()))
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+        
+        # Rows come straight from values() on the requested columns; no
+        # model instances or serializer fields are built per row
+        fields = requested_fields(request, TASK_LIST_COLUMNS)
+        rows = self.filter_queryset(self.get_queryset()).values(*task_list_columns(fields))
+        page = self.paginate_queryset(rows)
+        response = self.get_paginated_response(task_rows(page, fields))
+        set_validators(response, etag)
+        return response
+    
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            last_modified = self.get_queryset().filter(pk=kwargs['pk']).values_list('updated_at', flat=True).first()
+        except (TypeError, ValueError):
+            last_modified = None
+        if last_modified is None:
+            # Missing or not visible: the default path answers 404
+            return super().retrieve(request, *args, **kwargs)
+        etag = make_etag(request, 'api:task-detail', kwargs['pk'], last_modified)
+        response = not_modified(request, etag, last_modified)
+        if response is None:
+            response = super().retrieve(request, *args, **kwargs)
+            set_validators(response, etag, last_modified)
+        return response
+
+    def perform_create(self, serializer):
+        serializer.save(created_by=self.request.user)
+
+    def perform_update(self, serializer):
+        task = serializer.save()
+        # Same rule as the task_edit view
+        if task.status == 'completed' and not task.completed_at:
+            task.completed_at = timezone.now()
+            task.save()
+
+    @action(detail=False, methods=['post', 'patch', 'delete'])
+    def bulk(self, request):
+        """Create (POST), update (PATCH, rows with an ``id``) or delete (DELETE, ``{"ids": [...]}``) many tasks
+
+        Each request runs in one transaction and is all or nothing: if any
+        row is invalid nothing is written and the response lists the
+        errors by row index.
+        """
+        if request.method == 'DELETE':
+            rows = request.data.get('ids') if isinstance(request.data, dict) else None
+        else:
+            rows = request.data
+        if not isinstance(rows, list):
+            return Response({'detail': 'Expected a list.'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(rows) > MAX_BULK_ROWS:
+            return Response(
+                {'detail': f'At most {MAX_BULK_ROWS} rows per request.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if request.method == 'POST':
+            return self.bulk_create(rows)
+        if request.method == 'PATCH':
+            return self.bulk_update(rows)
+        return self.bulk_delete(rows)
+
+    def bulk_create(self, rows):
+        cleaned, errors = BulkTaskValidator().validate(rows)
+        if errors:
+            return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+        tasks = bulk_create_tasks([Task(created_by=self.request.user, **data) for data in cleaned])
+        return Response({'created': len(tasks), 'ids': [task.pk for task in tasks]}, status=status.HTTP_201_CREATED)
+
+    def bulk_update(self, rows):
+        # Only tasks get_queryset returns are editable, as with TaskPermission
+        ids = [row.get('id') if isinstance(row, dict) else None for row in rows]
+        tasks = self.get_queryset().select_related(None).in_bulk([pk for pk in ids if isinstance(pk, int)])
+        errors, seen = [], set()
+        for index, pk in enumerate(ids):
+            if pk not in tasks:
+                errors.append({'index': index, 'errors': {'id': ['Not found.']}})
+            elif pk in seen:
+                errors.append({'index': index, 'errors': {'id': ['Duplicate id.']}})
+            seen.add(pk)
+        if errors:
+            return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        instances = [tasks[pk] for pk in ids]
+        cleaned, errors = BulkTaskValidator().validate(rows, instances)
+        if errors:
+            return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+        fields = set()
+        for task, data in zip(instances, cleaned):
+            for name, value in data.items():
+                setattr(task, name, value)
+            fields.update(data)
+        bulk_update_tasks(instances, fields)
+        return Response({'updated': len(instances)})
+
+    def bulk_delete(self, ids):
+        tasks = self.get_queryset().select_related(None).filter(pk__in=[pk for pk in ids if isinstance(pk, int)])
+        creators = dict(tasks.values_list('pk', 'created_by_id'))
+        errors = []
+        for index, pk in enumerate(ids):
+            if pk not in creators:
+                errors.append({'index': index, 'errors': {'id': ['Not found.']}})
+            elif not self.request.user.is_superuser and creators[pk] != self.request.user.pk:
+                # Same rule as TaskPermission for single deletes
+                errors.append({'index': index, 'errors': {'id': ['Only the creator can delete this task.']}})
+        if errors:
+            return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({'deleted': bulk_delete_tasks(Task.objects.filter(pk__in=list(creators)))})
+
+
+class ProfileViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet):
+    """Team member profiles (read-only)"""
+    queryset = UserProfile.objects.select_related('user')
+    serializer_class = ProfileSerializer
+    pagination_class = ProfileCursorPagination
+    permission_classes = [IsAuthenticated]
+
+    @action(detail=False)
+    def me(self, request):
+        profile = UserProfile.objects.select_related('user').get(user=request.user)
+        return Response(self.get_serializer(profile).data)
@@ -1,5 +1,30 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+    
+    def ready(self):
+        # Registers the signals that invalidate cached task fragments,
+        # publish live task events and maintain allocated hours
+        from . import events, fragments, workload  # noqa: F401
+        post_migrate.connect(restore_search_schema, sender=self)
+
+SEARCH_MIGRATION = ('core', '0005_task_search_index')
+
+def restore_search_schema(sender, using, **kwargs):
+    """Recreate search triggers that SQLite drops when a migration remakes core_task
+    
+    Skipped unless the migration that installs them is applied, so
+    migrating back below it (or to zero) leaves no search schema behind.
+    """
+    from django.db import connections
+    from django.db.migrations.recorder import MigrationRecorder
+    from .search import ensure_search_schema
+    connection = connections[using]
+    if SEARCH_MIGRATION not in MigrationRecorder(connection).applied_migrations():
+        return
+    if 'core_task' not in connection.introspection.table_names():
+        return
+    ensure_search_schema(connection)
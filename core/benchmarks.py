@@ -0,0 +1,495 @@
+"""Query benchmarks for task views, run with ``manage.py benchmark``"""
+import asyncio
+import random
+import statistics
+import time
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connection, connections
+from django.db.models import Count, Q
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import Task
+from .counters import UserTaskCounter
+from .events import EventBroker, task_event
+from .fragments import metrics
+from .middleware import QueryStats
+from .pagination import CursorPaginator, encode_cursor
+from .search import search_tasks
+from .tag_index import TagIndex
+from .tags import Tag
+from .stats import user_task_stats, user_counter_stats
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Register a benchmark scenario under ``name``"""
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+
+def measure(func, repeat=10):
+    """Run ``func`` repeatedly and report its query count and latency in ms"""
+    # execute_wrapper keeps counting across request_started, which resets
+    # the connection's query log when a scenario goes through the test client
+    stats = QueryStats()
+    with connection.execute_wrapper(stats):
+        func()
+    
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return summarize(timings, stats.count)
+
+
+def summarize(timings, queries=0):
+    """Result fields for a list of latencies in ms"""
+    timings = sorted(timings)
+    return {
+        'queries': queries,
+        'p50_ms': statistics.median(timings),
+        'p99_ms': timings[min(len(timings) - 1, int(len(timings) * 0.99))],
+        'max_ms': timings[-1],
+    }
+
+
+@benchmark('dashboard_stats')
+def dashboard_stats(user, repeat):
+    """Per-status COUNT queries versus one conditional aggregate"""
+    def legacy():
+        now = timezone.now()
+        user_tasks = Task.objects.filter(
+            Q(created_by=user) | Q(assigned_to=user)
+        ).distinct()
+        return {
+            'total_tasks': user_tasks.count(),
+            'pending_tasks': user_tasks.filter(status='pending').count(),
+            'in_progress_tasks': user_tasks.filter(status='in_progress').count(),
+            'completed_tasks': user_tasks.filter(status='completed').count(),
+            'overdue_tasks': user_tasks.filter(
+                due_date__lt=now, status__in=['pending', 'in_progress']
+            ).count(),
+        }
+    
+    # Build the counter row up front so the timed runs only read it
+    UserTaskCounter.for_user(user)
+    return {
+        'separate counts': measure(legacy, repeat),
+        'aggregate': measure(lambda: user_task_stats(user), repeat),
+        'materialized counters': measure(lambda: user_counter_stats(user), repeat),
+    }
+
+
+@benchmark('visibility')
+def visibility(user, repeat):
+    """OR + DISTINCT visibility filter versus the UNION-based visible_to()"""
+    legacy = Task.objects.filter(Q(created_by=user) | Q(assigned_to=user)).distinct()
+    union = Task.objects.visible_to(user)
+    
+    return {
+        'or+distinct first page': measure(lambda: list(legacy.order_by('-created_at')[:12]), repeat),
+        'union first page': measure(lambda: list(union.order_by('-created_at')[:12]), repeat),
+        'or+distinct count': measure(legacy.count, repeat),
+        'union count': measure(union.count, repeat),
+    }
+
+
+@benchmark('pagination')
+def pagination(user, repeat):
+    """OFFSET pages versus keyset cursors on the unscoped task listing"""
+    tasks = Task.objects.order_by('-created_at')
+    paginator = Paginator(tasks, 12)
+    deep_page = min(5000, paginator.num_pages)
+    
+    # The cursor that "Next" on the page before the deep page would carry
+    last_of_previous = tasks.order_by('-created_at', '-id')[(deep_page - 1) * 12 - 1]
+    deep_cursor = encode_cursor('next', last_of_previous)
+    
+    return {
+        'offset page 1': measure(lambda: list(Paginator(tasks, 12).get_page(1)), repeat),
+        f'offset page {deep_page}': measure(lambda: list(Paginator(tasks, 12).get_page(deep_page)), repeat),
+        'cursor page 1': measure(lambda: list(CursorPaginator(tasks, 12, count_limit=1000).get_page(None)), repeat),
+        f'cursor page {deep_page}': measure(
+            lambda: list(CursorPaginator(tasks, 12, count_limit=1000).get_page(deep_cursor)), repeat
+        ),
+    }
+
+
+@benchmark('search')
+def search(user, repeat):
+    """Triple icontains scan versus the full-text search backend"""
+    tasks = Task.objects.order_by('-created_at')
+    
+    def icontains(term):
+        return list(tasks.filter(
+            Q(title__icontains=term) | Q(description__icontains=term) | Q(tags__icontains=term)
+        )[:12])
+    
+    # A common tag and a selective term that forces LIKE to read every row
+    results = {}
+    for term in ('backend', 'task 12345'):
+        results[f'icontains "{term}"'] = measure(lambda: icontains(term), repeat)
+        results[f'full-text "{term}"'] = measure(lambda: list(search_tasks(tasks, term)[:12]), repeat)
+        results[f'full-text ranked "{term}"'] = measure(
+            lambda: list(search_tasks(tasks, term, ranked=True)[:12]), repeat
+        )
+    return results
+
+
+@benchmark('tag_autocomplete')
+def tag_autocomplete(user, repeat):
+    """Prefix lookups on a 50k-tag index versus LIKE + GROUP BY on the tag table"""
+    rng = random.Random(0)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    counts = {}
+    while len(counts) < 50000:
+        name = ''.join(rng.choice(letters) for _ in range(rng.randint(3, 12)))
+        counts[name] = int(rng.paretovariate(1.2))
+    index = TagIndex(counts)
+    
+    results = {'index build (50k tags)': measure(lambda: TagIndex(counts), max(1, repeat // 5))}
+    for prefix in ('', 'b', 'ba', 'bac', 'zzzq'):
+        results[f'index prefix "{prefix}"'] = measure(lambda: index.suggest(prefix, 10), repeat)
+    results['index update one task'] = measure(lambda: index.apply({'bac': 1, 'ba': -1}), repeat)
+    
+    def database(prefix):
+        return list(
+            Tag.objects.filter(name__startswith=prefix)
+            .annotate(task_count=Count('task_links'))
+            .order_by('-task_count', 'name')
+            .values_list('name', 'task_count')[:10]
+        )
+    for prefix in ('b', 'bac'):
+        results[f'database prefix "{prefix}"'] = measure(lambda: database(prefix), repeat)
+    return results
+
+
+@benchmark('fragment_cache')
+def fragment_cache(user, repeat):
+    """Full page renders with an empty versus a warm fragment cache"""
+    client = Client(HTTP_HOST='localhost')
+    client.force_login(user)
+    
+    def cold(url):
+        cache.clear()
+        client.get(url)
+    
+    results = {}
+    for name in ('core:dashboard', 'core:task_list'):
+        url = reverse(name)
+        results[f'{name} cold'] = measure(lambda: cold(url), repeat)
+        metrics.reset()
+        results[f'{name} warm'] = measure(lambda: client.get(url), repeat)
+        stats = metrics.snapshot().values()
+        hits = sum(fragment['hits'] for fragment in stats)
+        results[f'{name} warm']['hit_rate'] = hits / max(1, hits + sum(fragment['misses'] for fragment in stats))
+    return results
+
+
+@benchmark('api_serialization')
+def api_serialization(user, repeat):
+    """10k tasks to JSON through TaskSerializer versus values() rows"""
+    from rest_framework.renderers import JSONRenderer
+    from .api.serializers import TASK_LIST_COLUMNS, TaskSerializer, task_list_columns, task_rows
+    
+    rows = 10000
+    tasks = Task.objects.with_people().order_by('-created_at', '-id')[:rows]
+    fields = list(TASK_LIST_COLUMNS)
+    renderer = JSONRenderer()
+    
+    def serializer():
+        return renderer.render(TaskSerializer(tasks, many=True).data)
+    
+    def lightweight():
+        return renderer.render(task_rows(tasks.values(*task_list_columns(fields)), fields))
+    
+    def sparse():
+        return renderer.render(task_rows(tasks.values(*task_list_columns(['id', 'title'])), ['id', 'title']))
+    
+    results = {}
+    for label, func in (('serializer', serializer), ('values rows', lightweight), ('values rows, 2 fields', sparse)):
+        results[label] = measure(func, repeat)
+        results[label]['rows_per_s'] = rows / (results[label]['p50_ms'] / 1000)
+    return results
+
+
+@benchmark('bulk_api')
+def bulk_api(user, repeat):
+    """200 tasks created with task_create form posts versus one bulk API request
+
+    Everything runs in a transaction that is rolled back, with ``user``
+    made a manager for the duration so both paths may create tasks.
+    """
+    from django.db import transaction
+    from rest_framework.test import APIClient
+    
+    rows = 200
+    data = [
+        {'title': f'Bulk task {i}', 'priority': 'high', 'status': 'pending', 'tags': 'bulk, benchmark'}
+        for i in range(rows)
+    ]
+    url = reverse('api:task-bulk')
+    
+    def rolled_back(func):
+        def run():
+            with transaction.atomic():
+                func()
+                transaction.set_rollback(True)
+        return run
+    
+    def forms():
+        for row in data:
+            assert client.post(reverse('core:task_create'), row).status_code == 302
+    
+    def bulk_create():
+        assert api.post(url, data, format='json').status_code == 201
+    
+    def bulk_update():
+        ids = api.post(url, data, format='json').data['ids']
+        assert api.patch(url, [{'id': pk, 'status': 'completed'} for pk in ids], format='json').status_code == 200
+    
+    results = {}
+    with transaction.atomic():
+        user.profile.role = 'manager'
+        user.profile.save()
+        client = Client(HTTP_HOST='localhost')
+        client.force_login(user)
+        api = APIClient(HTTP_HOST='localhost')
+        api.force_authenticate(user)
+        for label, func in (('form posts', forms), ('bulk create', bulk_create), ('bulk create + update', bulk_update)):
+            results[label] = measure(rolled_back(func), repeat)
+            results[label]['rows_per_s'] = rows / (results[label]['p50_ms'] / 1000)
+        transaction.set_rollback(True)
+    return results
+
+
+@benchmark('task_events')
+def task_events(user, repeat):
+    """Fan-out of task events to 1,000 open streams, read promptly or not at all
+
+    Half the streams belong to users who see every task. Each event is
+    handed over from a worker thread, as ``on_commit`` callbacks in sync
+    views do, and timed until every interested stream has it. The stalled
+    run shows publishers are not slowed down by clients that stop reading
+    and that their queues stay bounded.
+    """
+    return asyncio.run(event_fan_out(repeat * 10))
+
+
+async def event_fan_out(events, streams=1000):
+    loop = asyncio.get_running_loop()
+    
+    def make_event(number):
+        state = {
+            'created_by_id': random.randrange(streams), 'assigned_to_id': random.randrange(streams),
+            'status': 'pending', 'priority': 'high', 'due_date': None, 'tags': '',
+        }
+        return task_event(number, None, state)
+    
+    results = {}
+    broker = EventBroker()
+    subscriptions = [broker.subscribe(number, sees_all=number % 2 == 0) for number in range(streams)]
+    progress = {'received': 0, 'expected': 0}
+    done = asyncio.Event()
+    
+    async def read(subscription):
+        while True:
+            events = await subscription.get()
+            progress['received'] += len(events)
+            if progress['received'] >= progress['expected']:
+                done.set()
+    
+    readers = [asyncio.create_task(read(subscription)) for subscription in subscriptions]
+    timings = []
+    for number in range(events):
+        event = make_event(number)
+        progress.update(received=0, expected=sum(subscription.wants(event) for subscription in subscriptions))
+        done.clear()
+        start = time.perf_counter()
+        await loop.run_in_executor(None, broker.deliver, [event])
+        await done.wait()
+        timings.append((time.perf_counter() - start) * 1000)
+    for reader in readers:
+        reader.cancel()
+    await asyncio.gather(*readers, return_exceptions=True)
+    results[f'{streams} streams, reading'] = summarize(timings)
+    results[f'{streams} streams, reading']['deliveries_per_s'] = (
+        progress['expected'] / (statistics.median(timings) / 1000)
+    )
+    
+    broker = EventBroker()
+    subscriptions = [broker.subscribe(number, sees_all=number % 2 == 0) for number in range(streams)]
+    timings = []
+    for number in range(events):
+        start = time.perf_counter()
+        await loop.run_in_executor(None, broker.deliver, [make_event(number)])
+        timings.append((time.perf_counter() - start) * 1000)
+        # Let the loop run the fan-out, as it would between requests
+        await asyncio.sleep(0)
+    results[f'{streams} streams, stalled'] = summarize(timings)
+    results[f'{streams} streams, stalled'].update(
+        max_queued=max(len(subscription.pending) for subscription in subscriptions),
+        resynced=sum(subscription.dropped > 0 for subscription in subscriptions) / streams,
+    )
+    return results
+
+
+@benchmark('db_connections')
+def db_connections(user, repeat):
+    """Requests opening a new connection versus persistent and pooled connections
+
+    Each simulated request does the connection housekeeping Django does
+    when a request starts and finishes, around two small queries. Every
+    strategy gets its own alias configured like the default database. The
+    pool needs PostgreSQL and psycopg 3; run this against the production
+    engine (``DATABASE_URL`` with ``DJANGO_DEBUG=false``) for numbers that
+    include the TLS handshake.
+    """
+    base = {**connection.settings_dict, 'OPTIONS': dict(connection.settings_dict['OPTIONS'])}
+    base['OPTIONS'].pop('pool', None)
+    strategies = {
+        'new connection': {'CONN_MAX_AGE': 0, 'CONN_HEALTH_CHECKS': False},
+        'persistent': {'CONN_MAX_AGE': 600, 'CONN_HEALTH_CHECKS': False},
+        'persistent + health check': {'CONN_MAX_AGE': 600, 'CONN_HEALTH_CHECKS': True},
+    }
+    if connection.vendor == 'postgresql':
+        from django.db.backends.postgresql.psycopg_any import is_psycopg3
+        if is_psycopg3:
+            strategies['pool'] = {
+                'CONN_MAX_AGE': 0,
+                'OPTIONS': {**base['OPTIONS'], 'pool': {'min_size': 2, 'max_size': 4}},
+            }
+    task_id = Task.objects.values_list('pk', flat=True).first()
+    
+    results = {}
+    for label, overrides in strategies.items():
+        alias = f'benchmark_{label.replace(" ", "_").replace("+", "")}'
+        connections.settings[alias] = {**base, **overrides}
+        db = connections[alias]
+        
+        def run():
+            db.close_if_unusable_or_obsolete()
+            Task.objects.using(alias).filter(pk=task_id).first()
+            Task.objects.using(alias).filter(created_by=user).count()
+            db.close_if_unusable_or_obsolete()
+        
+        try:
+            stats = QueryStats()
+            with db.execute_wrapper(stats):
+                run()
+            timings = []
+            for _ in range(repeat * 10):
+                start = time.perf_counter()
+                run()
+                timings.append((time.perf_counter() - start) * 1000)
+            results[label] = summarize(timings, stats.count)
+        finally:
+            db.close()
+            if 'pool' in overrides.get('OPTIONS', {}):
+                db.close_pool()
+            del connections[alias]
+            del connections.settings[alias]
+    return results
+
+
+@benchmark('admin_changelist')
+def admin_changelist(user, repeat):
+    """Task admin changelist with the default filters and counts versus the scalable ones
+
+    The default setup lists every user in the assignee filter and edit
+    boxes and counts the filtered and the full result exactly. ``user`` is
+    made a superuser in a transaction that is rolled back. Run against
+    PostgreSQL with a large table (``seed_tasks --tasks 1000000``, then
+    ``ANALYZE``) for the estimated counts.
+    """
+    from django.contrib import admin
+    from django.db import transaction
+    
+    from .pagination import EstimatedCountPaginator
+    
+    task_admin = admin.site._registry[Task]
+    default = {
+        'list_filter': ['status', 'priority', 'created_at', 'due_date', 'assigned_to'],
+        'autocomplete_fields': [],
+        'paginator': Paginator,
+        'show_full_result_count': True,
+    }
+    scalable = {name: getattr(task_admin, name) for name in default}
+    assignee = Task.objects.exclude(assigned_to=None).values_list('assigned_to', flat=True).first()
+    url = reverse('admin:core_task_changelist')
+    views = {
+        'unfiltered': '',
+        'status': '?status__exact=pending',
+        'assignee': f'?assigned_to__id__exact={assignee}',
+        'search': '?q=report',
+    }
+    
+    results = {}
+    with transaction.atomic():
+        user.is_staff = user.is_superuser = True
+        user.save()
+        client = Client(HTTP_HOST='localhost')
+        client.force_login(user)
+        try:
+            for label, config in (('default', default), ('scalable', scalable)):
+                for name, value in config.items():
+                    setattr(task_admin, name, value)
+                for view, query in views.items():
+                    results[f'{label} {view}'] = measure(lambda: client.get(url + query), repeat)
+                    results[f'{label} {view}']['bytes'] = len(client.get(url + query).content)
+        finally:
+            for name, value in scalable.items():
+                setattr(task_admin, name, value)
+            transaction.set_rollback(True)
+    return results
+
+
+@benchmark('bulk_actions')
+def bulk_actions(user, repeat):
+    """Completing and retagging 5000 tasks one save at a time versus chunked set-based UPDATEs
+
+    Everything runs in a transaction that is rolled back.
+    """
+    from django.db import transaction
+    
+    from .bulk import retag_tasks, update_tasks
+    
+    rows = 5000
+    ids = list(Task.objects.exclude(status='completed').order_by('pk').values_list('pk', flat=True)[:rows])
+    tasks = Task.objects.filter(pk__in=ids)
+    
+    def rolled_back(func):
+        def run():
+            with transaction.atomic():
+                func()
+                transaction.set_rollback(True)
+        return run
+    
+    def per_row():
+        for task in tasks:
+            task.status = 'completed'
+            task.completed_at = timezone.now()
+            task.save()
+    
+    def per_row_tags():
+        for task in tasks:
+            task.tags = ', '.join([task.tags, 'triage']) if task.tags else 'triage'
+            task.save()
+    
+    results = {
+        'save per task': measure(rolled_back(per_row), repeat),
+        'update_tasks': measure(rolled_back(lambda: update_tasks(tasks, {'status': 'completed'})), repeat),
+        'tag, save per task': measure(rolled_back(per_row_tags), repeat),
+        'retag_tasks': measure(rolled_back(lambda: retag_tasks(tasks, add=['triage'])), repeat),
+    }
+    for result in results.values():
+        result['tasks_per_s'] = len(ids) / (result['p50_ms'] / 1000)
+    return results
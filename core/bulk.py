@@ -0,0 +1,164 @@
+"""Set-based task writes that keep derived data in sync
+
+``bulk_create``, ``bulk_update`` and raw deletes skip the per-row Task
+signals, so each helper here sends one ``tasks_changed`` signal with every
+row's before and after state instead.
+"""
+from django.db import models, transaction
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Task
+from .signals import tasks_changed
+from .tags import TaskTag, normalize_tag, parse_tags
+
+
+def tracked_state(task):
+    return {field: getattr(task, field) for field in Task.TRACKED_FIELDS}
+
+
+def bulk_create_tasks(tasks, batch_size=500):
+    """Insert tasks in batches and return them with primary keys set"""
+    with transaction.atomic():
+        tasks = Task.objects.bulk_create(tasks, batch_size=batch_size)
+        tasks_changed.send(sender=Task, changes=[(task.pk, None, tracked_state(task)) for task in tasks])
+    return tasks
+
+
+def bulk_update_tasks(tasks, fields, batch_size=500):
+    """Write ``fields`` of already loaded tasks with batched UPDATEs
+
+    Tasks must come from the database (so their loaded state is known).
+    ``updated_at`` is always written, and ``completed_at`` follows the
+    edit view's rule: set when a task becomes completed without one.
+    """
+    now = timezone.now()
+    fields = set(fields) | {'updated_at'}
+    for task in tasks:
+        task.updated_at = now
+        if task.status == 'completed' and not task.completed_at:
+            task.completed_at = now
+            fields.add('completed_at')
+    with transaction.atomic():
+        Task.objects.bulk_update(tasks, sorted(fields), batch_size=batch_size)
+        changes = [(task.pk, task._loaded_state, tracked_state(task)) for task in tasks]
+        tasks_changed.send(sender=Task, changes=changes)
+    for task in tasks:
+        task._loaded_state = tracked_state(task)
+    return tasks
+
+
+def bulk_delete_tasks(queryset):
+    """Delete the tasks in ``queryset`` with two DELETE statements; returns the count"""
+    with transaction.atomic():
+        # Locked so no update can commit between reading the states the
+        # receivers get and the delete
+        rows = Task.objects.filter(pk__in=queryset.values('pk')).select_for_update().values('id', *Task.TRACKED_FIELDS)
+        states = {row.pop('id'): row for row in rows}
+        if not states:
+            return 0
+        ids = list(states)
+        TaskTag.objects.filter(task_id__in=ids).delete()
+        # Not QuerySet.delete(): with post_delete receivers connected it loads
+        # every task and sends one signal per row, which the receivers would
+        # apply on top of tasks_changed below. _raw_delete is a single DELETE;
+        # tag links, the only rows referencing tasks, are removed above
+        deleted = Task.objects.filter(pk__in=ids)._raw_delete(queryset.db)
+        tasks_changed.send(sender=Task, changes=[(pk, state, None) for pk, state in states.items()])
+    return deleted
+
+
+def task_id_chunks(queryset, chunk_size):
+    """Ids of the tasks in ``queryset`` in ascending lists of at most ``chunk_size``
+
+    Each chunk is read when needed, keyed on the last id, so rows changed by
+    earlier chunks (and no longer matching a filter) are not skipped over.
+    """
+    queryset = queryset.order_by('pk')
+    last = None
+    while True:
+        page = queryset if last is None else queryset.filter(pk__gt=last)
+        ids = list(page.values_list('pk', flat=True)[:chunk_size])
+        if not ids:
+            return
+        yield ids
+        last = ids[-1]
+
+
+def change_tasks(queryset, change, chunk_size=1000, progress=None):
+    """Run ``change(states, now)`` over ``queryset`` chunk by chunk
+
+    ``states`` maps the ids of a chunk to their tracked state, read with the
+    rows locked. ``change`` writes the rows it alters and returns their new
+    states. Each chunk is its own transaction with one ``tasks_changed``
+    signal, so a huge selection never holds long locks; ``progress(done)``
+    is called after every chunk. Returns the number of tasks changed.
+    """
+    changed = done = 0
+    for ids in task_id_chunks(queryset, chunk_size):
+        with transaction.atomic():
+            rows = Task.objects.filter(pk__in=ids).select_for_update().values('id', *Task.TRACKED_FIELDS)
+            states = {row.pop('id'): row for row in rows}
+            new_states = change(states, timezone.now())
+            if new_states:
+                tasks_changed.send(sender=Task, changes=[(pk, states[pk], state) for pk, state in new_states.items()])
+        changed += len(new_states)
+        done += len(ids)
+        if progress is not None:
+            progress(done)
+    return changed
+
+
+def update_tasks(queryset, values, chunk_size=1000, progress=None):
+    """Set the same field ``values`` on every task in ``queryset``
+
+    Each chunk is one ``UPDATE ... WHERE id IN`` over the tasks that differ
+    from ``values``. ``completed_at`` follows the edit view's rule: set when
+    a task becomes completed without one.
+    """
+    tracked = {}
+    for name, value in values.items():
+        tracked[Task._meta.get_field(name).attname] = getattr(value, 'pk', value)
+    
+    def change(states, now):
+        ids = [pk for pk, state in states.items() if any(state[field] != value for field, value in tracked.items())]
+        if not ids:
+            return {}
+        extra = {}
+        if values.get('status') == 'completed':
+            extra['completed_at'] = Coalesce('completed_at', models.Value(now, output_field=models.DateTimeField()))
+        Task.objects.filter(pk__in=ids).update(**values, **extra, updated_at=now)
+        return {pk: {**states[pk], **tracked} for pk in ids}
+    
+    return change_tasks(queryset, change, chunk_size, progress)
+
+
+def retag_tasks(queryset, add=(), remove=(), chunk_size=1000, progress=None):
+    """Add and remove tags on every task in ``queryset``
+
+    Tasks whose tags change are grouped by their new tag text, with one
+    ``UPDATE ... WHERE id IN`` per distinct text; a few shared tag sets
+    cover most tasks, and building a per-row ``CASE`` (``bulk_update``)
+    costs far more. Tasks whose tags would no longer fit the column are
+    left alone.
+    """
+    removed = {normalize_tag(tag) for tag in remove}
+    max_length = Task._meta.get_field('tags').max_length
+    
+    def retag(text):
+        tags = [tag for tag in parse_tags(text) if normalize_tag(tag) not in removed]
+        return ', '.join(parse_tags(', '.join(tags + list(add))))
+    
+    def change(states, now):
+        groups = {}
+        for pk, state in states.items():
+            tags = retag(state['tags'])
+            if tags != state['tags'] and len(tags) <= max_length:
+                groups.setdefault(tags, []).append(pk)
+        new_states = {}
+        for tags, ids in groups.items():
+            Task.objects.filter(pk__in=ids).update(tags=tags, updated_at=now)
+            new_states.update((pk, {**states[pk], 'tags': tags}) for pk in ids)
+        return new_states
+    
+    return change_tasks(queryset, change, chunk_size, progress)
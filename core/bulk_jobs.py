@@ -0,0 +1,61 @@
+"""Background runs of large admin bulk actions
+
+A job runs a ``core.bulk`` helper in a thread of the worker that started
+it and keeps its progress in ``CACHES['default']``, where the admin's
+progress page reads it (from any worker, with a shared cache). Chunks
+commit one by one, so a job cut short by a restart leaves every task
+either fully changed or untouched; running the action again finishes it.
+"""
+import logging
+import threading
+import uuid
+
+from django.core.cache import cache
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+JOB_KEY = 'core:bulk_job:{}'
+# Seconds a job's progress stays readable after its last update
+JOB_TIMEOUT = 24 * 60 * 60
+
+
+def job_progress(job_id):
+    """``{'description', 'state', 'total', 'done', 'changed'}`` for a job, or None once expired"""
+    return cache.get(JOB_KEY.format(job_id))
+
+
+def save_progress(job_id, progress):
+    cache.set(JOB_KEY.format(job_id), progress, JOB_TIMEOUT)
+
+
+def start_job(description, queryset, run):
+    """Start ``run(queryset, progress=...)`` in a background thread and return the job id"""
+    job_id = uuid.uuid4().hex
+    progress = {'description': description, 'state': 'running', 'total': None, 'done': 0, 'changed': 0}
+    save_progress(job_id, progress)
+    thread = threading.Thread(
+        target=run_job, args=(job_id, progress, queryset, run), name=f'bulk-job-{job_id}', daemon=True,
+    )
+    thread.start()
+    return job_id
+
+
+def run_job(job_id, progress, queryset, run):
+    try:
+        progress['total'] = queryset.count()
+        save_progress(job_id, progress)
+
+        def report(done):
+            progress['done'] = done
+            save_progress(job_id, progress)
+
+        progress['changed'] = run(queryset, progress=report)
+        progress['state'] = 'done'
+    except Exception:
+        logger.exception('Bulk job %s (%s) failed', job_id, progress['description'])
+        progress['state'] = 'failed'
+    finally:
+        save_progress(job_id, progress)
+        # Connections are per thread; this one's would otherwise stay open
+        connections.close_all()
@@ -0,0 +1,62 @@
+"""Invalidation bus carried by the shared cache
+
+Process-local caches (such as the tag index) publish their changes as
+numbered messages in ``CACHES['default']``. Other workers compare their
+position with the bus head and replay the messages they missed, or
+resync from the database when the gap is too large or messages have
+expired. With a shared backend (Redis or memcached) this keeps every
+worker coherent; with ``LocMemCache`` each process simply has its own
+bus.
+
+Positions come from ``cache.incr``, which must be atomic. The file
+cache implements it as a read followed by a write, so two processes can
+claim the same position and overwrite each other's message: it is only
+safe with one process.
+"""
+import time
+
+from django.core.cache import cache
+
+
+class CacheBus:
+    def __init__(self, name, timeout=60 * 60, max_replay=500):
+        self.head_key = f'core:bus:{name}'
+        self.message_key = f'core:bus:{name}:{{}}'
+        self.timeout = timeout
+        self.max_replay = max_replay
+
+    def head(self):
+        """Position of the latest message"""
+        head = cache.get(self.head_key)
+        if head is None:
+            # Start from the clock so a re-created head never reuses the
+            # positions of messages left over from before it was evicted
+            cache.add(self.head_key, time.time_ns() // 1000, timeout=None)
+            head = cache.get(self.head_key)
+        return head
+
+    def publish(self, message):
+        """Append a message and return its position, or None if the head was evicted"""
+        try:
+            position = cache.incr(self.head_key)
+        except ValueError:
+            return None
+        cache.set(self.message_key.format(position), message, self.timeout)
+        return position
+
+    def invalidate(self):
+        """Advance the head without a message, so every reader resyncs"""
+        try:
+            cache.incr(self.head_key)
+        except ValueError:
+            pass
+
+    def messages_between(self, start, end):
+        """Messages after position ``start`` up to ``end``, or None if any are gone"""
+        if not start < end <= start + self.max_replay:
+            return None
+        keys = [self.message_key.format(position) for position in range(start + 1, end + 1)]
+        messages = cache.get_many(keys)
+        if len(messages) != len(keys):
+            return None
+        return [messages[key] for key in keys]
@@ -0,0 +1,145 @@
+"""Conditional GET for task pages and API responses
+
+ETags are built from one aggregate query over the tasks a response shows
+(latest ``updated_at`` plus the row count, which also catches deletes)
+and from everything else the output depends on: the user, their role,
+the query string and the release. ``timesince`` and overdue badges drift
+with the clock, so the tag also rolls over every ``fragment_timeout()``
+seconds, the same staleness the fragment cache already allows.
+"""
+import hashlib
+import time
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from task_manager.cache import cache_key_prefix
+from .filters import listed_tasks
+from .fragments import fragment_timeout
+from .models import Task
+
+
+def tasks_validator(tasks):
+    """``(latest updated_at, count)`` of a task queryset in one aggregate query"""
+    result = tasks.order_by().aggregate(last_modified=Max('updated_at'), count=Count('pk'))
+    return result['last_modified'], result['count']
+
+
+def make_etag(request, *parts):
+    user = request.user
+    profile = getattr(user, 'profile', None)
+    key = repr([
+        user.pk,
+        user.is_superuser,
+        profile.role if profile is not None else None,
+        sorted(request.GET.lists()),
+        request.headers.get('Accept', ''),
+        # A new CSRF secret (e.g. after logging in again) invalidates the
+        # tokens embedded in previously served forms
+        request.COOKIES.get(settings.CSRF_COOKIE_NAME, ''),
+        cache_key_prefix(),
+        int(time.time() // max(fragment_timeout(), 1)),
+        *parts,
+    ])
+    return f'W/"{hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()}"'
+
+
+def not_modified(request, etag, last_modified=None):
+    """A 304 response if the client's copy is current, else None"""
+    # HTTP dates have whole seconds
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        set_validators(response, etag)
+    return response
+
+
+def set_validators(response, etag, last_modified=None):
+    response.headers.setdefault('ETag', etag)
+    if last_modified:
+        response.headers.setdefault('Last-Modified', http_date(last_modified.timestamp()))
+    # Let browsers keep the page but revalidate it on every load
+    patch_cache_control(response, private=True, no_cache=True)
+
+
+def conditional_page(validators):
+    """Answer GET requests with 304 when the page would render the same
+
+    ``validators(request, *args, **kwargs)`` returns ``(etag parts,
+    last_modified)``, or None to render unconditionally. Pages with
+    pending messages are always rendered so the messages are shown.
+    Works on sync and async views; validators always run synchronously.
+    """
+    def decorator(view):
+        if iscoroutinefunction(view):
+            @wraps(view)
+            async def async_wrapper(request, *args, **kwargs):
+                # Loaded once here; the sync validators and the view reuse it
+                request.user = await request.auser()
+                etag, last_modified, response = await sync_to_async(check_conditions)(
+                    request, validators, args, kwargs
+                )
+                if response is None:
+                    response = await view(request, *args, **kwargs)
+                    finish_response(response, etag, last_modified)
+                return response
+            return async_wrapper
+        
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            etag, last_modified, response = check_conditions(request, validators, args, kwargs)
+            if response is None:
+                response = view(request, *args, **kwargs)
+                finish_response(response, etag, last_modified)
+            return response
+        return wrapper
+    return decorator
+
+
+def check_conditions(request, validators, args, kwargs):
+    """``(etag, last_modified, 304 response or None)``; no etag when the page must render"""
+    if (
+        request.method not in ('GET', 'HEAD')
+        or not request.user.is_authenticated
+        or len(get_messages(request))
+    ):
+        return None, None, None
+    result = validators(request, *args, **kwargs)
+    if result is None:
+        return None, None, None
+    parts, last_modified = result
+    etag = make_etag(request, *parts)
+    return etag, last_modified, not_modified(request, etag, last_modified)
+
+
+def finish_response(response, etag, last_modified):
+    if etag is not None and response.status_code == 200:
+        set_validators(response, etag, last_modified)
+
+
+# Validators for the HTML views. List pages aggregate over every task the
+# user can see (filters are part of the query string in the tag), which
+# also covers side panels such as the popular tags.
+
+def dashboard_validators(request):
+    return ('dashboard', *tasks_validator(Task.objects.visible_to(request.user))), None
+
+
+def task_list_validators(request):
+    if not hasattr(request.user, 'profile'):
+        # The view creates the missing profile; render this once without a tag
+        return None
+    return ('task_list', *tasks_validator(listed_tasks(request.user))), None
+
+
+def task_detail_validators(request, task_id):
+    row = Task.objects.filter(pk=task_id).values_list('updated_at', 'created_by_id', 'assigned_to_id').first()
+    if row is None or not (request.user.is_superuser or request.user.pk in row[1:]):
+        # Let the view answer with its 404 or permission redirect
+        return None
+    return ('task_detail', task_id, row[0]), row[0]
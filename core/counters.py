@@ -0,0 +1,259 @@
+from django.db import models, transaction, IntegrityError
+from django.contrib.auth.models import User
+from django.db.models import Count, F, Q
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .signals import tasks_changed
+
+STATUS_COUNTERS = {
+    'pending': 'pending_tasks',
+    'in_progress': 'in_progress_tasks',
+    'completed': 'completed_tasks',
+    'cancelled': 'cancelled_tasks',
+}
+
+PRIORITY_COUNTERS = {
+    'low': 'low_priority_tasks',
+    'medium': 'medium_priority_tasks',
+    'high': 'high_priority_tasks',
+    'urgent': 'urgent_priority_tasks',
+}
+
+COUNTER_FIELDS = (
+    ['total_tasks']
+    + list(STATUS_COUNTERS.values())
+    + list(PRIORITY_COUNTERS.values())
+    + ['open_due_tasks']
+)
+
+
+class UserTaskCounter(models.Model):
+    """Materialized task counters for every task a user created or is assigned to
+
+    Rows are created lazily on first read and kept current by the Task
+    signal handlers below. Queryset ``update()`` and ``bulk_*`` calls bypass
+    those handlers; run ``manage.py rebuild_task_counters`` after them.
+    """
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='task_counter')
+
+    total_tasks = models.IntegerField(default=0)
+
+    # By status
+    pending_tasks = models.IntegerField(default=0)
+    in_progress_tasks = models.IntegerField(default=0)
+    completed_tasks = models.IntegerField(default=0)
+    cancelled_tasks = models.IntegerField(default=0)
+
+    # By priority
+    low_priority_tasks = models.IntegerField(default=0)
+    medium_priority_tasks = models.IntegerField(default=0)
+    high_priority_tasks = models.IntegerField(default=0)
+    urgent_priority_tasks = models.IntegerField(default=0)
+
+    # Open tasks with a due date, i.e. the ones that can become overdue
+    open_due_tasks = models.IntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "User Task Counter"
+        verbose_name_plural = "User Task Counters"
+
+    def __str__(self):
+        return f"Task counters for {self.user}"
+
+    @classmethod
+    def for_user(cls, user):
+        """Return the counter row for a user, building it on first access
+
+        The row is inserted zeroed before anything is counted, so task
+        changes from then on find it and apply their deltas. The counts are
+        written under a row lock: a change either committed before they
+        were taken, and is in them, or waits for the lock and is applied on
+        top.
+        """
+        try:
+            return cls.objects.get(user=user)
+        except cls.DoesNotExist:
+            pass
+        try:
+            with transaction.atomic():
+                cls.objects.create(user=user)
+        except IntegrityError:
+            # Another request built the row first
+            return cls.objects.get(user=user)
+        with transaction.atomic():
+            counter = cls.objects.select_for_update().get(user=user)
+            for field, value in compute_counters([user.pk]).get(user.pk, {}).items():
+                setattr(counter, field, value)
+            counter.save()
+        return counter
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in COUNTER_FIELDS}
+
+
+def task_contribution(state):
+    """Counter increments a task in ``state`` adds for each of its users"""
+    from .models import Task
+
+    if state is None:
+        return {}
+    contribution = {
+        'total_tasks': 1,
+        STATUS_COUNTERS[state['status']]: 1,
+        PRIORITY_COUNTERS[state['priority']]: 1,
+    }
+    if state['status'] in Task.OPEN_STATUSES and state['due_date'] is not None:
+        contribution['open_due_tasks'] = 1
+    return contribution
+
+
+def task_users(state):
+    if state is None:
+        return set()
+    return {state['created_by_id'], state['assigned_to_id']} - {None}
+
+
+def task_change_deltas(old_state, new_state):
+    """Per-user counter deltas for a task moving from ``old_state`` to ``new_state``"""
+    old_users, new_users = task_users(old_state), task_users(new_state)
+    old_contribution, new_contribution = task_contribution(old_state), task_contribution(new_state)
+
+    deltas = {}
+    for user_id in old_users | new_users:
+        delta = {}
+        if user_id in new_users:
+            for field, value in new_contribution.items():
+                delta[field] = delta.get(field, 0) + value
+        if user_id in old_users:
+            for field, value in old_contribution.items():
+                delta[field] = delta.get(field, 0) - value
+        deltas[user_id] = delta
+    return deltas
+
+
+def apply_counter_deltas(deltas):
+    # Users with the same delta share an UPDATE: a bulk change touching
+    # thousands of users mostly produces a handful of distinct deltas
+    users_by_delta = {}
+    for user_id, delta in deltas.items():
+        delta = tuple(sorted((field, value) for field, value in delta.items() if value))
+        if delta:
+            users_by_delta.setdefault(delta, []).append(user_id)
+    for delta, user_ids in users_by_delta.items():
+        # Missing rows are skipped; they are built from scratch on first read
+        UserTaskCounter.objects.filter(user_id__in=user_ids).update(
+            **{field: F(field) + value for field, value in delta}
+        )
+
+
+def apply_task_change(old_state, new_state):
+    """Apply the counter deltas for a task moving from ``old_state`` to ``new_state``"""
+    apply_counter_deltas(task_change_deltas(old_state, new_state))
+
+
+def apply_task_changes(changes):
+    """Apply many ``(old_state, new_state)`` changes with one UPDATE per distinct user delta"""
+    totals = {}
+    for old_state, new_state in changes:
+        for user_id, delta in task_change_deltas(old_state, new_state).items():
+            user_totals = totals.setdefault(user_id, {})
+            for field, value in delta.items():
+                user_totals[field] = user_totals.get(field, 0) + value
+    apply_counter_deltas(totals)
+
+
+def counter_aggregates():
+    from .models import Task
+
+    aggregates = {'total_tasks': Count('pk')}
+    for status, field in STATUS_COUNTERS.items():
+        aggregates[field] = Count('pk', filter=Q(status=status))
+    for priority, field in PRIORITY_COUNTERS.items():
+        aggregates[field] = Count('pk', filter=Q(priority=priority))
+    aggregates['open_due_tasks'] = Count('pk', filter=Q(status__in=Task.OPEN_STATUSES, due_date__isnull=False))
+    return aggregates
+
+
+def compute_counters(user_ids=None):
+    """Compute counters from the task table with two grouped queries
+
+    Returns a dict of ``{user_id: {field: value}}``. Users without tasks are
+    omitted.
+    """
+    from .models import Task
+
+    created = Task.objects.order_by()
+    assigned = Task.objects.order_by().filter(assigned_to__isnull=False).exclude(assigned_to=F('created_by'))
+    if user_ids is not None:
+        created = created.filter(created_by__in=user_ids)
+        assigned = assigned.filter(assigned_to__in=user_ids)
+
+    counters = {}
+    for queryset, user_field in ((created, 'created_by'), (assigned, 'assigned_to')):
+        for row in queryset.values(user_field).annotate(**counter_aggregates()):
+            totals = counters.setdefault(row[user_field], dict.fromkeys(COUNTER_FIELDS, 0))
+            for field in COUNTER_FIELDS:
+                totals[field] += row[field]
+    return counters
+
+
+def rebuild_counters(user_ids=None, batch_size=1000):
+    """Replace stored counters with freshly computed values"""
+    computed = compute_counters(user_ids)
+    with transaction.atomic():
+        if user_ids is None:
+            user_ids = list(User.objects.values_list('pk', flat=True))
+            UserTaskCounter.objects.all().delete()
+        else:
+            UserTaskCounter.objects.filter(user_id__in=user_ids).delete()
+        UserTaskCounter.objects.bulk_create(
+            [UserTaskCounter(user_id=user_id, **computed.get(user_id, {})) for user_id in user_ids],
+            batch_size=batch_size,
+        )
+    return len(user_ids)
+
+
+def find_counter_drift():
+    """Compare stored counters with the task table
+
+    Returns ``{user_id: {field: (stored, expected)}}`` for every row that
+    disagrees. Users without a stored row are ignored since they are built
+    on demand.
+    """
+    stored = {counter.user_id: counter.as_dict() for counter in UserTaskCounter.objects.all()}
+    computed = compute_counters()
+    drift = {}
+    for user_id, values in stored.items():
+        expected = computed.get(user_id, dict.fromkeys(COUNTER_FIELDS, 0))
+        mismatched = {
+            field: (values[field], expected[field])
+            for field in COUNTER_FIELDS if values[field] != expected[field]
+        }
+        if mismatched:
+            drift[user_id] = mismatched
+    return drift
+
+
+# Signals keeping counters in sync with Task saves, deletes and bulk writes
+@receiver(post_save, sender='core.Task')
+def update_counters_on_save(sender, instance, **kwargs):
+    new_state = instance.get_tracked_state()
+    if new_state is None:
+        new_state = sender.objects.filter(pk=instance.pk).values(*sender.TRACKED_FIELDS).first()
+    old_state = getattr(instance, '_previous_state', None)
+    if new_state != old_state:
+        apply_task_change(old_state, new_state)
+
+
+@receiver(post_delete, sender='core.Task')
+def update_counters_on_delete(sender, instance, **kwargs):
+    state = getattr(instance, '_loaded_state', None) or instance.get_tracked_state()
+    apply_task_change(state, None)
+
+
+@receiver(tasks_changed)
+def update_counters_on_bulk_change(sender, changes, **kwargs):
+    apply_task_changes([(old_state, new_state) for _, old_state, new_state in changes])
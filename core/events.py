@@ -0,0 +1,249 @@
+"""Live task events for the Server-Sent Events stream
+
+Task saves and deletes, including the set-based writes that send
+``tasks_changed``, publish one small event per task once the transaction
+commits. Each worker process keeps an ``EventBroker`` with the open
+streams of its event loops. Events go to the creator, the assignee (old
+and new) and users who can see every task.
+
+With ``TASK_EVENTS_BUS = 'local'`` events only reach streams in the
+process that made the change. ``'cache'`` relays them through a
+``CacheBus`` that each process polls once per event loop, so with a
+shared cache every worker sees every change.
+
+A stream that falls behind by ``TASK_EVENTS_MAX_PENDING`` events has its
+queue replaced by a single ``resync`` event, which tells the client to
+reload. A slow client therefore costs bounded memory and never stalls
+publishers.
+"""
+import asyncio
+import json
+import threading
+from collections import deque
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache_bus import CacheBus
+from .counters import task_users
+from .signals import tasks_changed
+
+RESYNC = {'type': 'resync'}
+
+# Milliseconds a browser waits before reconnecting a dropped stream
+RETRY_MS = 5000
+
+
+def event_setting(name, default):
+    return getattr(settings, f'TASK_EVENTS_{name}', default)
+
+
+def task_event(task_id, old_state, new_state):
+    """Event for a task moving from ``old_state`` to ``new_state`` (tracked field snapshots)"""
+    if old_state is None:
+        kind = 'created'
+    elif new_state is None:
+        kind = 'deleted'
+    elif new_state['status'] == 'completed' and old_state['status'] != 'completed':
+        kind = 'completed'
+    else:
+        kind = 'updated'
+    state = new_state or old_state
+    return {
+        'type': kind,
+        'task': task_id,
+        'status': state['status'],
+        'priority': state['priority'],
+        # Stripped before sending; a reassigned task is also news to its old assignee
+        'users': sorted(task_users(old_state) | task_users(new_state)),
+    }
+
+
+def format_event(event):
+    """``event`` as an SSE message, without its audience"""
+    data = {key: value for key, value in event.items() if key != 'users'}
+    return f'event: {event["type"]}\ndata: {json.dumps(data)}\n\n'
+
+
+class Subscription:
+    """One open stream: a bounded queue of events owned by an event loop"""
+
+    def __init__(self, loop, user_id, sees_all, max_pending):
+        self.loop = loop
+        self.user_id = user_id
+        self.sees_all = sees_all
+        self.max_pending = max_pending
+        self.pending = deque()
+        self.ready = asyncio.Event()
+        self.dropped = 0
+
+    def wants(self, event):
+        return self.sees_all or self.user_id in event['users']
+
+    def offer(self, event):
+        """Queue ``event``; called on the subscription's loop"""
+        if self.pending and self.pending[0] is RESYNC:
+            # The reload the client is about to do covers this event too
+            self.dropped += 1
+            return
+        if len(self.pending) >= self.max_pending:
+            # The client is not keeping up: drop the backlog and have it reload
+            self.dropped += len(self.pending) + 1
+            self.resync()
+            return
+        self.pending.append(event)
+        self.ready.set()
+
+    def resync(self):
+        self.pending.clear()
+        self.pending.append(RESYNC)
+        self.ready.set()
+
+    async def get(self, timeout=None):
+        """Every queued event, waiting up to ``timeout`` seconds; empty on timeout"""
+        if not self.pending:
+            self.ready.clear()
+            try:
+                await asyncio.wait_for(self.ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        events = list(self.pending)
+        self.pending.clear()
+        return events
+
+
+class EventBroker:
+    """Per-process fan-out of task events to the open streams of every event loop"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # loop -> subscriptions, each set only changed on its own loop
+        self.subscriptions = {}
+        self.pollers = {}
+        self.bus = CacheBus('task_events', timeout=5 * 60)
+
+    def shared(self):
+        return event_setting('BUS', 'local') == 'cache'
+
+    def subscribe(self, user_id, sees_all=False):
+        """Open a subscription on the running loop"""
+        loop = asyncio.get_running_loop()
+        subscription = Subscription(loop, user_id, sees_all, event_setting('MAX_PENDING', 100))
+        with self.lock:
+            self.subscriptions.setdefault(loop, set()).add(subscription)
+            if self.shared() and loop not in self.pollers:
+                self.pollers[loop] = loop.create_task(self.poll(loop))
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            subscriptions = self.subscriptions.get(subscription.loop, set())
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                self.subscriptions.pop(subscription.loop, None)
+                poller = self.pollers.pop(subscription.loop, None)
+                if poller is not None:
+                    poller.cancel()
+
+    def count(self):
+        with self.lock:
+            return sum(len(subscriptions) for subscriptions in self.subscriptions.values())
+
+    def publish(self, events):
+        """Send ``events`` to this process's streams, or to every process through the bus"""
+        if not events:
+            return
+        if self.shared():
+            # The poller delivers our own events too, so nothing is sent twice
+            if self.bus.publish(events) is None:
+                # Head evicted; pollers see a gap on their next read and resync
+                self.bus.head()
+            return
+        self.deliver(events)
+
+    def deliver(self, events):
+        with self.lock:
+            loops = list(self.subscriptions)
+        # One hand-off per loop rather than per subscription; the loop fans out
+        for loop in loops:
+            try:
+                loop.call_soon_threadsafe(self.fan_out, loop, events)
+            except RuntimeError:
+                # Loop closed while we were delivering
+                pass
+
+    def fan_out(self, loop, events):
+        for subscription in list(self.subscriptions.get(loop, ())):
+            for event in events:
+                if subscription.wants(event):
+                    subscription.offer(event)
+
+    def resync_all(self, loop):
+        for subscription in list(self.subscriptions.get(loop, ())):
+            subscription.resync()
+
+    async def poll(self, loop):
+        """Relay bus messages to this loop's streams while it has any"""
+        read = sync_to_async(self.bus.head, thread_sensitive=False)
+        replay = sync_to_async(self.bus.messages_between, thread_sensitive=False)
+        position = await read()
+        while True:
+            await asyncio.sleep(event_setting('POLL_INTERVAL', 1.0))
+            head = await read()
+            if head == position:
+                continue
+            messages = await replay(position, head)
+            position = head
+            if messages is None:
+                # Too far behind or messages expired
+                self.resync_all(loop)
+            else:
+                self.fan_out(loop, [event for message in messages for event in message])
+
+
+broker = EventBroker()
+
+
+async def event_stream(user_id, sees_all=False, resume=False, heartbeat=None):
+    """SSE body for one client; ``resume`` after a reconnect that may have missed events"""
+    heartbeat = heartbeat or event_setting('HEARTBEAT', 15)
+    subscription = broker.subscribe(user_id, sees_all)
+    try:
+        # Setting an id makes browsers send Last-Event-ID when they reconnect
+        yield f'id: 0\nretry: {RETRY_MS}\n\n'
+        if resume:
+            yield format_event(RESYNC)
+        while True:
+            events = await subscription.get(heartbeat)
+            # Comments keep proxies from closing an idle stream and reveal
+            # disconnected clients
+            yield ''.join(map(format_event, events)) if events else ': keepalive\n\n'
+    finally:
+        broker.unsubscribe(subscription)
+
+
+def publish_on_commit(events):
+    transaction.on_commit(lambda: broker.publish(events))
+
+
+@receiver(post_save, sender='core.Task')
+def publish_task_save(sender, instance, **kwargs):
+    new_state = instance.get_tracked_state()
+    if new_state is None:
+        new_state = sender.objects.filter(pk=instance.pk).values(*sender.TRACKED_FIELDS).first()
+    publish_on_commit([task_event(instance.pk, getattr(instance, '_previous_state', None), new_state)])
+
+
+@receiver(post_delete, sender='core.Task')
+def publish_task_delete(sender, instance, **kwargs):
+    state = getattr(instance, '_loaded_state', None) or instance.get_tracked_state()
+    if state is not None:
+        publish_on_commit([task_event(instance.pk, state, None)])
+
+
+@receiver(tasks_changed)
+def publish_bulk_change(sender, changes, **kwargs):
+    publish_on_commit([task_event(task_id, old_state, new_state) for task_id, old_state, new_state in changes])
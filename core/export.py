@@ -0,0 +1,99 @@
+"""Streaming task exports shared by the export view and ``manage.py export_tasks``
+
+Rows are read with ``values_list().iterator()`` and encoded one at a time,
+so memory stays flat however many tasks are exported. Under ASGI,
+``aexport_lines`` hands the same lines to the response a chunk at a time;
+a sync iterator would be read into a list before the first byte is sent.
+"""
+import csv
+import datetime
+import decimal
+import json
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+
+from .filters import filter_tasks
+from .models import Task
+
+# Output column -> ORM lookup, people as usernames
+EXPORT_COLUMNS = {
+    'id': 'id',
+    'title': 'title',
+    'description': 'description',
+    'status': 'status',
+    'priority': 'priority',
+    'tags': 'tags',
+    'due_date': 'due_date',
+    'completed_at': 'completed_at',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+    'estimated_hours': 'estimated_hours',
+    'actual_hours': 'actual_hours',
+    'created_by': 'created_by__username',
+    'assigned_to': 'assigned_to__username',
+}
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'jsonl': ('application/x-ndjson', 'jsonl'),
+}
+
+# Rows fetched from the database per round trip
+EXPORT_CHUNK_SIZE = 2000
+
+
+def export_queryset(user=None, params=None):
+    """Tasks ``user`` may see, filtered like ``task_list``; every task without a user"""
+    tasks = Task.objects.order_by('-created_at')
+    if user is not None and not (user.is_superuser or user.profile.can_view_all_tasks()):
+        tasks = Task.objects.visible_to(user).order_by('-created_at')
+    if params:
+        tasks, _ = filter_tasks(tasks, params, user, with_assignment=user is not None)
+    return tasks
+
+
+def export_value(value):
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    return value
+
+
+class Echo:
+    """File-like object handing back what ``csv.writer`` writes"""
+
+    def write(self, value):
+        return value
+
+
+def export_lines(tasks, export_format='csv', chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield the export of ``tasks`` line by line, starting with the CSV header"""
+    columns = list(EXPORT_COLUMNS)
+    rows = tasks.values_list(*EXPORT_COLUMNS.values()).iterator(chunk_size=chunk_size)
+    if export_format == 'csv':
+        writer = csv.writer(Echo())
+        yield writer.writerow(columns)
+        for row in rows:
+            yield writer.writerow(['' if value is None else export_value(value) for value in row])
+    elif export_format == 'jsonl':
+        for row in rows:
+            yield json.dumps(dict(zip(columns, map(export_value, row)))) + '\n'
+    else:
+        raise ValueError(f"Unknown export format '{export_format}'")
+
+
+async def aexport_lines(tasks, export_format='csv', chunk_size=EXPORT_CHUNK_SIZE):
+    """Async ``export_lines``: each chunk of ``chunk_size`` rows is read and encoded in a worker thread
+
+    Thread-sensitive calls share one thread per request, so the cursor
+    behind ``iterator()`` stays on the connection that opened it.
+    """
+    lines = export_lines(tasks, export_format, chunk_size)
+    next_chunk = sync_to_async(lambda size: ''.join(islice(lines, size)))
+    if export_format == 'csv':
+        # The header on its own, so downloads start before the first query finishes
+        yield await next_chunk(1)
+    while chunk := await next_chunk(chunk_size):
+        yield chunk
@@ -0,0 +1,51 @@
+from .models import Task
+from .search import search_tasks
+from .tags import normalize_tag
+
+
+def listed_tasks(user):
+    """Tasks ``task_list`` starts from: all of them for admins and managers, else the visible ones"""
+    if user.profile.can_view_all_tasks():
+        return Task.objects.all()
+    return Task.objects.visible_to(user)
+
+
+def filter_tasks(tasks, params, user, with_assignment=True):
+    """Apply the task list search and filter query params to a queryset
+
+    Returns the filtered queryset and the active filter values so views can
+    echo them back to the template.
+    """
+    filters = {
+        'search_query': params.get('search', ''),
+        'status_filter': params.get('status', ''),
+        'priority_filter': params.get('priority', ''),
+        'tag_filter': params.get('tag', ''),
+    }
+    if with_assignment:
+        filters['assignment_filter'] = params.get('assignment', '')
+    
+    # Search functionality, most relevant matches first
+    if filters['search_query']:
+        tasks = search_tasks(tasks, filters['search_query'], ranked=True)
+    
+    # Filter by status
+    if filters['status_filter']:
+        tasks = tasks.filter(status=filters['status_filter'])
+    
+    # Filter by priority
+    if filters['priority_filter']:
+        tasks = tasks.filter(priority=filters['priority_filter'])
+    
+    # Filter by exact tag through the normalized tag index
+    if filters['tag_filter']:
+        tasks = tasks.filter(tag_set__name=normalize_tag(filters['tag_filter']))
+    
+    # Filter by assignment
+    assignment_filter = filters.get('assignment_filter')
+    if assignment_filter == 'assigned_to_me':
+        tasks = tasks.filter(assigned_to=user)
+    elif assignment_filter == 'created_by_me':
+        tasks = tasks.filter(created_by=user)
+    
+    return tasks, filters
@@ -5,6 +5,24 @@ from allauth.account.forms import SignupForm, LoginForm
 from .models import Task
 from .profile import UserProfile, ROLE_CHOICES
 
+# Task field rules, shared by TaskForm and the API serializers
+
+def clean_task_title(title):
+    if title and len(title.strip()) < 3:
+        raise forms.ValidationError("Task title must be at least 3 characters long.")
+    return title.strip()
+
+def clean_task_hours(hours, label):
+    if hours is not None and hours < 0:
+        raise forms.ValidationError(f"{label} hours cannot be negative.")
+    return hours
+
+def clean_task_due_date(due_date, created_at):
+    # created_at is only set when editing an existing task
+    if due_date and created_at and due_date < created_at:
+        raise forms.ValidationError("Due date cannot be earlier than task creation date.")
+    return due_date
+
 class TaskForm(forms.ModelForm):
     """Form for creating and editing tasks"""
     
@@ -77,33 +95,19 @@ class TaskForm(forms.ModelForm):
     
     def clean_title(self):
         """Validate task title"""
-        title = self.cleaned_data.get('title')
-        if title and len(title.strip()) < 3:
-            raise forms.ValidationError("Task title must be at least 3 characters long.")
-        return title.strip()
+        return clean_task_title(self.cleaned_data.get('title'))
     
     def clean_estimated_hours(self):
         """Validate estimated hours"""
-        hours = self.cleaned_data.get('estimated_hours')
-        if hours is not None and hours < 0:
-            raise forms.ValidationError("Estimated hours cannot be negative.")
-        return hours
+        return clean_task_hours(self.cleaned_data.get('estimated_hours'), 'Estimated')
     
     def clean_actual_hours(self):
         """Validate actual hours"""
-        hours = self.cleaned_data.get('actual_hours')
-        if hours is not None and hours < 0:
-            raise forms.ValidationError("Actual hours cannot be negative.")
-        return hours
+        return clean_task_hours(self.cleaned_data.get('actual_hours'), 'Actual')
     
     def clean_due_date(self):
         """Validate due date"""
-        due_date = self.cleaned_data.get('due_date')
-        if due_date and self.instance.created_at:
-            # If editing an existing task
-            if due_date < self.instance.created_at:
-                raise forms.ValidationError("Due date cannot be earlier than task creation date.")
-        return due_date
+        return clean_task_due_date(self.cleaned_data.get('due_date'), self.instance.created_at)
 
 class TaskSearchForm(forms.Form):
     """Form for searching and filtering tasks"""
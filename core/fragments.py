@@ -0,0 +1,104 @@
+"""Rendered HTML fragments cached in ``CACHES['default']``
+
+Task cards are keyed by the task's ``updated_at``, so any save produces a
+new key, and by the assignee name they show, which the joined user row
+supplies without another query. Dashboard panels list several tasks and
+are keyed by a per-user version that Task save and delete signals bump
+for the creator and the assignee. Stale entries are never deleted; they
+expire after ``TASK_FRAGMENT_CACHE_TIMEOUT`` seconds, which also bounds
+how old relative times such as "created 5 minutes ago" can get.
+"""
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .counters import task_users
+from .signals import tasks_changed
+
+USER_VERSION_CACHE_KEY = 'core:task_version:{}'
+
+
+class FragmentMetrics:
+    """Per-process cache hit and miss counts for each fragment name"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hits = Counter()
+        self.misses = Counter()
+
+    def record(self, name, hit):
+        with self.lock:
+            (self.hits if hit else self.misses)[name] += 1
+
+    def snapshot(self):
+        """``{name: {'hits', 'misses', 'hit_rate'}}`` for every fragment seen so far"""
+        with self.lock:
+            stats = {}
+            for name in sorted(set(self.hits) | set(self.misses)):
+                hits, misses = self.hits[name], self.misses[name]
+                stats[name] = {'hits': hits, 'misses': misses, 'hit_rate': hits / (hits + misses)}
+            return stats
+
+    def reset(self):
+        with self.lock:
+            self.hits.clear()
+            self.misses.clear()
+
+
+metrics = FragmentMetrics()
+
+
+def fragment_timeout():
+    return getattr(settings, 'TASK_FRAGMENT_CACHE_TIMEOUT', 300)
+
+
+def user_task_version(user_id):
+    """Version of a user's task set, changed whenever one of their tasks is saved or deleted"""
+    key = USER_VERSION_CACHE_KEY.format(user_id)
+    version = cache.get(key)
+    if version is None:
+        # Clock-based so a re-created version never matches an evicted one
+        cache.add(key, time.time_ns() // 1000, timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_user_task_versions(user_ids):
+    for user_id in user_ids:
+        try:
+            cache.incr(USER_VERSION_CACHE_KEY.format(user_id))
+        except ValueError:
+            # Never read, so nothing cached depends on it yet
+            pass
+
+
+def invalidate_after_commit(user_ids):
+    if user_ids:
+        transaction.on_commit(lambda: bump_user_task_versions(user_ids))
+
+
+@receiver(post_save, sender='core.Task')
+def invalidate_fragments_on_save(sender, instance, **kwargs):
+    new_state = instance.get_tracked_state()
+    users = task_users(getattr(instance, '_previous_state', None))
+    users |= task_users(new_state) if new_state else {instance.created_by_id, instance.assigned_to_id} - {None}
+    invalidate_after_commit(users)
+
+
+@receiver(post_delete, sender='core.Task')
+def invalidate_fragments_on_delete(sender, instance, **kwargs):
+    invalidate_after_commit(task_users(getattr(instance, '_loaded_state', None) or instance.get_tracked_state()))
+
+
+@receiver(tasks_changed)
+def invalidate_fragments_on_bulk_change(sender, changes, **kwargs):
+    users = set()
+    for _, old_state, new_state in changes:
+        users |= task_users(old_state) | task_users(new_state)
+    invalidate_after_commit(users)
@@ -0,0 +1,47 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+
+from core.benchmarks import BENCHMARKS
+
+STANDARD_FIELDS = ('queries', 'p50_ms', 'p99_ms', 'max_ms')
+
+
+class Command(BaseCommand):
+    help = 'Measure query count and latency of task query strategies'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('scenarios', nargs='*', help='Scenarios to run (default: all)')
+        parser.add_argument('--user', help='Username to run user-scoped scenarios as (default: busiest creator)')
+        parser.add_argument('--repeat', type=int, default=10, help='Timed runs per strategy')
+    
+    def handle(self, *args, **options):
+        names = options['scenarios'] or sorted(BENCHMARKS)
+        unknown = [name for name in names if name not in BENCHMARKS]
+        if unknown:
+            raise CommandError(f"Unknown scenario(s): {', '.join(unknown)}. Available: {', '.join(sorted(BENCHMARKS))}")
+        
+        user = self.get_user(options['user'])
+        self.stdout.write(f'Running as {user.username}, {options["repeat"]} runs per strategy')
+        
+        for name in names:
+            self.stdout.write(self.style.MIGRATE_HEADING(f'\n{name}'))
+            results = BENCHMARKS[name](user, options['repeat'])
+            for label, result in results.items():
+                # Scenarios may report extra figures, e.g. a cache hit rate
+                extra = ''.join(f' {key}={value:.2f}' for key, value in result.items() if key not in STANDARD_FIELDS)
+                self.stdout.write(
+                    f"  {label:<28} queries={result['queries']:<4} "
+                    f"p50={result['p50_ms']:.2f}ms p99={result['p99_ms']:.2f}ms max={result['max_ms']:.2f}ms{extra}"
+                )
+    
+    def get_user(self, username):
+        if username:
+            try:
+                return User.objects.get(username=username)
+            except User.DoesNotExist:
+                raise CommandError(f'User "{username}" does not exist')
+        user = User.objects.annotate(task_count=Count('created_tasks')).order_by('-task_count').first()
+        if user is None:
+            raise CommandError('No users found; run "manage.py seed_tasks" first')
+        return user
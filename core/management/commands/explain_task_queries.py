@@ -0,0 +1,79 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+from django.http import QueryDict
+from django.utils import timezone
+
+from core.filters import filter_tasks
+from core.models import Task
+
+
+def task_view_querysets(user, params):
+    """Querysets issued by the task views, keyed by a descriptive label"""
+    visible = Task.objects.visible_to(user)
+    cards = visible.for_cards()
+    
+    member_list, _ = filter_tasks(cards.order_by('-created_at'), params, user)
+    manager_list, _ = filter_tasks(Task.objects.for_cards().order_by('-created_at'), params, user)
+    my_list, _ = filter_tasks(
+        Task.objects.filter(assigned_to=user).for_cards().order_by('-created_at'), params, user, with_assignment=False
+    )
+    
+    return {
+        'dashboard.overdue_count': visible.filter(
+            due_date__lt=timezone.now(), status__in=Task.OPEN_STATUSES
+        ).order_by(),
+        'dashboard.recent_tasks': cards.order_by('-created_at')[:5],
+        'dashboard.high_priority_tasks': cards.filter(priority='urgent').order_by('-created_at')[:3],
+        'task_list.member': member_list[:12],
+        'task_list.manager': manager_list[:12],
+        'my_tasks': my_list[:12],
+    }
+
+
+class Command(BaseCommand):
+    help = 'Print the database query plan for each task view queryset'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--user', help='Username to build the querysets for (default: busiest assignee)')
+        parser.add_argument('--search', default='', help='Value for the search filter')
+        parser.add_argument('--status', default='', help='Value for the status filter')
+        parser.add_argument('--priority', default='', help='Value for the priority filter')
+        parser.add_argument('--assignment', default='', help='Value for the assignment filter')
+        parser.add_argument('--only', action='append', help='Only explain these labels (repeatable)')
+        parser.add_argument('--analyze', action='store_true', help='Run EXPLAIN ANALYZE (PostgreSQL only)')
+        parser.add_argument('--sql', action='store_true', help='Also print the SQL of each query')
+    
+    def handle(self, *args, **options):
+        user = self.get_user(options['user'])
+        params = QueryDict(mutable=True)
+        for name in ('search', 'status', 'priority', 'assignment'):
+            if options[name]:
+                params[name] = options[name]
+        
+        explain_options = {}
+        if options['analyze']:
+            if connection.vendor != 'postgresql':
+                raise CommandError('--analyze is only supported on PostgreSQL')
+            explain_options['analyze'] = True
+        
+        self.stdout.write(f'{connection.vendor} plans for {user.username}')
+        for label, queryset in task_view_querysets(user, params).items():
+            if options['only'] and label not in options['only']:
+                continue
+            self.stdout.write(self.style.MIGRATE_HEADING(f'\n{label}'))
+            if options['sql']:
+                self.stdout.write(str(queryset.query))
+            self.stdout.write(queryset.explain(**explain_options))
+    
+    def get_user(self, username):
+        if username:
+            try:
+                return User.objects.get(username=username)
+            except User.DoesNotExist:
+                raise CommandError(f'User "{username}" does not exist')
+        user = User.objects.annotate(task_count=Count('assigned_tasks')).order_by('-task_count').first()
+        if user is None:
+            raise CommandError('No users found')
+        return user
@@ -0,0 +1,48 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from core.export import EXPORT_CHUNK_SIZE, EXPORT_FORMATS, export_lines, export_queryset
+
+
+class Command(BaseCommand):
+    help = 'Stream tasks as CSV or JSON lines, with the task list filters'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', choices=list(EXPORT_FORMATS), default='csv', help='Output format')
+        parser.add_argument('--output', help='File to write (default: standard output)')
+        parser.add_argument('--user', help='Export only the tasks this user can see (default: every task)')
+        parser.add_argument('--search', default='', help='Full-text search, as in the task list')
+        parser.add_argument('--status', default='', help='Only tasks with this status')
+        parser.add_argument('--priority', default='', help='Only tasks with this priority')
+        parser.add_argument('--tag', default='', help='Only tasks with this tag')
+        parser.add_argument(
+            '--assignment', choices=['', 'assigned_to_me', 'created_by_me'], default='',
+            help='Tasks assigned to or created by --user'
+        )
+        parser.add_argument('--chunk-size', type=int, default=EXPORT_CHUNK_SIZE, help='Rows fetched per query round trip')
+
+    def handle(self, *args, **options):
+        user = None
+        if options['user']:
+            try:
+                user = User.objects.get(username=options['user'])
+            except User.DoesNotExist:
+                raise CommandError(f'User "{options["user"]}" does not exist')
+        elif options['assignment']:
+            raise CommandError('--assignment needs --user')
+
+        params = {name: options[name] for name in ('search', 'status', 'priority', 'tag', 'assignment')}
+        tasks = export_queryset(user, params)
+        lines = export_lines(tasks, options['format'], options['chunk_size'])
+
+        if options['output']:
+            # The CSV header is not a task
+            count = -1 if options['format'] == 'csv' else 0
+            with open(options['output'], 'w', newline='', encoding='utf-8') as output:
+                for line in lines:
+                    output.write(line)
+                    count += 1
+            self.stderr.write(f'{count} tasks written to {options["output"]}')
+        else:
+            for line in lines:
+                self.stdout.write(line, ending='')
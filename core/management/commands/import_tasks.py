@@ -0,0 +1,178 @@
+import csv
+import json
+import os
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from core.api.bulk import BulkTaskValidator, error_detail
+from core.bulk import bulk_create_tasks
+from core.models import ImportCheckpoint, Task
+
+# Columns copied to the new task; ``id``, ``created_at`` and ``updated_at``
+# in the input are ignored since the database assigns them
+IMPORT_FIELDS = [
+    'title', 'description', 'status', 'priority', 'tags', 'due_date', 'estimated_hours', 'actual_hours',
+]
+
+# CSV has no null: empty cells in these columns mean "not set"
+NULLABLE_FIELDS = {'due_date', 'estimated_hours', 'actual_hours', 'completed_at', 'assigned_to'}
+
+
+class Command(BaseCommand):
+    help = 'Import tasks from a CSV or JSON lines file in the export_tasks layout'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV or JSON lines file to import')
+        parser.add_argument('--format', choices=['csv', 'jsonl'], help='Input format (default: from the file extension)')
+        parser.add_argument('--batch-size', type=int, default=2000, help='Tasks per INSERT transaction')
+        parser.add_argument('--default-creator', help='Username for records without a known created_by')
+        parser.add_argument('--checkpoint', help='Name of the progress record used to resume (default: the absolute path)')
+        parser.add_argument('--restart', action='store_true', help='Ignore the checkpoint and start from the first record')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if not os.path.exists(path):
+            raise CommandError(f'File "{path}" does not exist')
+        input_format = options['format'] or ('jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'csv')
+        checkpoint = options['checkpoint'] or os.path.abspath(path)
+
+        # Usernames are resolved in memory, with no query per record
+        self.users = dict(User.objects.values_list('username', 'pk'))
+        self.default_creator = None
+        if options['default_creator']:
+            if options['default_creator'] not in self.users:
+                raise CommandError(f'User "{options["default_creator"]}" does not exist')
+            self.default_creator = self.users[options['default_creator']]
+        self.validator = BulkTaskValidator()
+        self.completed_at_field = serializers.DateTimeField(allow_null=True)
+
+        progress = {'records': 0, 'imported': 0, 'skipped': 0}
+        if options['restart']:
+            ImportCheckpoint.objects.filter(name=checkpoint).delete()
+        else:
+            progress = self.read_checkpoint(checkpoint, path) or progress
+            if progress['records']:
+                self.stdout.write(f'Resuming after record {progress["records"]}')
+
+        start = time.perf_counter()
+        resumed_from = progress['records']
+        batch = []
+        for number, record in enumerate(read_records(path, input_format), start=1):
+            if number <= resumed_from:
+                continue
+            batch.append((number, record))
+            if len(batch) == options['batch_size']:
+                self.import_batch(batch, progress, checkpoint, path)
+                batch = []
+                rate = (progress['records'] - resumed_from) / (time.perf_counter() - start)
+                self.stdout.write(
+                    f'{progress["records"]} records read, {progress["imported"]} imported, {rate:.0f} records/s',
+                    ending='\r',
+                )
+        if batch:
+            self.import_batch(batch, progress, checkpoint, path)
+
+        elapsed = time.perf_counter() - start
+        ImportCheckpoint.objects.filter(name=checkpoint).delete()
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {progress["imported"]} tasks, skipped {progress["skipped"]} invalid records '
+            f'in {elapsed:.1f}s ({(progress["records"] - resumed_from) / max(elapsed, 1e-9):.0f} records/s)'
+        ))
+
+    def import_batch(self, batch, progress, checkpoint, path):
+        rows, people, errors = [], [], {}
+        for index, (number, record) in enumerate(batch):
+            row_errors = {}
+            if not isinstance(record, dict):
+                row_errors = {'non_field_errors': [record if isinstance(record, str) else 'Expected an object.']}
+                record = {}
+            row = {field: record[field] for field in IMPORT_FIELDS if field in record}
+            for field in NULLABLE_FIELDS & row.keys():
+                if row[field] == '':
+                    row[field] = None
+            rows.append(row)
+            people.append(self.resolve_people(record, row_errors))
+            if row_errors:
+                errors[index] = row_errors
+
+        cleaned, validation_errors = self.validator.validate(rows)
+        for error in validation_errors:
+            errors.setdefault(error['index'], {}).update(error['errors'])
+
+        tasks = []
+        for index, (data, (people_ids, completed_at)) in enumerate(zip(cleaned, people)):
+            if index in errors:
+                continue
+            if data.get('status') == 'completed' and not completed_at:
+                completed_at = timezone.now()
+            tasks.append(Task(**people_ids, completed_at=completed_at, **data))
+        batch_progress = {
+            'records': batch[-1][0],
+            'imported': progress['imported'] + len(tasks),
+            'skipped': progress['skipped'] + len(errors),
+        }
+        # The checkpoint commits with the tasks, so a resume never repeats
+        # or skips a batch
+        with transaction.atomic():
+            bulk_create_tasks(tasks)
+            ImportCheckpoint.objects.update_or_create(
+                name=checkpoint, defaults={'path': os.path.abspath(path), **batch_progress},
+            )
+        progress.update(batch_progress)
+
+        for index in sorted(errors):
+            self.stderr.write(f'Record {batch[index][0]}: {json.dumps(errors[index])}')
+
+    def resolve_people(self, record, row_errors):
+        """``({'created_by_id', 'assigned_to_id'}, completed_at)`` from the usernames in ``record``"""
+        people = {}
+        creator = record.get('created_by') or ''
+        if creator in self.users:
+            people['created_by_id'] = self.users[creator]
+        elif self.default_creator is not None:
+            people['created_by_id'] = self.default_creator
+        else:
+            row_errors['created_by'] = [f'Unknown user "{creator}".' if creator else 'This field is required.']
+
+        assignee = record.get('assigned_to') or ''
+        if assignee:
+            if assignee in self.users:
+                people['assigned_to_id'] = self.users[assignee]
+            else:
+                row_errors['assigned_to'] = [f'Unknown user "{assignee}".']
+
+        completed_at = record.get('completed_at') or None
+        try:
+            completed_at = self.completed_at_field.run_validation(completed_at)
+        except serializers.ValidationError as error:
+            row_errors['completed_at'] = error_detail(error)
+            completed_at = None
+        return people, completed_at
+
+    def read_checkpoint(self, checkpoint, path):
+        saved = ImportCheckpoint.objects.filter(name=checkpoint).first()
+        if saved is None:
+            return None
+        if saved.path != os.path.abspath(path):
+            raise CommandError(f'Checkpoint "{checkpoint}" belongs to another file; use --restart to ignore it')
+        return saved.progress
+
+
+def read_records(path, input_format):
+    """Yield one dict per record; unparseable JSON lines yield their error message"""
+    with open(path, newline='', encoding='utf-8') as file:
+        if input_format == 'csv':
+            yield from csv.DictReader(file)
+            return
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as error:
+                yield f'Invalid JSON: {error}'
@@ -0,0 +1,94 @@
+import statistics
+import threading
+import time
+from http.client import HTTPConnection
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from django.utils.module_loading import import_string
+
+DEFAULT_PATHS = ['/dashboard/', '/tasks/', '/tasks/my/']
+
+
+class Command(BaseCommand):
+    help = 'Load test a running server (WSGI or ASGI) with concurrent logged-in clients'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://127.0.0.1:8000', help='Base URL of the running server')
+        parser.add_argument('--path', action='append', dest='paths', help=f'Path to request, repeatable (default: {" ".join(DEFAULT_PATHS)})')
+        parser.add_argument('--concurrency', type=int, default=16, help='Simultaneous clients')
+        parser.add_argument('--duration', type=float, default=15, help='Seconds to run')
+        parser.add_argument('--user', help='Username to log in as (default: busiest creator)')
+
+    def handle(self, *args, **options):
+        base = urlsplit(options['url'])
+        paths = options['paths'] or DEFAULT_PATHS
+        cookie = f'{settings.SESSION_COOKIE_NAME}={self.session_key(options["user"])}'
+
+        deadline = time.perf_counter() + options['duration']
+        timings, errors, lock = [], [], threading.Lock()
+
+        def client():
+            connection = HTTPConnection(base.hostname, base.port or 80, timeout=30)
+            local_timings, local_errors, i = [], [], 0
+            while time.perf_counter() < deadline:
+                path = paths[i % len(paths)]
+                i += 1
+                start = time.perf_counter()
+                try:
+                    connection.request('GET', path, headers={'Cookie': cookie, 'Host': base.hostname})
+                    response = connection.getresponse()
+                    response.read()
+                    if response.status != 200:
+                        local_errors.append(f'{path}: HTTP {response.status}')
+                except OSError as error:
+                    local_errors.append(f'{path}: {error}')
+                    connection.close()
+                    connection = HTTPConnection(base.hostname, base.port or 80, timeout=30)
+                    continue
+                local_timings.append((time.perf_counter() - start) * 1000)
+            connection.close()
+            with lock:
+                timings.extend(local_timings)
+                errors.extend(local_errors)
+
+        threads = [threading.Thread(target=client) for _ in range(options['concurrency'])]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        if not timings:
+            raise CommandError(f'No successful requests; first error: {errors[0] if errors else "none"}')
+        timings.sort()
+        self.stdout.write(
+            f'{len(timings)} requests in {elapsed:.1f}s with {options["concurrency"]} clients: '
+            f'{len(timings) / elapsed:.1f} req/s, p50={statistics.median(timings):.1f}ms '
+            f'p99={timings[min(len(timings) - 1, int(len(timings) * 0.99))]:.1f}ms errors={len(errors)}'
+        )
+        for error in sorted(set(errors))[:5]:
+            self.stderr.write(error)
+
+    def session_key(self, username):
+        """Log in without a password by writing an authenticated session"""
+        if username:
+            try:
+                user = User.objects.get(username=username)
+            except User.DoesNotExist:
+                raise CommandError(f'User "{username}" does not exist')
+        else:
+            user = User.objects.annotate(task_count=Count('created_tasks')).order_by('-task_count').first()
+            if user is None:
+                raise CommandError('No users found; run seed_tasks first')
+        session = import_string(f'{settings.SESSION_ENGINE}.SessionStore')()
+        session[SESSION_KEY] = str(user.pk)
+        session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.create()
+        return session.session_key
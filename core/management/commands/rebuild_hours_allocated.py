@@ -0,0 +1,29 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from core.workload import find_allocation_drift, rebuild_hours_allocated
+
+
+class Command(BaseCommand):
+    help = "Recompute every profile's allocated hours from its open tasks, or check them for drift with --check"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--check', action='store_true', help='Only report drift; exit with an error if any is found')
+
+    def handle(self, *args, **options):
+        if options['check']:
+            return self.check_drift()
+
+        count = rebuild_hours_allocated()
+        self.stdout.write(self.style.SUCCESS(f'Recomputed allocated hours for {count} profiles'))
+
+    def check_drift(self):
+        drift = find_allocation_drift()
+        if not drift:
+            self.stdout.write(self.style.SUCCESS('Allocated hours are in sync'))
+            return
+
+        usernames = dict(User.objects.filter(pk__in=drift).values_list('pk', 'username'))
+        for user_id, (stored, expected) in drift.items():
+            self.stdout.write(f'{usernames.get(user_id, user_id)}: stored={stored} expected={expected}')
+        raise CommandError(f'Allocated hours drifted for {len(drift)} profiles')
@@ -0,0 +1,43 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from core.counters import find_counter_drift, rebuild_counters
+
+
+class Command(BaseCommand):
+    help = 'Rebuild per-user task counters, or check them for drift with --check'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--check', action='store_true', help='Only report drift; exit with an error if any is found')
+        parser.add_argument('--fix', action='store_true', help='With --check, rebuild only the drifted users')
+        parser.add_argument('--user', action='append', dest='usernames', help='Rebuild only these users (repeatable)')
+    
+    def handle(self, *args, **options):
+        if options['check']:
+            return self.check_drift(options['fix'])
+        
+        user_ids = None
+        if options['usernames']:
+            user_ids = list(User.objects.filter(username__in=options['usernames']).values_list('pk', flat=True))
+            if len(user_ids) != len(set(options['usernames'])):
+                raise CommandError('One or more usernames do not exist')
+        
+        count = rebuild_counters(user_ids)
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt task counters for {count} users'))
+    
+    def check_drift(self, fix):
+        drift = find_counter_drift()
+        if not drift:
+            self.stdout.write(self.style.SUCCESS('Task counters are in sync'))
+            return
+        
+        usernames = dict(User.objects.filter(pk__in=drift).values_list('pk', 'username'))
+        for user_id, fields in drift.items():
+            details = ', '.join(f'{field}: stored={stored} expected={expected}' for field, (stored, expected) in fields.items())
+            self.stdout.write(f'{usernames.get(user_id, user_id)}: {details}')
+        
+        if fix:
+            rebuild_counters(list(drift))
+            self.stdout.write(self.style.SUCCESS(f'Rebuilt task counters for {len(drift)} drifted users'))
+            return
+        raise CommandError(f'Task counters drifted for {len(drift)} users')
@@ -0,0 +1,84 @@
+import random
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from core.counters import rebuild_counters
+from core.models import Task
+from core.profile import UserProfile
+from core.tag_index import invalidate_tag_index
+from core.tags import sync_task_tags
+from core.workload import rebuild_hours_allocated
+
+TAG_POOL = ['frontend', 'backend', 'bug', 'feature', 'api', 'database', 'testing', 'docs', 'ops', 'design']
+
+
+class Command(BaseCommand):
+    help = 'Generate a large synthetic task fixture for benchmarking'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, default=100000, help='Number of tasks to create')
+        parser.add_argument('--users', type=int, default=100, help='Number of benchmark users to spread tasks across')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per bulk INSERT')
+        parser.add_argument('--seed', type=int, default=42, help='Random seed for reproducible fixtures')
+    
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        users = self.get_users(options['users'])
+        statuses = [value for value, _ in Task.STATUS_CHOICES]
+        priorities = [value for value, _ in Task.PRIORITY_CHOICES]
+        now = timezone.now()
+        
+        remaining = options['tasks']
+        created = 0
+        while remaining > 0:
+            size = min(remaining, options['batch_size'])
+            batch = []
+            for i in range(size):
+                status = rng.choice(statuses)
+                batch.append(Task(
+                    title=f'Benchmark task {created + i}',
+                    description='Synthetic task generated by seed_tasks',
+                    status=status,
+                    priority=rng.choice(priorities),
+                    due_date=now + timedelta(days=rng.randint(-60, 60)) if rng.random() < 0.7 else None,
+                    completed_at=now if status == 'completed' else None,
+                    created_by=rng.choice(users),
+                    assigned_to=rng.choice(users) if rng.random() < 0.8 else None,
+                    tags=', '.join(rng.sample(TAG_POOL, rng.randint(0, 3))),
+                    estimated_hours=rng.randint(1, 40),
+                ))
+            with transaction.atomic():
+                Task.objects.bulk_create(batch, batch_size=options['batch_size'])
+                sync_task_tags(batch, replace=False)
+            created += size
+            remaining -= size
+            self.stdout.write(f'{created} tasks created', ending='\r')
+        
+        # Bulk inserts skip the save signals that keep the tag index, task
+        # counters and allocated hours current
+        invalidate_tag_index()
+        rebuild_counters([user.pk for user in users])
+        rebuild_hours_allocated([user.pk for user in users])
+        self.stdout.write('')
+        self.stdout.write(self.style.SUCCESS(f'Created {created} tasks across {len(users)} users'))
+    
+    def get_users(self, count):
+        """Return ``count`` benchmark users, creating any that are missing"""
+        usernames = [f'bench_user_{i}' for i in range(count)]
+        existing = set(User.objects.filter(username__in=usernames).values_list('username', flat=True))
+        User.objects.bulk_create([
+            User(username=username, email=f'{username}@example.com')
+            for username in usernames if username not in existing
+        ])
+        users = list(User.objects.filter(username__in=usernames))
+        
+        # bulk_create skips the post_save signal that normally creates profiles
+        UserProfile.objects.bulk_create(
+            [UserProfile(user=user) for user in users],
+            ignore_conflicts=True,
+        )
+        return users
@@ -0,0 +1,147 @@
+import json
+import logging
+import random
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger('core.queries')
+
+# Longest SQL text logged for the slowest statement
+MAX_SQL_LENGTH = 500
+
+
+class QueryStats:
+    """``execute_wrapper`` that times every statement run during a request"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.slowest_duration = 0.0
+        self.slowest_sql = None
+        self.statements = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            self.count += 1
+            self.duration += duration
+            self.statements[(sql, repr(params))] += 1
+            if duration >= self.slowest_duration:
+                self.slowest_duration = duration
+                self.slowest_sql = sql
+
+    @property
+    def duplicates(self):
+        """Statements re-run with identical SQL and parameters"""
+        return sum(count - 1 for count in self.statements.values())
+
+    @property
+    def similar(self):
+        """Statements re-run with the same SQL but any parameters, the N+1 signature"""
+        per_sql = Counter()
+        for (sql, _), count in self.statements.items():
+            per_sql[sql] += count
+        return sum(count - 1 for count in per_sql.values())
+
+    def as_dict(self):
+        return {
+            'queries': self.count,
+            'sql_ms': round(self.duration * 1000, 2),
+            'duplicates': self.duplicates,
+            'similar': self.similar,
+            'slowest_ms': round(self.slowest_duration * 1000, 2),
+            'slowest_sql': (self.slowest_sql or '')[:MAX_SQL_LENGTH],
+        }
+
+
+class QueryInstrumentationMiddleware:
+    """Record the database cost of each request, opted in with ``QUERY_INSTRUMENTATION``
+
+    Sampled requests (``QUERY_INSTRUMENTATION_SAMPLE_RATE``) get a
+    ``core.queries`` log line and, with ``QUERY_INSTRUMENTATION_HEADERS``, a
+    ``Server-Timing`` header that browser dev tools display per request.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'QUERY_INSTRUMENTATION', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'QUERY_INSTRUMENTATION_SAMPLE_RATE', 1.0)
+        self.headers = getattr(settings, 'QUERY_INSTRUMENTATION_HEADERS', False)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if random.random() >= self.sample_rate:
+            return self.get_response(request)
+
+        stats = QueryStats()
+        start = time.perf_counter()
+        with self.wrap_connections(stats):
+            response = self.get_response(request)
+        self.report(request, response, stats, start)
+        return response
+
+    async def __acall__(self, request):
+        if random.random() >= self.sample_rate:
+            return await self.get_response(request)
+
+        stats = QueryStats()
+        start = time.perf_counter()
+        # Connections are per thread, and an async request runs its queries
+        # in its own thread-sensitive worker thread, so wrap them there
+        stack = await sync_to_async(self.wrap_connections)(stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        self.report(request, response, stats, start)
+        return response
+
+    def wrap_connections(self, stats):
+        stack = ExitStack()
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(stats))
+        return stack
+
+    def report(self, request, response, stats, start):
+        total_ms = (time.perf_counter() - start) * 1000
+        data = stats.as_dict()
+        if self.headers:
+            response.headers['Server-Timing'] = server_timing(data, total_ms)
+        logger.info(
+            'query_stats %s',
+            json.dumps({
+                'method': request.method,
+                'path': request.path,
+                'status': response.status_code,
+                'total_ms': round(total_ms, 2),
+                **data,
+            }),
+            extra={'query_stats': data},
+        )
+
+
+def server_timing(data, total_ms):
+    metrics = [
+        f'db;desc="{data["queries"]} queries";dur={data["sql_ms"]}',
+        f'db-slowest;dur={data["slowest_ms"]}',
+        f'app;dur={total_ms:.2f}',
+    ]
+    if data['duplicates']:
+        metrics.insert(1, f'db-duplicates;desc="{data["duplicates"]} duplicate queries"')
+    return ', '.join(metrics)
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.6 on 2026-10-17 01:47
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('core', '0002_userprofile'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserTaskCounter',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='task_counter', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('total_tasks', models.IntegerField(default=0)),
+                ('pending_tasks', models.IntegerField(default=0)),
+                ('in_progress_tasks', models.IntegerField(default=0)),
+                ('completed_tasks', models.IntegerField(default=0)),
+                ('cancelled_tasks', models.IntegerField(default=0)),
+                ('low_priority_tasks', models.IntegerField(default=0)),
+                ('medium_priority_tasks', models.IntegerField(default=0)),
+                ('high_priority_tasks', models.IntegerField(default=0)),
+                ('urgent_priority_tasks', models.IntegerField(default=0)),
+                ('open_due_tasks', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'User Task Counter',
+                'verbose_name_plural': 'User Task Counters',
+            },
+        ),
+    ]
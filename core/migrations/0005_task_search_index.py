@@ -0,0 +1,89 @@
+from django.db import migrations
+
+# The schema as of this migration, copied from core.search so later
+# changes there can't rewrite migration history
+
+SQLITE_SCHEMA = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS core_task_fts USING fts5(
+        title, description, tags,
+        content='core_task', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS core_task_fts_ai AFTER INSERT ON core_task BEGIN
+        INSERT INTO core_task_fts(rowid, title, description, tags)
+        VALUES (new.id, new.title, new.description, new.tags);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS core_task_fts_ad AFTER DELETE ON core_task BEGIN
+        INSERT INTO core_task_fts(core_task_fts, rowid, title, description, tags)
+        VALUES ('delete', old.id, old.title, old.description, old.tags);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS core_task_fts_au AFTER UPDATE OF title, description, tags ON core_task BEGIN
+        INSERT INTO core_task_fts(core_task_fts, rowid, title, description, tags)
+        VALUES ('delete', old.id, old.title, old.description, old.tags);
+        INSERT INTO core_task_fts(rowid, title, description, tags)
+        VALUES (new.id, new.title, new.description, new.tags);
+    END""",
+    "INSERT INTO core_task_fts(core_task_fts) VALUES ('rebuild')",
+]
+
+POSTGRES_VECTOR = """
+    setweight(to_tsvector('simple', coalesce({row}.title, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce({row}.tags, '')), 'B') ||
+    setweight(to_tsvector('simple', coalesce({row}.description, '')), 'C')
+"""
+
+POSTGRES_SCHEMA = [
+    "ALTER TABLE core_task ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    "CREATE INDEX IF NOT EXISTS task_search_vector_idx ON core_task USING GIN (search_vector)",
+    """CREATE OR REPLACE FUNCTION core_task_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := {vector};
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql""".format(vector=POSTGRES_VECTOR.format(row='NEW')),
+    "DROP TRIGGER IF EXISTS core_task_search_vector_trigger ON core_task",
+    """CREATE TRIGGER core_task_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description, tags ON core_task
+    FOR EACH ROW EXECUTE FUNCTION core_task_search_vector_update()""",
+    "UPDATE core_task SET search_vector = {vector}".format(vector=POSTGRES_VECTOR.format(row='core_task')),
+]
+
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS core_task_fts_ai",
+    "DROP TRIGGER IF EXISTS core_task_fts_ad",
+    "DROP TRIGGER IF EXISTS core_task_fts_au",
+    "DROP TABLE IF EXISTS core_task_fts",
+]
+
+POSTGRES_DROP = [
+    "DROP TRIGGER IF EXISTS core_task_search_vector_trigger ON core_task",
+    "DROP FUNCTION IF EXISTS core_task_search_vector_update()",
+    "DROP INDEX IF EXISTS task_search_vector_idx",
+    "ALTER TABLE core_task DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def run_statements(schema_editor, statements):
+    statements = statements.get(schema_editor.connection.vendor, [])
+    with schema_editor.connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    run_statements(schema_editor, {'sqlite': SQLITE_SCHEMA, 'postgresql': POSTGRES_SCHEMA})
+
+
+def drop_search_index(apps, schema_editor):
+    run_statements(schema_editor, {'sqlite': SQLITE_DROP, 'postgresql': POSTGRES_DROP})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_task_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.2.6 on 2026-10-17 02:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def parse_tag_names(text):
+    return {tag.strip().lower() for tag in (text or '').split(',') if tag.strip()}
+
+
+def populate_task_tags(apps, schema_editor):
+    Task = apps.get_model('core', 'Task')
+    Tag = apps.get_model('core', 'Tag')
+    TaskTag = apps.get_model('core', 'TaskTag')
+    tagged = Task.objects.exclude(tags='').order_by()
+    
+    names = set()
+    for tags in tagged.values_list('tags', flat=True).iterator(chunk_size=2000):
+        names |= parse_tag_names(tags)
+    Tag.objects.bulk_create([Tag(name=name) for name in names], batch_size=1000)
+    tag_ids = dict(Tag.objects.values_list('name', 'id'))
+    
+    links = []
+    for task_id, tags in tagged.values_list('id', 'tags').iterator(chunk_size=2000):
+        links.extend(TaskTag(task_id=task_id, tag_id=tag_ids[name]) for name in parse_tag_names(tags))
+        if len(links) >= 5000:
+            TaskTag.objects.bulk_create(links)
+            links = []
+    TaskTag.objects.bulk_create(links)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_task_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200, unique=True, verbose_name='Name')),
+            ],
+            options={
+                'verbose_name': 'Tag',
+                'verbose_name_plural': 'Tags',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='TaskTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='task_links', to='core.tag')),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tag_links', to='core.task')),
+            ],
+            options={
+                'verbose_name': 'Task Tag',
+                'verbose_name_plural': 'Task Tags',
+            },
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='tag_set',
+            field=models.ManyToManyField(blank=True, related_name='tasks', through='core.TaskTag', to='core.tag', verbose_name='Tag Set'),
+        ),
+        migrations.AddConstraint(
+            model_name='tasktag',
+            constraint=models.UniqueConstraint(fields=('tag', 'task'), name='unique_task_tag'),
+        ),
+        migrations.RunPython(populate_task_tags, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.6 on 2026-10-17 04:47
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def compute_hours_allocated(apps, schema_editor):
+    Task = apps.get_model('core', 'Task')
+    UserProfile = apps.get_model('core', 'UserProfile')
+    hours = (
+        Task.objects.order_by()
+        .filter(assigned_to=models.OuterRef('user_id'), status__in=['pending', 'in_progress'])
+        .values('assigned_to')
+        .annotate(hours=models.Sum('estimated_hours'))
+        .values('hours')
+    )
+    UserProfile.objects.update(
+        current_hours_allocated=Coalesce(models.Subquery(hours), models.Value(Decimal(0)), output_field=models.DecimalField())
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_task_updated_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='userprofile',
+            name='current_hours_allocated',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=8),
+        ),
+        migrations.RunPython(compute_hours_allocated, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,30 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import User
 from django.utils import timezone
 from .profile import UserProfile
+from .counters import UserTaskCounter
+from .tags import Tag, TaskTag, parse_tags
+
+class TaskQuerySet(models.QuerySet):
+    def visible_to(self, user):
+        """Tasks the user created or is assigned to
+        
+        Expressed as ``id IN (created UNION assigned)`` rather than an OR so
+        each branch is an indexed lookup and no DISTINCT is needed.
+        """
+        base = self.model._base_manager.order_by()
+        created = base.filter(created_by=user).values('pk')
+        assigned = base.filter(assigned_to=user).values('pk')
+        return self.filter(pk__in=created.union(assigned))
+    
+    def with_people(self):
+        """Join the creator and assignee so templates can show their names"""
+        return self.select_related('created_by', 'assigned_to')
+    
+    def for_cards(self):
+        """Only the columns task cards render, with the creator and assignee joined"""
+        return self.with_people().only(*Task.CARD_FIELDS)
+
 
 class Task(models.Model):
     STATUS_CHOICES = [
@@ -18,6 +41,21 @@ class Task(models.Model):
         ('urgent', 'Urgent'),
     ]
     
+    # Statuses that still need work (used for overdue checks)
+    OPEN_STATUSES = ['pending', 'in_progress']
+    
+    # Fields that derived data such as per-user counters and tags depend on
+    TRACKED_FIELDS = ['created_by_id', 'assigned_to_id', 'status', 'priority', 'due_date', 'tags', 'estimated_hours']
+    
+    # Columns task list and dashboard cards render, plus updated_at for their
+    # cache keys (see TaskQuerySet.for_cards)
+    CARD_FIELDS = [
+        'title', 'description', 'status', 'priority', 'created_at', 'updated_at', 'due_date',
+        'tags', 'estimated_hours', 'actual_hours',
+        'created_by__username', 'created_by__first_name', 'created_by__last_name',
+        'assigned_to__username', 'assigned_to__first_name', 'assigned_to__last_name',
+    ]
+    
     title = models.CharField(max_length=200, verbose_name="Task Title")
     description = models.TextField(blank=True, null=True, verbose_name="Description")
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending', verbose_name="Status")
@@ -35,17 +73,82 @@ class Task(models.Model):
     
     # Additional fields
     tags = models.CharField(max_length=200, blank=True, verbose_name="Tags (comma-separated)")
+    # Normalized copy of ``tags`` kept in sync on save, used for exact tag filters
+    tag_set = models.ManyToManyField(Tag, through=TaskTag, related_name='tasks', blank=True, verbose_name="Tag Set")
     estimated_hours = models.DecimalField(max_digits=5, decimal_places=2, blank=True, null=True, verbose_name="Estimated Hours")
     actual_hours = models.DecimalField(max_digits=5, decimal_places=2, blank=True, null=True, verbose_name="Actual Hours")
     
+    objects = TaskQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-created_at']
         verbose_name = "Task"
         verbose_name_plural = "Tasks"
+        indexes = [
+            # task_list / my_tasks: per-user listings, newest first
+            models.Index(fields=['assigned_to', '-created_at'], name='task_assignee_recent_idx'),
+            models.Index(fields=['created_by', '-created_at'], name='task_creator_recent_idx'),
+            # Same listings narrowed by the status filter
+            models.Index(fields=['assigned_to', 'status', '-created_at'], name='task_assignee_status_idx'),
+            models.Index(fields=['created_by', 'status', '-created_at'], name='task_creator_status_idx'),
+            # Managers' unscoped listing filtered by status and priority
+            models.Index(fields=['status', 'priority', '-created_at'], name='task_status_priority_idx'),
+            models.Index(fields=['-created_at', '-id'], name='task_recent_idx'),
+            # Conditional GET validators: MAX(updated_at) and COUNT(*) in one covering scan
+            models.Index(fields=['updated_at'], name='task_updated_idx'),
+            # Dashboard overdue check only ever looks at open tasks
+            models.Index(
+                fields=['due_date'],
+                condition=models.Q(status__in=['pending', 'in_progress']),
+                name='task_open_due_idx',
+            ),
+        ]
     
     def __str__(self):
         return self.title
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored values so saves can compute what changed
+        instance._loaded_state = instance.get_tracked_state()
+        return instance
+    
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        state = getattr(self, '_loaded_state', None)
+        if fields is None:
+            self._loaded_state = self.get_tracked_state()
+        elif state is not None:
+            # Refreshed fields now hold their stored values; the others may be unsaved edits
+            for name in fields:
+                attname = self._meta.get_field(name).attname
+                if attname in state:
+                    state[attname] = getattr(self, attname)
+    
+    def get_tracked_state(self):
+        """Snapshot of the tracked fields, or None if any of them is deferred"""
+        if self.get_deferred_fields().intersection(self.TRACKED_FIELDS):
+            return None
+        return {field: getattr(self, field) for field in self.TRACKED_FIELDS}
+    
+    def save(self, *args, **kwargs):
+        # post_save receivers compare _previous_state with the saved values
+        if self._state.adding:
+            self._previous_state = None
+        else:
+            self._previous_state = getattr(self, '_loaded_state', None)
+            if self._previous_state is None:
+                self._previous_state = Task.objects.filter(pk=self.pk).values(*self.TRACKED_FIELDS).first()
+        # Counter and allocation deltas commit with the row they describe
+        with transaction.atomic(using=kwargs.get('using'), savepoint=False):
+            super().save(*args, **kwargs)
+        self._loaded_state = self.get_tracked_state()
+    
+    def is_visible_to(self, user):
+        """Whether the user created or is assigned to this task"""
+        return user.pk in (self.created_by_id, self.assigned_to_id)
+    
     @property
     def is_overdue(self):
         if self.due_date and self.status != 'completed':
@@ -73,6 +176,21 @@ class Task(models.Model):
         return colors.get(self.status, '#6c757d')
     
     def get_tags_list(self):
-        if self.tags:
-            return [tag.strip() for tag in self.tags.split(',') if tag.strip()]
-        return []
+        return parse_tags(self.tags)
+
+
+class ImportCheckpoint(models.Model):
+    """Progress of an ``import_tasks`` run, committed with each batch it describes"""
+    name = models.CharField(max_length=500, unique=True)
+    path = models.CharField(max_length=500)
+    records = models.PositiveIntegerField(default=0)
+    imported = models.PositiveIntegerField(default=0)
+    skipped = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return f"{self.name} ({self.records} records)"
+    
+    @property
+    def progress(self):
+        return {'records': self.records, 'imported': self.imported, 'skipped': self.skipped}
@@ -0,0 +1,189 @@
+import base64
+import binascii
+import math
+from datetime import datetime
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+
+class CursorPaginator:
+    """Keyset paginator over ``(created_at, id)``, newest first
+
+    Pages are located with an indexed range condition instead of OFFSET, so
+    page 5000 costs the same as page 1. The total is optional and, when
+    requested, counted only up to ``count_limit`` rows.
+    """
+
+    def __init__(self, queryset, per_page, count_limit=None):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.count_limit = count_limit
+        self._count = None
+
+    @property
+    def count(self):
+        """Number of rows, capped at ``count_limit`` (None when disabled)"""
+        if self.count_limit is None:
+            return None
+        if self._count is None:
+            # COUNT over a LIMIT subquery stops scanning after count_limit + 1 rows
+            self._count = self.queryset.order_by()[:self.count_limit + 1].count()
+        return min(self._count, self.count_limit)
+
+    @property
+    def count_is_capped(self):
+        return self.count is not None and self._count > self.count_limit
+
+    def get_page(self, cursor):
+        """Return the page identified by ``cursor``; invalid cursors give the first page
+
+        The redundant ``created_at <=`` bound lets the database seek the
+        ``(created_at, id)`` index instead of filtering an OR row by row.
+        """
+        position = decode_cursor(cursor)
+        if position is None:
+            rows = list(self.queryset.order_by('-created_at', '-id')[:self.per_page + 1])
+            return CursorPage(self, rows[:self.per_page], has_next=len(rows) > self.per_page, has_previous=False)
+
+        direction, created_at, pk = position
+        if direction == 'next':
+            rows = list(
+                self.queryset.filter(created_at__lte=created_at)
+                .filter(Q(created_at__lt=created_at) | Q(id__lt=pk))
+                .order_by('-created_at', '-id')[:self.per_page + 1]
+            )
+            return CursorPage(self, rows[:self.per_page], has_next=len(rows) > self.per_page, has_previous=True)
+
+        # Walk backwards in ascending order, then restore newest-first order
+        rows = list(
+            self.queryset.filter(created_at__gte=created_at)
+            .filter(Q(created_at__gt=created_at) | Q(id__gt=pk))
+            .order_by('created_at', 'id')[:self.per_page + 1]
+        )
+        page_rows = rows[:self.per_page][::-1]
+        return CursorPage(self, page_rows, has_next=True, has_previous=len(rows) > self.per_page)
+
+
+class CursorPage:
+    is_cursor_page = True
+
+    def __init__(self, paginator, object_list, has_next, has_previous):
+        self.paginator = paginator
+        self.object_list = object_list
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self._has_next and bool(self.object_list)
+
+    def has_previous(self):
+        return self._has_previous and bool(self.object_list)
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    @property
+    def next_cursor(self):
+        if self.has_next():
+            return encode_cursor('next', self.object_list[-1])
+        return None
+
+    @property
+    def previous_cursor(self):
+        if self.has_previous():
+            return encode_cursor('previous', self.object_list[0])
+        return None
+
+
+class EstimatedCountPaginator(Paginator):
+    """OFFSET paginator for admin changelists over tables too large to count
+
+    An unfiltered queryset over more than ``estimate_threshold`` rows takes
+    its count from the planner's row estimate instead of ``COUNT(*)``.
+    Filtered querysets are counted up to ``count_limit`` rows. Only the
+    first ``count_limit`` rows can be paged through either way, since deep
+    OFFSETs scan every row they skip; narrower filters reach the rest.
+    """
+    count_limit = 10000
+    estimate_threshold = 100000
+
+    count_is_estimated = False
+    count_is_capped = False
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = estimated_row_count(queryset.model, queryset.db)
+            if estimate is not None and estimate > self.estimate_threshold:
+                self.count_is_estimated = True
+                return estimate
+        # COUNT over a LIMIT subquery stops scanning after count_limit + 1 rows
+        count = queryset.order_by()[:self.count_limit + 1].count()
+        self.count_is_capped = count > self.count_limit
+        return min(count, self.count_limit)
+
+    @cached_property
+    def num_pages(self):
+        return min(super().num_pages, max(1, math.ceil(self.count_limit / self.per_page)))
+
+
+def estimated_row_count(model, using='default'):
+    """Rows in ``model``'s table according to the planner, or None without statistics
+
+    Only PostgreSQL keeps an estimate (``pg_class.reltuples``, refreshed by
+    autovacuum and ANALYZE); it is -1 for tables never analyzed.
+    """
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT reltuples FROM pg_class WHERE oid = %s::regclass', [model._meta.db_table])
+        row = cursor.fetchone()
+    if row is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+def encode_cursor(direction, task):
+    value = f"{direction}|{task.created_at.isoformat()}|{task.pk}"
+    return base64.urlsafe_b64encode(value.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Return ``(direction, created_at, pk)`` or None for a missing or malformed cursor"""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        direction, created_at, pk = base64.urlsafe_b64decode(padded).decode().split('|')
+        if direction not in ('next', 'previous'):
+            return None
+        return direction, datetime.fromisoformat(created_at), int(pk)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+
+
+def paginate_tasks(request, tasks, per_page=12):
+    """Paginate a task listing with OFFSET pages or, when opted in, cursors
+
+    Cursor mode is used when ``TASK_LIST_CURSOR_PAGINATION`` is enabled or
+    the request carries a ``cursor`` parameter.
+    """
+    if getattr(settings, 'TASK_LIST_CURSOR_PAGINATION', False) or 'cursor' in request.GET:
+        count_limit = getattr(settings, 'TASK_LIST_COUNT_LIMIT', 1000) or None
+        paginator = CursorPaginator(tasks, per_page, count_limit=count_limit)
+        return paginator.get_page(request.GET.get('cursor'))
+
+    paginator = Paginator(tasks, per_page)
+    return paginator.get_page(request.GET.get('page'))
@@ -25,21 +25,38 @@ class UserProfile(models.Model):
     
     # Hour tracking
     weekly_hours_available = models.PositiveIntegerField(default=40)
-    current_hours_allocated = models.DecimalField(max_digits=5, decimal_places=2, default=0)
+    # Estimated hours of open assigned tasks, maintained by core.workload
+    current_hours_allocated = models.DecimalField(max_digits=8, decimal_places=2, default=0)
+    
+    # Only ever changed with F() deltas or a recompute; full-row saves leave
+    # it out so they can't write back a value read before a concurrent delta
+    DERIVED_FIELDS = {'current_hours_allocated'}
     
     class Meta:
         verbose_name = "User Profile"
         verbose_name_plural = "User Profiles"
     
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.DERIVED_FIELDS
+            ]
+        super().save(*args, **kwargs)
+    
     def __str__(self):
         return f"{self.user.get_full_name() or self.user.username} - {self.get_role_display()}"
     
     @property
     def availability_percentage(self):
         """Calculate how busy the user is based on allocated hours"""
+        return self.workload_percentage(self.current_hours_allocated)
+    
+    def workload_percentage(self, hours):
+        """Share of the weekly hours that ``hours`` of work takes, capped at 100"""
         if self.weekly_hours_available <= 0:
             return 0
-        return min(100, (self.current_hours_allocated / self.weekly_hours_available) * 100)
+        return min(100, (hours / self.weekly_hours_available) * 100)
     
     @property
     def full_name(self):
@@ -0,0 +1,210 @@
+"""Pluggable full-text search for tasks
+
+The database keeps the search index current with triggers, so saves,
+bulk inserts and queryset updates are all indexed:
+
+* PostgreSQL: a weighted ``search_vector`` tsvector column with a GIN index
+* SQLite: an FTS5 external-content table, ``core_task_fts``
+
+Other databases fall back to ``icontains`` matching. Set
+``TASK_SEARCH_BACKEND`` to a dotted class path to override the choice.
+"""
+import re
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+class IContainsSearchBackend:
+    """Substring matching on title, description and tags (no index, no ranking)"""
+
+    def search(self, queryset, query):
+        return queryset.filter(
+            Q(title__icontains=query) |
+            Q(description__icontains=query) |
+            Q(tags__icontains=query)
+        )
+
+    def rank(self, queryset, query):
+        return queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+class SQLiteFTSSearchBackend(IContainsSearchBackend):
+    """FTS5 prefix matching ranked by bm25, weighting title over tags over description"""
+
+    def match_expression(self, query):
+        # Quote every word so user input cannot inject FTS5 operators
+        return ' '.join(f'"{token}"*' for token in TOKEN_RE.findall(query))
+
+    def search(self, queryset, query):
+        match = self.match_expression(query)
+        if not match:
+            return super().search(queryset, query)
+        return queryset.filter(id__in=RawSQL(
+            'SELECT rowid FROM core_task_fts WHERE core_task_fts MATCH %s', [match]
+        ))
+
+    def rank(self, queryset, query):
+        match = self.match_expression(query)
+        if not match:
+            return super().rank(queryset, query)
+        # bm25() is lower for better matches; negate so higher ranks sort first.
+        # LIMIT -1 stops SQLite flattening the subquery, so the MATCH runs
+        # once and is probed by rowid instead of re-running per outer row.
+        return queryset.annotate(search_rank=RawSQL(
+            'SELECT matches.score FROM ('
+            'SELECT rowid AS task_id, -bm25(core_task_fts, 10.0, 1.0, 5.0) AS score '
+            'FROM core_task_fts WHERE core_task_fts MATCH %s LIMIT -1'
+            ') AS matches WHERE matches.task_id = "core_task"."id"',
+            [match],
+            output_field=FloatField(),
+        ))
+
+
+class PostgresSearchBackend(IContainsSearchBackend):
+    """tsvector prefix matching ranked with ts_rank"""
+
+    def tsquery(self, query):
+        return ' & '.join(f'{token}:*' for token in TOKEN_RE.findall(query))
+
+    def search(self, queryset, query):
+        tsquery = self.tsquery(query)
+        if not tsquery:
+            return super().search(queryset, query)
+        return queryset.filter(id__in=RawSQL(
+            "SELECT id FROM core_task WHERE search_vector @@ to_tsquery('simple', %s)", [tsquery]
+        ))
+
+    def rank(self, queryset, query):
+        tsquery = self.tsquery(query)
+        if not tsquery:
+            return super().rank(queryset, query)
+        return queryset.annotate(search_rank=RawSQL(
+            'ts_rank("core_task"."search_vector", to_tsquery(\'simple\', %s))',
+            [tsquery],
+            output_field=FloatField(),
+        ))
+
+
+VENDOR_BACKENDS = {
+    'sqlite': SQLiteFTSSearchBackend,
+    'postgresql': PostgresSearchBackend,
+}
+
+
+def get_search_backend(using='default'):
+    backend_path = getattr(settings, 'TASK_SEARCH_BACKEND', None)
+    if backend_path:
+        return import_string(backend_path)()
+    return VENDOR_BACKENDS.get(connections[using].vendor, IContainsSearchBackend)()
+
+
+def search_tasks(queryset, query, ranked=False):
+    """Filter a task queryset by a search string, optionally ordered by relevance"""
+    backend = get_search_backend(queryset.db)
+    queryset = backend.search(queryset, query)
+    if ranked:
+        queryset = backend.rank(queryset, query).order_by('-search_rank', '-created_at')
+    return queryset
+
+
+# Schema management
+
+SQLITE_SCHEMA = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS core_task_fts USING fts5(
+        title, description, tags,
+        content='core_task', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS core_task_fts_ai AFTER INSERT ON core_task BEGIN
+        INSERT INTO core_task_fts(rowid, title, description, tags)
+        VALUES (new.id, new.title, new.description, new.tags);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS core_task_fts_ad AFTER DELETE ON core_task BEGIN
+        INSERT INTO core_task_fts(core_task_fts, rowid, title, description, tags)
+        VALUES ('delete', old.id, old.title, old.description, old.tags);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS core_task_fts_au AFTER UPDATE OF title, description, tags ON core_task BEGIN
+        INSERT INTO core_task_fts(core_task_fts, rowid, title, description, tags)
+        VALUES ('delete', old.id, old.title, old.description, old.tags);
+        INSERT INTO core_task_fts(rowid, title, description, tags)
+        VALUES (new.id, new.title, new.description, new.tags);
+    END""",
+    "INSERT INTO core_task_fts(core_task_fts) VALUES ('rebuild')",
+]
+
+POSTGRES_VECTOR = """
+    setweight(to_tsvector('simple', coalesce({row}.title, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce({row}.tags, '')), 'B') ||
+    setweight(to_tsvector('simple', coalesce({row}.description, '')), 'C')
+"""
+
+POSTGRES_SCHEMA = [
+    "ALTER TABLE core_task ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    "CREATE INDEX IF NOT EXISTS task_search_vector_idx ON core_task USING GIN (search_vector)",
+    """CREATE OR REPLACE FUNCTION core_task_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := {vector};
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql""".format(vector=POSTGRES_VECTOR.format(row='NEW')),
+    "DROP TRIGGER IF EXISTS core_task_search_vector_trigger ON core_task",
+    """CREATE TRIGGER core_task_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description, tags ON core_task
+    FOR EACH ROW EXECUTE FUNCTION core_task_search_vector_update()""",
+    "UPDATE core_task SET search_vector = {vector}".format(vector=POSTGRES_VECTOR.format(row='core_task')),
+]
+
+
+def search_schema_installed(connection):
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'core_task_fts_au'")
+        elif connection.vendor == 'postgresql':
+            cursor.execute("SELECT 1 FROM pg_trigger WHERE tgname = 'core_task_search_vector_trigger'")
+        else:
+            return True
+        return cursor.fetchone() is not None
+
+
+def ensure_search_schema(connection):
+    """Create the search index and its triggers if missing, then (re)build it
+
+    SQLite drops a table's triggers when Django remakes it during a
+    migration, so this also runs after ``migrate`` while migration 0005
+    (which installed the schema) is applied.
+    """
+    if search_schema_installed(connection):
+        return False
+    statements = SQLITE_SCHEMA if connection.vendor == 'sqlite' else POSTGRES_SCHEMA
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+    return True
+
+
+def drop_search_schema(connection):
+    if connection.vendor == 'sqlite':
+        statements = [
+            "DROP TRIGGER IF EXISTS core_task_fts_ai",
+            "DROP TRIGGER IF EXISTS core_task_fts_ad",
+            "DROP TRIGGER IF EXISTS core_task_fts_au",
+            "DROP TABLE IF EXISTS core_task_fts",
+        ]
+    elif connection.vendor == 'postgresql':
+        statements = [
+            "DROP TRIGGER IF EXISTS core_task_search_vector_trigger ON core_task",
+            "DROP FUNCTION IF EXISTS core_task_search_vector_update()",
+            "DROP INDEX IF EXISTS task_search_vector_idx",
+            "ALTER TABLE core_task DROP COLUMN IF EXISTS search_vector",
+        ]
+    else:
+        return
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
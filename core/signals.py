@@ -0,0 +1,8 @@
+from django.dispatch import Signal
+
+# Sent by core.bulk after set-based writes that bypass the per-row Task
+# signals. ``changes`` is a list of ``(task_id, old_state, new_state)``
+# snapshots of Task.TRACKED_FIELDS; old_state is None for created tasks and
+# new_state is None for deleted ones. Receivers keep counters, tags and
+# caches in step with one aggregated update each.
+tasks_changed = Signal()
@@ -0,0 +1,45 @@
+from django.db.models import Count, Q
+from django.utils import timezone
+from .models import Task
+from .counters import UserTaskCounter
+
+
+def task_stats(queryset, now=None):
+    """Compute every task counter for a queryset in a single aggregate query"""
+    now = now or timezone.now()
+    return queryset.aggregate(
+        total_tasks=Count('pk'),
+        pending_tasks=Count('pk', filter=Q(status='pending')),
+        in_progress_tasks=Count('pk', filter=Q(status='in_progress')),
+        completed_tasks=Count('pk', filter=Q(status='completed')),
+        cancelled_tasks=Count('pk', filter=Q(status='cancelled')),
+        overdue_tasks=Count('pk', filter=Q(due_date__lt=now, status__in=Task.OPEN_STATUSES)),
+    )
+
+
+def user_task_stats(user, now=None):
+    """Task counters for everything a user created or is assigned to"""
+    return task_stats(Task.objects.visible_to(user), now=now)
+
+
+def user_counter_stats(user, now=None):
+    """Task counters for a user read from the materialized counter row
+
+    Only the time-dependent overdue count needs the task table, and only
+    when the user has open tasks with a due date.
+    """
+    counter = UserTaskCounter.for_user(user)
+    stats = {
+        'total_tasks': counter.total_tasks,
+        'pending_tasks': counter.pending_tasks,
+        'in_progress_tasks': counter.in_progress_tasks,
+        'completed_tasks': counter.completed_tasks,
+        'cancelled_tasks': counter.cancelled_tasks,
+        'overdue_tasks': 0,
+    }
+    if counter.open_due_tasks:
+        stats['overdue_tasks'] = Task.objects.visible_to(user).filter(
+            due_date__lt=now or timezone.now(),
+            status__in=Task.OPEN_STATUSES,
+        ).count()
+    return stats
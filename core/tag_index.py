@@ -0,0 +1,153 @@
+"""Prefix index over tag usage counts for autocomplete and the tag cloud
+
+Each process keeps a ``TagIndex`` in memory. Task saves and deletes
+publish per-tag count deltas on a ``CacheBus``, so processes catch up by
+applying the deltas they missed instead of recounting; they only rebuild
+from the database (one grouped query) when deltas have expired or the
+index was invalidated.
+"""
+import bisect
+import heapq
+import threading
+
+from django.db import transaction
+
+from .cache_bus import CacheBus
+from .tags import normalize_tag, parse_tags, tag_counts
+
+# Highest code point: prefix + MAX_CHAR sorts after every name with that prefix
+MAX_CHAR = '\U0010ffff'
+
+
+class TagIndex:
+    """Tag names in sorted and in frequency order, updated in place
+
+    Short prefix ranges are ranked directly; prefixes matching a large
+    share of all tags walk the frequency order instead, which finds the
+    top matches after a few dozen entries.
+    """
+
+    def __init__(self, counts=None):
+        self.counts = {name: count for name, count in (counts or {}).items() if count > 0}
+        self.names = sorted(self.counts)
+        self.ranked = sorted((-count, name) for name, count in self.counts.items())
+
+    def __len__(self):
+        return len(self.names)
+
+    def apply(self, delta):
+        """Add ``{name: change}`` to the counts, dropping tags that reach zero"""
+        for name, change in delta.items():
+            old = self.counts.get(name, 0)
+            new = old + change
+            if old == new:
+                continue
+            if old > 0:
+                del self.ranked[bisect.bisect_left(self.ranked, (-old, name))]
+            if new > 0:
+                if old <= 0:
+                    bisect.insort(self.names, name)
+                bisect.insort(self.ranked, (-new, name))
+                self.counts[name] = new
+            elif old > 0:
+                del self.names[bisect.bisect_left(self.names, name)]
+                del self.counts[name]
+
+    def suggest(self, prefix='', limit=10):
+        """Up to ``limit`` ``(name, count)`` pairs starting with ``prefix``, most used first"""
+        prefix = normalize_tag(prefix)
+        start = bisect.bisect_left(self.names, prefix)
+        end = bisect.bisect_right(self.names, prefix + MAX_CHAR, lo=start)
+        if (end - start) * 8 > len(self.names):
+            matches = []
+            for negative_count, name in self.ranked:
+                if name.startswith(prefix):
+                    matches.append((name, -negative_count))
+                    if len(matches) == limit:
+                        break
+            return matches
+        top = heapq.nsmallest(limit, ((-self.counts[name], name) for name in self.names[start:end]))
+        return [(name, -negative_count) for negative_count, name in top]
+
+
+class SharedTagIndex:
+    """The process-wide ``TagIndex`` kept in step with the tag count bus"""
+
+    def __init__(self, bus=None):
+        self.bus = bus or CacheBus('tag_counts')
+        self.lock = threading.Lock()
+        self.index = None
+        self.version = None
+
+    def get(self):
+        head = self.bus.head()
+        with self.lock:
+            if self.index is not None and self.version == head:
+                return self.index
+            if self.index is not None:
+                deltas = self.bus.messages_between(self.version, head)
+                if deltas is not None:
+                    for delta in deltas:
+                        self.index.apply(delta)
+                    self.version = head
+                    return self.index
+            self.index = TagIndex(dict(tag_counts()))
+            self.version = head
+            return self.index
+
+    def record(self, delta):
+        """Publish a count delta and apply it locally if this process is current"""
+        delta = {name: change for name, change in delta.items() if change}
+        if not delta:
+            return
+        position = self.bus.publish(delta)
+        if position is None:
+            # Bus head evicted: everyone rebuilds on their next read
+            self.reset()
+            return
+        with self.lock:
+            if self.index is not None and self.version == position - 1:
+                self.index.apply(delta)
+                self.version = position
+
+    def invalidate(self):
+        """Force every process to rebuild, e.g. after bulk tag changes"""
+        self.bus.invalidate()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.index = None
+            self.version = None
+
+
+shared_index = SharedTagIndex()
+
+
+def suggest_tags(prefix='', limit=10):
+    """Tags starting with ``prefix`` ranked by how many tasks use them"""
+    return shared_index.get().suggest(prefix, limit)
+
+
+def tag_changes(old_text, new_text):
+    """Per-tag count delta for a task whose tags go from ``old_text`` to ``new_text``"""
+    old = {normalize_tag(tag) for tag in parse_tags(old_text)}
+    new = {normalize_tag(tag) for tag in parse_tags(new_text)}
+    delta = dict.fromkeys(new - old, 1)
+    delta.update(dict.fromkeys(old - new, -1))
+    return delta
+
+
+def record_tag_changes(old_text, new_text):
+    """Update the index once the surrounding transaction commits"""
+    record_tag_delta(tag_changes(old_text, new_text))
+
+
+def record_tag_delta(delta):
+    delta = {name: change for name, change in delta.items() if change}
+    if delta:
+        transaction.on_commit(lambda: shared_index.record(delta))
+
+
+def invalidate_tag_index():
+    shared_index.invalidate()
@@ -0,0 +1,150 @@
+from django.db import models, transaction
+from django.db.models import Count
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .signals import tasks_changed
+
+
+def parse_tags(text):
+    """Split a comma-separated tag string into unique, trimmed tags in order"""
+    tags = []
+    seen = set()
+    for tag in (text or '').split(','):
+        tag = tag.strip()
+        if tag and tag.lower() not in seen:
+            seen.add(tag.lower())
+            tags.append(tag)
+    return tags
+
+
+def normalize_tag(tag):
+    return tag.strip().lower()
+
+
+class Tag(models.Model):
+    """A normalized (lower-case) tag shared by every task that uses it"""
+    name = models.CharField(max_length=200, unique=True, verbose_name="Name")
+
+    class Meta:
+        ordering = ['name']
+        verbose_name = "Tag"
+        verbose_name_plural = "Tags"
+
+    def __str__(self):
+        return self.name
+
+
+class TaskTag(models.Model):
+    task = models.ForeignKey('core.Task', on_delete=models.CASCADE, related_name='tag_links')
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name='task_links')
+
+    class Meta:
+        verbose_name = "Task Tag"
+        verbose_name_plural = "Task Tags"
+        constraints = [
+            # Leading with tag makes "tasks with tag X" an index range scan
+            models.UniqueConstraint(fields=['tag', 'task'], name='unique_task_tag'),
+        ]
+
+
+def get_or_create_tags(names):
+    """Return ``{name: Tag}`` for normalized names, creating missing tags in bulk"""
+    names = set(names)
+    if not names:
+        return {}
+    existing = {tag.name: tag for tag in Tag.objects.filter(name__in=names)}
+    missing = names - set(existing)
+    if missing:
+        Tag.objects.bulk_create([Tag(name=name) for name in missing], ignore_conflicts=True)
+        existing.update((tag.name, tag) for tag in Tag.objects.filter(name__in=missing))
+    return existing
+
+
+def sync_task_tags(tasks, replace=True, batch_size=1000):
+    """Write the normalized tag links for tasks from their ``tags`` text
+
+    Works on any number of tasks with a fixed number of queries, so bulk
+    imports can call it once per batch. ``replace=False`` skips deleting
+    existing links, which is safe for freshly inserted tasks.
+    """
+    write_tag_links({task.pk: task.tags for task in tasks}, replace, batch_size)
+
+
+def write_tag_links(tags_by_task, replace=True, batch_size=1000):
+    """Like ``sync_task_tags`` for a ``{task_id: tags text}`` mapping"""
+    wanted = {task_id: {normalize_tag(tag) for tag in parse_tags(text)} for task_id, text in tags_by_task.items()}
+    tags = get_or_create_tags(name for names in wanted.values() for name in names)
+    if replace:
+        TaskTag.objects.filter(task_id__in=list(wanted)).delete()
+    TaskTag.objects.bulk_create(
+        [TaskTag(task_id=task_id, tag=tags[name]) for task_id, names in wanted.items() for name in names],
+        batch_size=batch_size,
+        ignore_conflicts=True,
+    )
+
+
+def tag_counts(tasks=None, limit=None):
+    """Per-tag task counts, most used first, in one grouped query
+
+    ``tasks`` restricts the counts to a task queryset, e.g. the tasks a
+    user can see.
+    """
+    links = TaskTag.objects.all()
+    if tasks is not None:
+        links = links.filter(task__in=tasks.order_by().values('pk'))
+    counts = (
+        links.values('tag__name')
+        .annotate(task_count=Count('task'))
+        .order_by('-task_count', 'tag__name')
+    )
+    if limit:
+        counts = counts[:limit]
+    return [(row['tag__name'], row['task_count']) for row in counts]
+
+
+@receiver(post_save, sender='core.Task')
+def update_task_tags(sender, instance, created, **kwargs):
+    from .tag_index import record_tag_changes
+
+    previous = getattr(instance, '_previous_state', None)
+    if created and not instance.tags:
+        return
+    if previous is not None and previous['tags'] == instance.tags:
+        return
+    sync_task_tags([instance], replace=not created)
+    record_tag_changes(previous['tags'] if previous else '', instance.tags)
+
+
+@receiver(post_delete, sender='core.Task')
+def update_tag_index_on_delete(sender, instance, **kwargs):
+    from .tag_index import invalidate_tag_index, record_tag_changes
+
+    state = getattr(instance, '_loaded_state', None)
+    if state is None and 'tags' in instance.get_deferred_fields():
+        # The row is gone, so the removed tags can no longer be read
+        transaction.on_commit(invalidate_tag_index)
+        return
+    record_tag_changes(state['tags'] if state else instance.tags, '')
+
+
+@receiver(tasks_changed)
+def update_task_tags_on_bulk_change(sender, changes, **kwargs):
+    from .tag_index import record_tag_delta, tag_changes
+
+    created, updated, delta = {}, {}, {}
+    for task_id, old_state, new_state in changes:
+        old_tags = old_state['tags'] if old_state else ''
+        new_tags = new_state['tags'] if new_state else ''
+        if old_tags == new_tags:
+            continue
+        # bulk_delete_tasks removes the links of deleted tasks itself
+        if new_state is not None:
+            (updated if old_state else created)[task_id] = new_tags
+        for name, change in tag_changes(old_tags, new_tags).items():
+            delta[name] = delta.get(name, 0) + change
+    if created:
+        write_tag_links(created, replace=False)
+    if updated:
+        write_tag_links(updated)
+    record_tag_delta(delta)
@@ -0,0 +1,48 @@
+from django import template
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+
+from core.fragments import fragment_timeout, metrics, user_task_version
+
+register = template.Library()
+
+
+class FragmentCacheNode(template.Node):
+    def __init__(self, nodelist, fragment_name, vary_on):
+        self.nodelist = nodelist
+        self.fragment_name = fragment_name
+        self.vary_on = vary_on
+
+    def render(self, context):
+        key = make_template_fragment_key(self.fragment_name, [var.resolve(context) for var in self.vary_on])
+        value = cache.get(key)
+        metrics.record(self.fragment_name, hit=value is not None)
+        if value is None:
+            value = self.nodelist.render(context)
+            cache.set(key, value, fragment_timeout())
+        return value
+
+
+@register.tag('fragment_cache')
+def do_fragment_cache(parser, token):
+    """Cache the enclosed template, counting hits and misses under the fragment name
+
+    Usage::
+
+        {% fragment_cache "task_card" task.id task.updated_at %}
+            ...
+        {% endfragment_cache %}
+    """
+    bits = token.split_contents()
+    if len(bits) < 2:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' tag requires a fragment name")
+    fragment_name = bits[1].strip('"\'')
+    nodelist = parser.parse(('endfragment_cache',))
+    parser.delete_first_token()
+    return FragmentCacheNode(nodelist, fragment_name, [parser.compile_filter(bit) for bit in bits[2:]])
+
+
+@register.simple_tag
+def task_version(user):
+    """Current version of the user's task set, for use as a fragment_cache key"""
+    return user_task_version(user.pk)
@@ -1,10 +1,18 @@
-from django.test import TestCase, Client
+from django.contrib.admin.models import LogEntry
+import threading
+
+from django.test import TestCase, TransactionTestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
 from django.contrib.auth.models import User
 from django.urls import reverse
 from django.utils import timezone
 from datetime import timedelta
+from core.admin import TaskAdmin
 from core.models import Task
+from core.tags import TaskTag
 from core.profile import UserProfile
+from core.signals import tasks_changed
 
 
 class AdminTest(TestCase):
@@ -114,6 +122,30 @@ class AdminTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Test User')
     
+    def test_userprofile_admin_workload(self):
+        """Test profiles show their open assigned work without a query per row"""
+        Task.objects.create(title='Open', created_by=self.superuser, assigned_to=self.user, estimated_hours=30, status='in_progress')
+        Task.objects.create(title='Done', created_by=self.superuser, assigned_to=self.user, estimated_hours=8, status='completed')
+        self.client.login(username='admin@example.com', password='adminpass123')
+        url = reverse('admin:core_userprofile_changelist')
+        
+        response = self.client.get(url, {'o': '-8'})
+        profile = response.context['cl'].result_list[0]
+        self.assertEqual(profile.user, self.user)
+        # self.task (pending, no estimate) and the in-progress task
+        self.assertEqual((profile.open_task_count, profile.current_hours_allocated), (2, 30))
+        # Sorting by the count would evaluate its subquery for every profile
+        self.assertContains(response, 'class="sortable column-open_hours')
+        self.assertNotContains(response, 'class="sortable column-open_tasks')
+        self.assertContains(response, 'Available')
+        
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url)
+        for i in range(3):
+            User.objects.create_user(username=f'user{i}', email=f'user{i}@example.com', password='testpass123')
+        with self.assertNumQueries(len(queries)):
+            self.client.get(url)
+    
     def test_userprofile_admin_detail(self):
         """Test user profile admin detail view"""
         self.client.login(username='admin@example.com', password='adminpass123')
@@ -248,3 +280,170 @@ class AdminTest(TestCase):
         self.client.login(username='admin@example.com', password='adminpass123')
         response = self.client.get(reverse('admin:index'))
         self.assertEqual(response.status_code, 200)
+    
+    def test_assignee_filter_autocompletes(self):
+        """Test the assignee filter searches users instead of listing them all"""
+        other = User.objects.create_user(username='unlisted', email='unlisted@example.com', password='testpass123')
+        Task.objects.create(title='Other Task', created_by=other, assigned_to=other)
+        self.client.login(username='admin@example.com', password='adminpass123')
+        
+        response = self.client.get(reverse('admin:core_task_changelist'))
+        self.assertContains(response, 'data-filter-url')
+        self.assertNotContains(response, f'assigned_to__id__exact={other.id}')
+        
+        response = self.client.get(reverse('admin:core_task_changelist'), {'assigned_to__id__exact': other.id})
+        self.assertContains(response, 'Other Task')
+        self.assertNotContains(response, self.task.title)
+        self.assertContains(response, f'<option value="{other.id}" selected>unlisted</option>', html=True)
+    
+    def test_changelist_queries_do_not_grow_with_rows(self):
+        """Test editable assignee boxes reuse the joined users"""
+        self.client.login(username='admin@example.com', password='adminpass123')
+        url = reverse('admin:core_task_changelist')
+        self.client.get(url)
+        with self.assertNumQueries(5):
+            self.client.get(url)
+        
+        users = [
+            User.objects.create_user(username=f'user{i}', email=f'user{i}@example.com', password='testpass123')
+            for i in range(5)
+        ]
+        Task.objects.bulk_create(Task(title=f'Task {i}', created_by=user, assigned_to=user) for i, user in enumerate(users))
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+        self.assertContains(response, '<option value="%d" selected>user4</option>' % users[4].id, html=True)
+    
+    def test_large_changelist_skips_exact_counts(self):
+        """Test the changelist caps its count and skips the stats past the limit"""
+        Task.objects.bulk_create(Task(title=f'Task {i}', created_by=self.user) for i in range(5))
+        self.client.login(username='admin@example.com', password='adminpass123')
+        
+        response = self.client.get(reverse('admin:core_task_changelist'))
+        self.assertIn('task_stats', response.context)
+        
+        paginator = TaskAdmin.paginator
+        self.addCleanup(setattr, paginator, 'count_limit', paginator.count_limit)
+        paginator.count_limit = 3
+        response = self.client.get(reverse('admin:core_task_changelist'))
+        self.assertNotIn('task_stats', response.context)
+        self.assertContains(response, 'More than <strong>3</strong> tasks')
+    
+    def post_list_editable(self, tasks, **changes):
+        """Save the changelist with ``changes`` applied to every one of ``tasks``"""
+        data = {
+            'action': '',
+            'form-TOTAL_FORMS': str(len(tasks)),
+            'form-INITIAL_FORMS': str(len(tasks)),
+            'form-MIN_NUM_FORMS': '0',
+            'form-MAX_NUM_FORMS': '1000',
+            '_save': 'Save',
+        }
+        for i, task in enumerate(tasks):
+            values = {'status': task.status, 'priority': task.priority, 'assigned_to': task.assigned_to_id or '', **changes}
+            data.update({f'form-{i}-{field}': value for field, value in values.items()})
+            data[f'form-{i}-id'] = task.id
+        return self.client.post(reverse('admin:core_task_changelist'), data)
+    
+    def test_list_editable_saves_in_one_batch(self):
+        """Test list_editable writes edited rows together with one change signal"""
+        tasks = [self.task] + [
+            Task.objects.create(title=f'Task {i}', created_by=self.user, status='pending') for i in range(3)
+        ]
+        self.client.login(username='admin@example.com', password='adminpass123')
+        signals = []
+        tasks_changed.connect(lambda changes, **kwargs: signals.append(changes), weak=False, dispatch_uid='test_admin')
+        self.addCleanup(tasks_changed.disconnect, dispatch_uid='test_admin')
+        
+        with CaptureQueriesContext(connection) as single:
+            self.post_list_editable(tasks[:1], priority='urgent')
+        self.assertEqual(Task.objects.get(id=self.task.id).priority, 'urgent')
+        signals.clear()
+        with CaptureQueriesContext(connection) as batch:
+            response = self.post_list_editable(tasks, status='completed')
+        self.assertRedirects(response, reverse('admin:core_task_changelist'))
+        self.assertEqual(len(batch), len(single))
+        
+        self.assertEqual(len(signals), 1)
+        self.assertEqual(sorted(task_id for task_id, old, new in signals[0]), sorted(task.id for task in tasks))
+        for task in Task.objects.filter(id__in=[task.id for task in tasks]):
+            self.assertEqual(task.status, 'completed')
+            self.assertIsNotNone(task.completed_at)
+        entry = LogEntry.objects.filter(object_id=str(tasks[-1].id)).get()
+        self.assertEqual(entry.get_change_message(), 'Changed Status.')
+    
+    def post_action(self, action, tasks, **values):
+        data = {'action': action, '_selected_action': [task.id for task in tasks], **values}
+        return self.client.post(reverse('admin:core_task_changelist'), data, follow=True)
+    
+    def test_bulk_status_actions(self):
+        """Test completing and cancelling selections with set-based updates"""
+        done = Task.objects.create(title='Done Task', created_by=self.user, status='completed')
+        done_at = done.completed_at = timezone.now() - timedelta(days=3)
+        done.save()
+        self.client.login(username='admin@example.com', password='adminpass123')
+        
+        response = self.post_action('mark_completed', [self.task, done])
+        self.assertContains(response, 'Mark as completed: 1 task(s) changed.')
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.status, 'completed')
+        self.assertIsNotNone(self.task.completed_at)
+        self.assertEqual(Task.objects.get(id=done.id).completed_at, done_at)
+        
+        self.post_action('mark_cancelled', [self.task])
+        self.assertEqual(Task.objects.get(id=self.task.id).status, 'cancelled')
+    
+    def test_bulk_value_actions(self):
+        """Test the actions that take a value from the action bar"""
+        other = User.objects.create_user(username='other', email='other@example.com', password='testpass123')
+        self.client.login(username='admin@example.com', password='adminpass123')
+        
+        response = self.post_action('reassign', [self.task])
+        self.assertContains(response, 'Choose an assignee')
+        self.post_action('reassign', [self.task], assigned_to=other.id)
+        self.post_action('set_priority', [self.task], priority='urgent')
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.assigned_to, self.task.priority), (other, 'urgent'))
+        
+        self.post_action('add_tag', [self.task], tag='Triage')
+        self.assertEqual(Task.objects.get(id=self.task.id).tags, 'Triage')
+        self.assertTrue(TaskTag.objects.filter(task=self.task, tag__name='triage').exists())
+        self.post_action('remove_tag', [self.task], tag='triage')
+        self.assertEqual(Task.objects.get(id=self.task.id).tags, '')
+        self.assertFalse(TaskTag.objects.filter(task=self.task).exists())
+
+
+@override_settings(TASK_BULK_BACKGROUND_THRESHOLD=2, TASK_BULK_CHUNK_SIZE=2)
+class AdminBackgroundActionTest(TransactionTestCase):
+    """Test cases for large admin bulk actions running in the background"""
+    
+    def setUp(self):
+        """Set up test data"""
+        self.superuser = User.objects.create_superuser(
+            username='admin',
+            email='admin@example.com',
+            password='adminpass123'
+        )
+        self.tasks = [Task.objects.create(title=f'Task {i}', created_by=self.superuser) for i in range(5)]
+    
+    def test_large_selection_runs_in_background(self):
+        """Test a selection over the threshold runs in a thread with a progress page"""
+        self.client.force_login(self.superuser)
+        self.client.post(reverse('admin:core_task_changelist'), {
+            'action': 'mark_completed',
+            'select_across': '1',
+            '_selected_action': [self.tasks[0].id],
+        })
+        # Let the job finish before the next request reads the table
+        jobs = [thread for thread in threading.enumerate() if thread.name.startswith('bulk-job-')]
+        self.assertEqual(len(jobs), 1)
+        jobs[0].join(10)
+        job_url = reverse('admin:core_task_bulk_job', args=[jobs[0].name.removeprefix('bulk-job-')])
+        
+        response = self.client.get(reverse('admin:core_task_changelist'))
+        self.assertContains(response, f'Mark as completed is running in the background: <a href="{job_url}">progress</a>.')
+        response = self.client.get(job_url)
+        self.assertContains(response, 'Finished: <strong>5</strong> of 5 tasks changed.')
+        self.assertEqual(Task.objects.filter(status='completed').count(), 5)
+        with self.assertLogs('django.request', 'WARNING'):
+            response = self.client.get(reverse('admin:core_task_bulk_job', args=['unknown']))
+        self.assertEqual(response.status_code, 404)
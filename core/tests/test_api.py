@@ -0,0 +1,143 @@
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+from core.api.serializers import TASK_LIST_COLUMNS, TaskSerializer, task_list_columns, task_rows
+from core.models import Task
+from core.tests.utils import QueryBudgetMixin
+
+
+class TaskAPITest(QueryBudgetMixin, TestCase):
+    """Test cases for the task REST API"""
+    
+    def setUp(self):
+        """Set up test data"""
+        self.manager = User.objects.create_user(
+            username='manager',
+            email='manager@example.com',
+            password='testpass123'
+        )
+        self.manager.profile.role = 'manager'
+        self.manager.profile.save()
+        self.developer = User.objects.create_user(
+            username='developer',
+            email='developer@example.com',
+            password='testpass123'
+        )
+        self.other = User.objects.create_user(
+            username='other',
+            email='other@example.com',
+            password='testpass123'
+        )
+        self.task = Task.objects.create(
+            title='Assigned Task',
+            created_by=self.manager,
+            assigned_to=self.developer,
+            status='pending',
+            estimated_hours=4,
+            tags='backend'
+        )
+        self.hidden_task = Task.objects.create(title='Hidden Task', created_by=self.other)
+        self.client = APIClient()
+        self.list_url = reverse('api:task-list')
+    
+    def detail_url(self, task):
+        return reverse('api:task-detail', args=[task.id])
+    
+    def test_requires_authentication(self):
+        self.assertEqual(self.client.get(self.list_url).status_code, 403)
+    
+    def test_members_see_visible_tasks(self):
+        self.client.force_authenticate(self.developer)
+        response = self.client.get(self.list_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row['id'] for row in response.data['results']], [self.task.id])
+        self.assertEqual(self.client.get(self.detail_url(self.hidden_task)).status_code, 404)
+    
+    def test_managers_see_all_tasks(self):
+        self.client.force_authenticate(self.manager)
+        response = self.client.get(self.list_url)
+        self.assertEqual(len(response.data['results']), 2)
+    
+    def test_list_rows_match_serializer(self):
+        self.client.force_authenticate(self.developer)
+        row = self.client.get(self.list_url).data['results'][0]
+        self.assertEqual(row, TaskSerializer(self.task).data)
+        self.assertEqual(row['assigned_to_username'], 'developer')
+        self.assertEqual(row['estimated_hours'], '4.00')
+    
+    def test_sparse_fieldsets(self):
+        self.client.force_authenticate(self.developer)
+        response = self.client.get(self.list_url, {'fields': 'id,title'})
+        self.assertEqual(response.data['results'], [{'id': self.task.id, 'title': 'Assigned Task'}])
+        response = self.client.get(self.detail_url(self.task), {'fields': 'status'})
+        self.assertEqual(response.data, {'status': 'pending'})
+        self.assertEqual(self.client.get(self.list_url, {'fields': 'id,secret'}).status_code, 400)
+    
+    def test_filters_and_cursor_pagination(self):
+        for i in range(3):
+            Task.objects.create(title=f'Extra Task {i}', created_by=self.manager, status='completed')
+        self.client.force_authenticate(self.manager)
+        response = self.client.get(self.list_url, {'status': 'completed', 'page_size': 2})
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIn('cursor=', response.data['next'])
+        next_page = self.client.get(response.data['next'])
+        self.assertEqual([row['title'] for row in next_page.data['results']], ['Extra Task 0'])
+        
+        response = self.client.get(self.list_url, {'tag': 'Backend'})
+        self.assertEqual([row['id'] for row in response.data['results']], [self.task.id])
+    
+    def test_list_query_count_is_constant(self):
+        for i in range(20):
+            Task.objects.create(title=f'Extra Task {i}', created_by=self.manager, assigned_to=self.other)
+        self.client.force_authenticate(self.manager)
+        with self.assertMaxQueries(2):
+            self.client.get(self.list_url)
+    
+    def test_create_requires_manager(self):
+        data = {'title': 'API Task', 'priority': 'high', 'assigned_to': self.developer.id}
+        self.client.force_authenticate(self.developer)
+        self.assertEqual(self.client.post(self.list_url, data).status_code, 403)
+        
+        self.client.force_authenticate(self.manager)
+        response = self.client.post(self.list_url, data)
+        self.assertEqual(response.status_code, 201)
+        task = Task.objects.get(pk=response.data['id'])
+        self.assertEqual(task.created_by, self.manager)
+        self.assertEqual(task.assigned_to, self.developer)
+    
+    def test_update_sets_completed_at(self):
+        self.client.force_authenticate(self.developer)
+        response = self.client.patch(self.detail_url(self.task), {'status': 'completed'})
+        self.assertEqual(response.status_code, 200)
+        self.task.refresh_from_db()
+        self.assertIsNotNone(self.task.completed_at)
+    
+    def test_only_creator_deletes(self):
+        self.client.force_authenticate(self.developer)
+        self.assertEqual(self.client.delete(self.detail_url(self.task)).status_code, 403)
+        self.client.force_authenticate(self.manager)
+        self.assertEqual(self.client.delete(self.detail_url(self.task)).status_code, 204)
+        self.assertFalse(Task.objects.filter(pk=self.task.pk).exists())
+    
+    def test_jwt_authentication(self):
+        response = self.client.post(reverse('api:token_obtain_pair'), {
+            'username': 'developer',
+            'password': 'testpass123',
+        })
+        self.assertEqual(response.status_code, 200)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+        self.assertEqual(self.client.get(self.list_url).status_code, 200)
+    
+    def test_profiles(self):
+        self.client.force_authenticate(self.developer)
+        response = self.client.get(reverse('api:profile-me'))
+        self.assertEqual(response.data['username'], 'developer')
+        response = self.client.get(reverse('api:profile-list'), {'fields': 'username,role'})
+        self.assertEqual(response.data['results'][0], {'username': 'manager', 'role': 'manager'})
+    
+    def test_task_rows_keep_none(self):
+        fields = list(TASK_LIST_COLUMNS)
+        row = task_rows(Task.objects.filter(pk=self.hidden_task.pk).values(*task_list_columns(fields)), fields)[0]
+        self.assertIsNone(row['due_date'])
+        self.assertIsNone(row['assigned_to_username'])
@@ -0,0 +1,150 @@
+from datetime import timedelta
+from unittest import mock
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from core.counters import UserTaskCounter, find_counter_drift
+from core.models import Task, TaskTag
+from core.tag_index import shared_index, suggest_tags
+from core.tests.utils import QueryBudgetMixin
+
+
+class BulkTaskAPITest(QueryBudgetMixin, TestCase):
+    """Test cases for the bulk task endpoint"""
+
+    def setUp(self):
+        """Set up test data"""
+        cache.clear()
+        shared_index.reset()
+        self.manager = User.objects.create_user(
+            username='manager',
+            email='manager@example.com',
+            password='testpass123'
+        )
+        self.manager.profile.role = 'manager'
+        self.manager.profile.save()
+        self.developer = User.objects.create_user(
+            username='developer',
+            email='developer@example.com',
+            password='testpass123'
+        )
+        self.task = Task.objects.create(title='Existing Task', created_by=self.manager, tags='backend')
+        UserTaskCounter.for_user(self.manager)
+        UserTaskCounter.for_user(self.developer)
+        suggest_tags()
+        self.client = APIClient()
+        self.client.force_authenticate(self.manager)
+        self.url = reverse('api:task-bulk')
+
+    def tearDown(self):
+        shared_index.reset()
+
+    def test_create(self):
+        rows = [
+            {'title': f'Task {i}', 'assigned_to': self.developer.id, 'status': 'in_progress', 'tags': 'bug, ui'}
+            for i in range(20)
+        ]
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertMaxQueries(12):
+                response = self.client.post(self.url, rows, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['created'], 20)
+        created = Task.objects.filter(pk__in=response.data['ids'])
+        self.assertEqual(created.filter(created_by=self.manager, assigned_to=self.developer).count(), 20)
+        self.assertEqual(TaskTag.objects.filter(task__in=created).count(), 40)
+        self.assertEqual(find_counter_drift(), {})
+        self.assertEqual(suggest_tags('', limit=2), [('bug', 20), ('ui', 20)])
+
+    def test_create_requires_manager(self):
+        self.client.force_authenticate(self.developer)
+        response = self.client.post(self.url, [{'title': 'Task'}], format='json')
+        self.assertEqual(response.status_code, 403)
+
+    def test_errors_are_reported_per_row_and_nothing_is_written(self):
+        rows = [
+            {'title': 'Valid task'},
+            {'title': 'ab', 'estimated_hours': -1},
+            {'description': 'No title', 'assigned_to': 9999},
+            {'title': 'Bad status', 'status': 'done'},
+        ]
+        with self.assertMaxQueries(3):
+            response = self.client.post(self.url, rows, format='json')
+        self.assertEqual(response.status_code, 400)
+        errors = {row['index']: row['errors'] for row in response.data['errors']}
+        self.assertEqual(sorted(errors), [1, 2, 3])
+        self.assertEqual(errors[1]['title'], ['Task title must be at least 3 characters long.'])
+        self.assertEqual(errors[1]['estimated_hours'], ['Estimated hours cannot be negative.'])
+        self.assertEqual(set(errors[2]), {'title', 'assigned_to'})
+        self.assertIn('status', errors[3])
+        self.assertEqual(Task.objects.count(), 1)
+
+    def test_row_limit(self):
+        with mock.patch('core.api.views.MAX_BULK_ROWS', 2):
+            response = self.client.post(self.url, [{'title': 'Task'}] * 3, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.client.post(self.url, {'title': 'Task'}, format='json').status_code, 400)
+
+    def test_update(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            other = Task.objects.create(title='Other Task', created_by=self.manager, tags='frontend')
+        rows = [
+            {'id': self.task.id, 'status': 'completed', 'tags': 'frontend'},
+            {'id': other.id, 'assigned_to': self.developer.id, 'priority': 'urgent'},
+        ]
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(self.url, rows, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {'updated': 2})
+        self.task.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(self.task.status, 'completed')
+        self.assertIsNotNone(self.task.completed_at)
+        self.assertGreater(self.task.updated_at, self.task.created_at)
+        self.assertEqual(other.assigned_to, self.developer)
+        self.assertEqual(other.priority, 'urgent')
+        self.assertEqual(list(self.task.tag_set.values_list('name', flat=True)), ['frontend'])
+        self.assertEqual(find_counter_drift(), {})
+        self.assertEqual(suggest_tags(), [('frontend', 2)])
+
+    def test_update_checks_visibility_and_due_date(self):
+        hidden = Task.objects.create(title='Hidden Task', created_by=self.manager)
+        self.client.force_authenticate(self.developer)
+        response = self.client.patch(self.url, [{'id': hidden.id, 'title': 'Mine now'}], format='json')
+        self.assertEqual(response.data['errors'], [{'index': 0, 'errors': {'id': ['Not found.']}}])
+
+        self.client.force_authenticate(self.manager)
+        past = (self.task.created_at - timedelta(days=1)).isoformat()
+        response = self.client.patch(
+            self.url, [{'id': self.task.id, 'due_date': past}, {'id': self.task.id}], format='json'
+        )
+        self.assertEqual(response.data['errors'], [{'index': 1, 'errors': {'id': ['Duplicate id.']}}])
+        response = self.client.patch(self.url, [{'id': self.task.id, 'due_date': past}], format='json')
+        self.assertEqual(
+            response.data['errors'][0]['errors'],
+            {'due_date': ['Due date cannot be earlier than task creation date.']}
+        )
+
+    def test_delete(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            assigned = Task.objects.create(
+                title='Assigned Task',
+                created_by=self.manager,
+                assigned_to=self.developer,
+                tags='backend',
+                due_date=timezone.now() + timedelta(days=1)
+            )
+        self.client.force_authenticate(self.developer)
+        response = self.client.delete(self.url, {'ids': [assigned.id]}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+        self.client.force_authenticate(self.manager)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(self.url, {'ids': [self.task.id, assigned.id]}, format='json')
+        self.assertEqual(response.data, {'deleted': 2})
+        self.assertFalse(Task.objects.exists())
+        self.assertFalse(TaskTag.objects.exists())
+        self.assertEqual(find_counter_drift(), {})
+        self.assertEqual(suggest_tags(), [])
@@ -0,0 +1,89 @@
+import shutil
+import tempfile
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from core.cache_bus import CacheBus
+from core.models import Task
+from core.tag_index import SharedTagIndex
+from task_manager.cache import parse_cache_url, cache_key_prefix
+
+
+class CacheConfigTest(SimpleTestCase):
+    """Test cases for building CACHES from a URL"""
+    
+    def test_redis_url(self):
+        config = parse_cache_url('redis://cache:6379/1?timeout=60')
+        self.assertEqual(config, {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': 'redis://cache:6379/1',
+            'TIMEOUT': 60,
+        })
+    
+    def test_memcached_and_file_urls(self):
+        self.assertEqual(parse_cache_url('memcached://a:11211,b:11211')['LOCATION'], ['a:11211', 'b:11211'])
+        config = parse_cache_url('file:///var/tmp/django_cache?MAX_ENTRIES=500')
+        self.assertEqual(config['LOCATION'], '/var/tmp/django_cache')
+        self.assertEqual(config['OPTIONS'], {'MAX_ENTRIES': '500'})
+    
+    def test_unknown_scheme(self):
+        with self.assertRaises(ValueError):
+            parse_cache_url('mongodb://localhost')
+    
+    def test_key_prefix_per_release(self):
+        self.assertEqual(cache_key_prefix('app', {}), 'app')
+        self.assertEqual(cache_key_prefix('app', {'HEROKU_RELEASE_VERSION': 'v12'}), 'app:v12')
+        self.assertEqual(cache_key_prefix('app', {'DJANGO_RELEASE': 'abc', 'HEROKU_RELEASE_VERSION': 'v12'}), 'app:abc')
+
+
+class CacheBusTest(TestCase):
+    """Test cases for the invalidation bus on a cache shared between processes"""
+    
+    def setUp(self):
+        """Use a file-based cache as a stand-in for a shared Redis"""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        settings_override = override_settings(CACHES={'default': parse_cache_url(f'file://{directory}')})
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+    
+    def test_messages_between(self):
+        bus = CacheBus('test')
+        start = bus.head()
+        bus.publish({'a': 1})
+        bus.publish({'b': 1})
+        self.assertEqual(bus.messages_between(start, bus.head()), [{'a': 1}, {'b': 1}])
+        
+        bus.invalidate()
+        self.assertIsNone(bus.messages_between(start, bus.head()))
+    
+    def test_replay_limit(self):
+        bus = CacheBus('test', max_replay=1)
+        start = bus.head()
+        bus.publish({'a': 1})
+        bus.publish({'b': 1})
+        self.assertIsNone(bus.messages_between(start, bus.head()))
+    
+    def test_workers_share_tag_counts(self):
+        # Two SharedTagIndex instances stand in for two worker processes
+        worker1, worker2 = SharedTagIndex(), SharedTagIndex()
+        Task.objects.create(title='Task', tags='bug', created_by=self.user)
+        worker1.get()
+        worker2.get()
+        
+        # The save publishes its delta through the module-level index
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.create(title='Other', tags='bug, backend', created_by=self.user)
+        
+        with self.assertNumQueries(0):
+            self.assertEqual(worker2.get().suggest('b'), [('bug', 2), ('backend', 1)])
+        
+        worker1.invalidate()
+        with self.assertNumQueries(1):
+            worker2.get()
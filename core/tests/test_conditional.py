@@ -0,0 +1,134 @@
+from django.test import TestCase, Client
+from django.contrib.auth.models import User
+from django.db import connection
+from django.urls import reverse
+from rest_framework.test import APIClient
+from core.models import Task
+from core.profile import UserProfile
+from core.tests.utils import QueryBudgetMixin
+
+
+class ConditionalGetTest(QueryBudgetMixin, TestCase):
+    """Test cases for ETag and Last-Modified handling on task pages"""
+    
+    def setUp(self):
+        """Set up test data"""
+        self.manager = User.objects.create_user(
+            username='manager',
+            email='manager@example.com',
+            password='testpass123'
+        )
+        self.manager.profile.role = 'manager'
+        self.manager.profile.save()
+        self.developer = User.objects.create_user(
+            username='developer',
+            email='developer@example.com',
+            password='testpass123'
+        )
+        self.task = Task.objects.create(title='Assigned Task', created_by=self.manager, assigned_to=self.developer)
+        self.other = Task.objects.create(title='Other Task', created_by=self.manager)
+        self.client = Client()
+    
+    def revalidate(self, url, response, **params):
+        return self.client.get(url, params, HTTP_IF_NONE_MATCH=response['ETag'])
+    
+    def assertSingleIndexedAggregate(self, captured):
+        """The only task query is one aggregate that SQLite answers from indexes"""
+        task_queries = [query['sql'] for query in captured.captured_queries if 'core_task' in query['sql']]
+        self.assertEqual(len(task_queries), 1, task_queries)
+        self.assertIn('MAX(', task_queries[0])
+        self.assertIn('COUNT(', task_queries[0])
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute(f'EXPLAIN QUERY PLAN {task_queries[0]}')
+                plan = ' '.join(row[-1] for row in cursor.fetchall())
+            self.assertIn('INDEX', plan)
+            self.assertNotRegex(plan, r'SCAN core_task(?! USING)')
+    
+    def test_task_list_not_modified(self):
+        for user in (self.manager, self.developer):
+            with self.subTest(user=user.username):
+                self.client.login(email=user.email, password='testpass123')
+                url = reverse('core:task_list')
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertIn('no-cache', response['Cache-Control'])
+                
+                with self.assertMaxQueries(4) as captured:
+                    not_modified = self.revalidate(url, response)
+                self.assertEqual(not_modified.status_code, 304)
+                self.assertEqual(not_modified.content, b'')
+                self.assertSingleIndexedAggregate(captured)
+                
+                # Filters are part of the tag
+                self.assertEqual(self.revalidate(url, response, status='pending').status_code, 200)
+    
+    def test_task_list_creates_missing_profile(self):
+        # Logging in saves the user, which recreates a missing profile
+        self.client.login(email='developer@example.com', password='testpass123')
+        UserProfile.objects.filter(user=self.developer).delete()
+        url = reverse('core:task_list')
+        response = self.client.get(url)
+        self.assertContains(response, 'Assigned Task')
+        self.assertNotIn('ETag', response)
+        self.assertTrue(UserProfile.objects.filter(user=self.developer).exists())
+        self.assertEqual(self.revalidate(url, self.client.get(url)).status_code, 304)
+    
+    def test_changes_invalidate_the_etag(self):
+        self.client.login(email='manager@example.com', password='testpass123')
+        url = reverse('core:task_list')
+        response = self.client.get(url)
+        self.task.title = 'Renamed Task'
+        self.task.save()
+        response = self.revalidate(url, response)
+        self.assertEqual(response.status_code, 200)
+        self.other.delete()
+        self.assertEqual(self.revalidate(url, response).status_code, 200)
+    
+    def test_pending_messages_are_rendered(self):
+        self.client.login(email='developer@example.com', password='testpass123')
+        url = reverse('core:task_list')
+        response = self.client.get(url)
+        # Developers cannot create tasks and are redirected with an error
+        self.client.get(reverse('core:task_create'))
+        response = self.revalidate(url, response)
+        self.assertContains(response, 'You do not have permission to create tasks.')
+    
+    def test_dashboard_not_modified(self):
+        self.client.login(email='developer@example.com', password='testpass123')
+        url = reverse('core:dashboard')
+        response = self.client.get(url)
+        with self.assertMaxQueries(4) as captured:
+            self.assertEqual(self.revalidate(url, response).status_code, 304)
+        self.assertSingleIndexedAggregate(captured)
+    
+    def test_task_detail_last_modified(self):
+        self.client.login(email='developer@example.com', password='testpass123')
+        url = reverse('core:task_detail', args=[self.task.id])
+        response = self.client.get(url)
+        self.assertIn('Last-Modified', response)
+        self.assertEqual(self.revalidate(url, response).status_code, 304)
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+        # Hidden tasks still go through the view's permission redirect
+        hidden = reverse('core:task_detail', args=[self.other.id])
+        self.assertEqual(self.client.get(hidden, HTTP_IF_NONE_MATCH='*').status_code, 302)
+    
+    def test_api_not_modified(self):
+        client = APIClient()
+        client.force_authenticate(self.developer)
+        url = reverse('api:task-list')
+        response = client.get(url)
+        with self.assertMaxQueries(1) as captured:
+            not_modified = client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertSingleIndexedAggregate(captured)
+        self.assertEqual(client.get(url, {'fields': 'id'}, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 200)
+        
+        url = reverse('api:task-detail', args=[self.task.id])
+        response = client.get(url)
+        self.assertEqual(client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+        self.task.status = 'completed'
+        self.task.save()
+        self.assertEqual(client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 200)
+        self.assertEqual(client.get(reverse('api:task-detail', args=[self.other.id])).status_code, 404)
@@ -0,0 +1,194 @@
+from io import StringIO
+from unittest import mock
+from django.test import TestCase, Client
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.urls import reverse
+from django.utils import timezone
+from datetime import timedelta
+from core.bulk import bulk_create_tasks, retag_tasks, update_tasks
+from core.models import Task
+from core.counters import UserTaskCounter, compute_counters, find_counter_drift
+
+
+class UserTaskCounterTest(TestCase):
+    """Test cases for materialized per-user task counters"""
+    
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.user2 = User.objects.create_user(
+            username='testuser2',
+            email='test2@example.com',
+            password='testpass123'
+        )
+        Task.objects.create(title='Existing Task', created_by=self.user, status='pending')
+        
+        # Build both rows so subsequent changes are applied as deltas
+        UserTaskCounter.for_user(self.user)
+        UserTaskCounter.for_user(self.user2)
+    
+    def assertCountersInSync(self):
+        """Assert that stored counters match a fresh computation"""
+        self.assertEqual(find_counter_drift(), {})
+    
+    def test_for_user_builds_row(self):
+        """Test lazy creation of a counter row from existing tasks"""
+        counter = UserTaskCounter.objects.get(user=self.user)
+        self.assertEqual(counter.total_tasks, 1)
+        self.assertEqual(counter.pending_tasks, 1)
+        self.assertEqual(counter.medium_priority_tasks, 1)
+    
+    def test_for_user_keeps_changes_made_while_counting(self):
+        """Test that a task created once the row exists is neither lost nor counted twice"""
+        new_user = User.objects.create_user(username='newuser', email='new@example.com', password='testpass123')
+        UserTaskCounter.objects.filter(user=new_user).delete()
+        
+        def count_after_change(user_ids):
+            Task.objects.create(title='Concurrent Task', created_by=new_user)
+            return compute_counters(user_ids)
+        
+        with mock.patch('core.counters.compute_counters', side_effect=count_after_change):
+            counter = UserTaskCounter.for_user(new_user)
+        self.assertEqual(counter.total_tasks, 1)
+        self.assertCountersInSync()
+    
+    def test_create_updates_creator_and_assignee(self):
+        """Test that a new task increments both of its users"""
+        Task.objects.create(
+            title='Assigned Task',
+            created_by=self.user,
+            assigned_to=self.user2,
+            priority='urgent',
+            due_date=timezone.now() + timedelta(days=1)
+        )
+        self.assertEqual(UserTaskCounter.objects.get(user=self.user).total_tasks, 2)
+        counter2 = UserTaskCounter.objects.get(user=self.user2)
+        self.assertEqual(counter2.total_tasks, 1)
+        self.assertEqual(counter2.urgent_priority_tasks, 1)
+        self.assertEqual(counter2.open_due_tasks, 1)
+        self.assertCountersInSync()
+    
+    def test_self_assigned_task_counted_once(self):
+        """Test that creator and assignee being the same user counts once"""
+        Task.objects.create(title='Own Task', created_by=self.user, assigned_to=self.user)
+        self.assertEqual(UserTaskCounter.objects.get(user=self.user).total_tasks, 2)
+        self.assertCountersInSync()
+    
+    def test_status_change_and_reassignment(self):
+        """Test that edits move counts between buckets and users"""
+        task = Task.objects.create(title='Moving Task', created_by=self.user, assigned_to=self.user)
+        task.status = 'completed'
+        task.assigned_to = self.user2
+        task.save()
+        
+        counter = UserTaskCounter.objects.get(user=self.user)
+        self.assertEqual(counter.completed_tasks, 1)
+        self.assertEqual(counter.pending_tasks, 1)
+        self.assertEqual(UserTaskCounter.objects.get(user=self.user2).completed_tasks, 1)
+        self.assertCountersInSync()
+    
+    def test_edit_of_freshly_loaded_task(self):
+        """Test deltas for an instance loaded from the database"""
+        task = Task.objects.get(title='Existing Task')
+        task.status = 'in_progress'
+        task.save()
+        task.save(update_fields=['status'])
+        self.assertEqual(UserTaskCounter.objects.get(user=self.user).in_progress_tasks, 1)
+        self.assertCountersInSync()
+    
+    def test_edit_after_refresh(self):
+        """Test deltas for an instance refreshed after another save changed it"""
+        task = Task.objects.get(title='Existing Task')
+        other = Task.objects.get(pk=task.pk)
+        other.assigned_to = self.user2
+        other.save()
+        
+        task.refresh_from_db()
+        task.status = 'completed'
+        task.save()
+        self.assertEqual(UserTaskCounter.objects.get(user=self.user2).completed_tasks, 1)
+        
+        task.refresh_from_db(fields=['assigned_to'])
+        task.assigned_to = None
+        task.save()
+        self.assertEqual(UserTaskCounter.objects.get(user=self.user2).total_tasks, 0)
+        self.assertCountersInSync()
+    
+    def test_delete_and_bulk_delete(self):
+        """Test that single and queryset deletes decrement counters"""
+        Task.objects.create(title='Second Task', created_by=self.user, assigned_to=self.user2)
+        Task.objects.get(title='Existing Task').delete()
+        Task.objects.filter(created_by=self.user).delete()
+        self.assertEqual(UserTaskCounter.objects.get(user=self.user).total_tasks, 0)
+        self.assertEqual(UserTaskCounter.objects.get(user=self.user2).total_tasks, 0)
+        self.assertCountersInSync()
+    
+    def test_chunked_set_based_updates(self):
+        """Test chunked UPDATEs keep counters in step and only touch changed rows"""
+        bulk_create_tasks([
+            Task(title=f'Task {i}', created_by=self.user, status='completed' if i < 2 else 'pending')
+            for i in range(5)
+        ])
+        done = []
+        changed = update_tasks(Task.objects.all(), {'status': 'completed', 'assigned_to': self.user2}, chunk_size=2, progress=done.append)
+        self.assertEqual(changed, 6)
+        self.assertEqual(done, [2, 4, 6])
+        self.assertFalse(Task.objects.filter(completed_at=None).exists())
+        self.assertCountersInSync()
+        
+        self.assertEqual(update_tasks(Task.objects.filter(priority='medium'), {'priority': 'urgent'}, chunk_size=4), 6)
+        self.assertEqual(retag_tasks(Task.objects.all(), add=['triage']), 6)
+        self.assertEqual(retag_tasks(Task.objects.all(), add=['Triage']), 0)
+        self.assertCountersInSync()
+    
+    def test_user_deletion(self):
+        """Test that deleting a user cascades cleanly through the counters"""
+        Task.objects.create(title='Shared Task', created_by=self.user2, assigned_to=self.user)
+        self.user2.delete()
+        self.assertFalse(UserTaskCounter.objects.filter(user_id=self.user2.id).exists())
+        self.assertCountersInSync()
+    
+    def test_task_complete_view(self):
+        """Test that completing through the view keeps counters in sync"""
+        task = Task.objects.get(title='Existing Task')
+        client = Client()
+        client.login(email='test@example.com', password='testpass123')
+        client.get(reverse('core:task_complete', args=[task.id]))
+        self.assertEqual(UserTaskCounter.objects.get(user=self.user).completed_tasks, 1)
+        self.assertCountersInSync()
+    
+    def test_dashboard_reads_counters(self):
+        """Test dashboard counters and overdue detection"""
+        Task.objects.create(
+            title='Overdue Task',
+            created_by=self.user,
+            due_date=timezone.now() - timedelta(days=1)
+        )
+        client = Client()
+        client.login(email='test@example.com', password='testpass123')
+        response = client.get(reverse('core:dashboard'))
+        self.assertEqual(response.context['total_tasks'], 2)
+        self.assertEqual(response.context['overdue_tasks'], 1)
+    
+    def test_rebuild_command_check_and_fix(self):
+        """Test drift detection and repair by the management command"""
+        Task.objects.filter(created_by=self.user).update(status='completed')
+        with self.assertRaises(CommandError):
+            call_command('rebuild_task_counters', '--check', stdout=StringIO())
+        
+        call_command('rebuild_task_counters', '--check', '--fix', stdout=StringIO())
+        self.assertCountersInSync()
+        
+        UserTaskCounter.objects.all().delete()
+        call_command('rebuild_task_counters', stdout=StringIO())
+        self.assertEqual(UserTaskCounter.objects.count(), User.objects.count())
+        self.assertEqual(
+            UserTaskCounter.objects.get(user=self.user).as_dict(),
+            compute_counters()[self.user.id]
+        )
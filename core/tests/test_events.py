@@ -0,0 +1,180 @@
+import asyncio
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.db import connections
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+
+from core.bulk import bulk_update_tasks
+from core.events import RESYNC, Subscription, broker, task_event
+from core.models import Task
+
+
+def state(**values):
+    return {
+        'created_by_id': 1, 'assigned_to_id': None, 'status': 'pending',
+        'priority': 'medium', 'due_date': None, 'tags': '', **values,
+    }
+
+
+class TaskEventTest(SimpleTestCase):
+    """Test cases for building events and bounding slow subscriptions"""
+
+    def test_event_kinds(self):
+        self.assertEqual(task_event(5, None, state())['type'], 'created')
+        self.assertEqual(task_event(5, state(), None)['type'], 'deleted')
+        self.assertEqual(task_event(5, state(), state(status='completed'))['type'], 'completed')
+        self.assertEqual(task_event(5, state(status='completed'), state(status='completed', priority='high'))['type'], 'updated')
+
+    def test_reassigned_task_reaches_old_and_new_assignee(self):
+        event = task_event(5, state(assigned_to_id=2), state(assigned_to_id=3))
+        self.assertEqual(event['users'], [1, 2, 3])
+
+    async def test_slow_subscriber_is_told_to_resync(self):
+        subscription = Subscription(asyncio.get_running_loop(), 1, False, max_pending=3)
+        for task_id in range(5):
+            subscription.offer(task_event(task_id, None, state()))
+        self.assertEqual(await subscription.get(0.1), [RESYNC])
+        self.assertEqual(subscription.dropped, 5)
+        subscription.offer(task_event(6, None, state()))
+        self.assertEqual([event['task'] for event in await subscription.get(0.1)], [6])
+        self.assertEqual(await subscription.get(0.01), [])
+
+
+class TaskEventStreamTest(TestCase):
+    """Test cases for publishing task changes to open event streams"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.other = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+        self.manager = User.objects.create_user(
+            username='manager',
+            email='manager@example.com',
+            password='testpass123'
+        )
+        self.manager.profile.role = 'manager'
+        self.manager.profile.save()
+        self.task = Task.objects.create(title='Live Task', created_by=self.user)
+
+    def save_task(self, **changes):
+        with self.captureOnCommitCallbacks(execute=True):
+            for field, value in changes.items():
+                setattr(self.task, field, value)
+            self.task.save()
+
+    async def disconnect(self, chunks):
+        """Cancel the stream while it waits for events, as the ASGI handler does on disconnect"""
+        waiting = asyncio.ensure_future(anext(chunks))
+        await asyncio.sleep(0.01)
+        waiting.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiting
+        self.assertEqual(broker.count(), 0)
+
+    async def test_saves_reach_people_who_can_see_the_task(self):
+        mine = broker.subscribe(self.user.pk)
+        theirs = broker.subscribe(self.other.pk)
+        everything = broker.subscribe(self.manager.pk, sees_all=True)
+        try:
+            await sync_to_async(self.save_task)(status='completed')
+            events = await mine.get(1)
+            self.assertEqual(events, [{
+                'type': 'completed', 'task': self.task.pk, 'status': 'completed',
+                'priority': 'medium', 'users': [self.user.pk],
+            }])
+            self.assertEqual(await everything.get(1), events)
+            self.assertEqual(await theirs.get(0.05), [])
+        finally:
+            for subscription in (mine, theirs, everything):
+                broker.unsubscribe(subscription)
+        self.assertEqual(broker.count(), 0)
+
+    async def test_bulk_changes_publish_one_event_per_task(self):
+        subscription = broker.subscribe(self.other.pk)
+        try:
+            def reassign():
+                self.task.assigned_to = self.other
+                with self.captureOnCommitCallbacks(execute=True):
+                    bulk_update_tasks([self.task], ['assigned_to'])
+            await sync_to_async(reassign)()
+            events = await subscription.get(1)
+            self.assertEqual([(event['type'], event['task']) for event in events], [('updated', self.task.pk)])
+        finally:
+            broker.unsubscribe(subscription)
+
+    @override_settings(TASK_EVENTS_BUS='cache', TASK_EVENTS_POLL_INTERVAL=0.01)
+    async def test_shared_bus(self):
+        subscription = broker.subscribe(self.user.pk)
+        try:
+            # Let the poller read the bus head before publishing
+            await asyncio.sleep(0.05)
+            await sync_to_async(self.save_task)(priority='high')
+            events = await subscription.get(1)
+            self.assertEqual([(event['type'], event['priority']) for event in events], [('updated', 'high')])
+        finally:
+            broker.unsubscribe(subscription)
+        self.assertEqual(broker.pollers, {})
+
+    async def test_stream(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse('core:task_events'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        chunks = aiter(response.streaming_content)
+        self.assertEqual(await anext(chunks), b'id: 0\nretry: 5000\n\n')
+
+        await sync_to_async(self.save_task)(title='Renamed')
+        chunk = await asyncio.wait_for(anext(chunks), 1)
+        self.assertEqual(chunk, f'event: updated\ndata: {{"type": "updated", "task": {self.task.pk}, "status": "pending", "priority": "medium"}}\n\n'.encode())
+        await self.disconnect(chunks)
+
+    async def test_reconnect_starts_with_resync(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse('core:task_events'), headers={'Last-Event-ID': '0'})
+        chunks = aiter(response.streaming_content)
+        await anext(chunks)
+        self.assertEqual(await anext(chunks), b'event: resync\ndata: {"type": "resync"}\n\n')
+        await self.disconnect(chunks)
+
+    @override_settings(TASK_EVENTS_MAX_SUBSCRIBERS=0)
+    async def test_full_process_refuses_streams(self):
+        await self.async_client.aforce_login(self.user)
+        with self.assertLogs('django.request', 'ERROR'):
+            response = await self.async_client.get(reverse('core:task_events'))
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], '30')
+
+    def test_wsgi_does_not_stream(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('core:task_events'))
+        self.assertEqual(response.status_code, 204)
+        self.assertNotContains(self.client.get(reverse('core:task_list')), 'data-task-events-url')
+
+
+class TaskEventConnectionTest(TransactionTestCase):
+    """Test that open streams don't hold a database connection"""
+
+    async def test_stream_releases_connection(self):
+        user = await User.objects.acreate_user(username='testuser', email='test@example.com', password='testpass123')
+        await self.async_client.aforce_login(user)
+        wrapper = type(connections['default'])
+        # SQLite ignores close() on the in-memory test database, so watch the call
+        with mock.patch.object(wrapper, 'close', autospec=True, side_effect=wrapper.close) as close:
+            response = await self.async_client.get(reverse('core:task_events'))
+            chunks = aiter(response.streaming_content)
+            await anext(chunks)
+            # The view's queries ran in the thread-sensitive thread
+            request_connection = await sync_to_async(lambda: connections['default'])()
+            close.assert_called_once_with(request_connection)
+        await TaskEventStreamTest.disconnect(self, chunks)
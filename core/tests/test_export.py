@@ -0,0 +1,113 @@
+import csv
+import json
+import os
+import tempfile
+import warnings
+from io import StringIO
+from django.test import TestCase, Client
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.urls import reverse
+from core.export import EXPORT_COLUMNS, aexport_lines
+from core.models import Task
+
+
+class TaskExportTest(TestCase):
+    """Test cases for the streaming task export"""
+    
+    def setUp(self):
+        """Set up test data"""
+        self.manager = User.objects.create_user(
+            username='manager',
+            email='manager@example.com',
+            password='testpass123'
+        )
+        self.manager.profile.role = 'manager'
+        self.manager.profile.save()
+        self.developer = User.objects.create_user(
+            username='developer',
+            email='developer@example.com',
+            password='testpass123'
+        )
+        self.task = Task.objects.create(
+            title='Assigned, "quoted" task',
+            created_by=self.manager,
+            assigned_to=self.developer,
+            status='pending',
+            tags='backend, bug',
+            estimated_hours=4
+        )
+        self.other = Task.objects.create(title='Other Task', created_by=self.manager, status='completed')
+        self.client = Client()
+        self.url = reverse('core:task_export')
+    
+    def export(self, user, **params):
+        self.client.login(email=user.email, password='testpass123')
+        response = self.client.get(self.url, params)
+        self.assertTrue(response.streaming)
+        return response, b''.join(response.streaming_content).decode()
+    
+    def test_csv_for_member_has_only_visible_tasks(self):
+        response, content = self.export(self.developer)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertIn('attachment; filename="tasks-', response['Content-Disposition'])
+        rows = list(csv.DictReader(StringIO(content)))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['title'], 'Assigned, "quoted" task')
+        self.assertEqual(rows[0]['assigned_to'], 'developer')
+        self.assertEqual(rows[0]['estimated_hours'], '4.00')
+        self.assertEqual(rows[0]['due_date'], '')
+    
+    def test_manager_export_uses_task_list_filters(self):
+        _, content = self.export(self.manager)
+        self.assertEqual(len(list(csv.DictReader(StringIO(content)))), 2)
+        _, content = self.export(self.manager, status='completed')
+        self.assertEqual([row['title'] for row in csv.DictReader(StringIO(content))], ['Other Task'])
+        _, content = self.export(self.manager, tag='BUG')
+        self.assertEqual([row['id'] for row in csv.DictReader(StringIO(content))], [str(self.task.id)])
+    
+    def test_json_lines(self):
+        response, content = self.export(self.manager, format='jsonl', search='other')
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['title'], 'Other Task')
+        self.assertIsNone(rows[0]['assigned_to'])
+    
+    def test_unknown_format(self):
+        self.client.login(email='manager@example.com', password='testpass123')
+        self.assertEqual(self.client.get(self.url, {'format': 'xml'}).status_code, 400)
+    
+    def test_command(self):
+        out = StringIO()
+        call_command('export_tasks', '--format', 'jsonl', '--user', 'developer', stdout=out)
+        self.assertEqual([json.loads(line)['id'] for line in out.getvalue().splitlines()], [self.task.id])
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'tasks.csv')
+            err = StringIO()
+            call_command('export_tasks', '--output', path, '--status', 'pending', stderr=err)
+            with open(path, newline='') as output:
+                self.assertEqual(len(list(csv.DictReader(output))), 1)
+        self.assertIn('1 tasks written', err.getvalue())
+        
+        with self.assertRaises(CommandError):
+            call_command('export_tasks', '--assignment', 'assigned_to_me')
+    
+    async def test_asgi_streams_in_chunks(self):
+        await self.async_client.aforce_login(self.manager)
+        with warnings.catch_warnings():
+            # Django warns when it has to buffer a sync iterator
+            warnings.simplefilter('error')
+            response = await self.async_client.get(self.url)
+            self.assertTrue(response.is_async)
+            parts = [part async for part in response.streaming_content]
+        self.assertEqual(parts[0].decode(), ','.join(EXPORT_COLUMNS) + '\r\n')
+        self.assertGreater(len(parts), 1)
+        rows = list(csv.DictReader(StringIO(b''.join(parts).decode())))
+        self.assertEqual({row['title'] for row in rows}, {'Assigned, "quoted" task', 'Other Task'})
+    
+    async def test_async_lines_are_chunked(self):
+        chunks = [chunk async for chunk in aexport_lines(Task.objects.order_by('id'), 'jsonl', chunk_size=1)]
+        self.assertEqual([json.loads(chunk)['id'] for chunk in chunks], [self.task.id, self.other.id])
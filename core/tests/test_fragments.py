@@ -0,0 +1,80 @@
+from django.test import TestCase, Client
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.urls import reverse
+from core.fragments import metrics, user_task_version
+from core.models import Task
+
+
+class FragmentCacheTest(TestCase):
+    """Test cases for cached task cards and dashboard panels"""
+    
+    def setUp(self):
+        """Set up test data"""
+        cache.clear()
+        metrics.reset()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.user2 = User.objects.create_user(
+            username='testuser2',
+            email='test2@example.com',
+            password='testpass123'
+        )
+        self.task = Task.objects.create(
+            title='Cached Task',
+            priority='urgent',
+            created_by=self.user,
+            assigned_to=self.user2
+        )
+        self.client = Client()
+        self.client.login(email='test@example.com', password='testpass123')
+    
+    def test_task_cards_cached_until_task_changes(self):
+        self.client.get(reverse('core:task_list'))
+        self.client.get(reverse('core:task_list'))
+        self.assertEqual(metrics.snapshot()['task_card'], {'hits': 1, 'misses': 1, 'hit_rate': 0.5})
+        
+        self.task.title = 'Renamed Task'
+        self.task.save()
+        response = self.client.get(reverse('core:task_list'))
+        self.assertContains(response, 'Renamed Task')
+        self.assertEqual(metrics.snapshot()['task_card']['misses'], 2)
+    
+    def test_task_cards_show_renamed_assignee(self):
+        self.client.get(reverse('core:task_list'))
+        self.user2.first_name, self.user2.last_name = 'Renamed', 'Assignee'
+        self.user2.save()
+        response = self.client.get(reverse('core:task_list'))
+        self.assertContains(response, 'Assigned to: Renamed Assignee')
+        self.assertEqual(metrics.snapshot()['task_card']['misses'], 2)
+    
+    def test_dashboard_panels_skip_queries_on_hit(self):
+        self.client.get(reverse('core:dashboard'))
+        # Session, user, profile, the conditional GET aggregate and the counter row
+        with self.assertNumQueries(5):
+            response = self.client.get(reverse('core:dashboard'))
+        self.assertContains(response, 'Cached Task')
+        self.assertEqual(metrics.snapshot()['dashboard_recent_tasks']['hits'], 1)
+        self.assertEqual(metrics.snapshot()['dashboard_urgent_tasks']['hits'], 1)
+    
+    def test_saves_bump_versions_for_creator_and_assignee(self):
+        creator_version = user_task_version(self.user.pk)
+        assignee_version = user_task_version(self.user2.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.status = 'in_progress'
+            self.task.save()
+        self.assertNotEqual(user_task_version(self.user.pk), creator_version)
+        self.assertNotEqual(user_task_version(self.user2.pk), assignee_version)
+    
+    def test_dashboard_shows_new_and_deleted_tasks(self):
+        self.client.get(reverse('core:dashboard'))
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.create(title='Fresh Task', created_by=self.user)
+        self.assertContains(self.client.get(reverse('core:dashboard')), 'Fresh Task')
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.delete()
+        self.assertNotContains(self.client.get(reverse('core:dashboard')), 'Cached Task')
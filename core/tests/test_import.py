@@ -0,0 +1,130 @@
+import json
+import os
+import shutil
+import tempfile
+from io import StringIO
+from unittest import mock
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from core.counters import UserTaskCounter, find_counter_drift
+from core.models import ImportCheckpoint, Task, TaskTag
+
+
+class ImportTasksCommandTest(TestCase):
+    """Test cases for the import_tasks command"""
+    
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.user2 = User.objects.create_user(
+            username='testuser2',
+            email='test2@example.com',
+            password='testpass123'
+        )
+        UserTaskCounter.for_user(self.user)
+        UserTaskCounter.for_user(self.user2)
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+    
+    def write(self, name, content):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        return path
+    
+    def run_import(self, *args):
+        out, err = StringIO(), StringIO()
+        call_command('import_tasks', *args, stdout=out, stderr=err)
+        return out.getvalue(), err.getvalue()
+    
+    def test_round_trip_from_export(self):
+        Task.objects.create(
+            title='Exported Task',
+            created_by=self.user,
+            assigned_to=self.user2,
+            status='completed',
+            tags='backend, bug',
+            estimated_hours=3
+        )
+        exported = StringIO()
+        call_command('export_tasks', stdout=exported)
+        path = self.write('tasks.csv', exported.getvalue())
+        
+        out, _ = self.run_import(path)
+        self.assertIn('Imported 1 tasks, skipped 0', out)
+        imported = Task.objects.order_by('-id').first()
+        self.assertEqual(imported.created_by, self.user)
+        self.assertEqual(imported.assigned_to, self.user2)
+        self.assertEqual(str(imported.estimated_hours), '3.00')
+        self.assertIsNotNone(imported.completed_at)
+        self.assertEqual(TaskTag.objects.filter(task=imported).count(), 2)
+        self.assertEqual(find_counter_drift(), {})
+        self.assertFalse(ImportCheckpoint.objects.exists())
+    
+    def test_invalid_records_are_reported_and_skipped(self):
+        path = self.write('tasks.jsonl', '\n'.join([
+            json.dumps({'title': 'Valid task', 'created_by': 'testuser', 'due_date': ''}),
+            json.dumps({'title': 'ab', 'created_by': 'testuser'}),
+            json.dumps({'title': 'Unknown people', 'created_by': 'nobody', 'assigned_to': 'ghost'}),
+            '{not json',
+            json.dumps({'title': 'Bad status', 'created_by': 'testuser', 'status': 'done'}),
+        ]))
+        out, err = self.run_import(path)
+        self.assertIn('Imported 1 tasks, skipped 4', out)
+        self.assertIn('Record 2: {"title"', err)
+        self.assertIn('Unknown user \\"ghost\\"', err)
+        self.assertIn('Record 4: {"non_field_errors": ["Invalid JSON', err)
+        self.assertEqual(list(Task.objects.values_list('title', flat=True)), ['Valid task'])
+    
+    def test_default_creator(self):
+        path = self.write('tasks.jsonl', json.dumps({'title': 'Orphan task', 'created_by': 'nobody'}))
+        with self.assertRaises(CommandError):
+            self.run_import(path, '--default-creator', 'nobody')
+        self.run_import(path, '--default-creator', 'testuser2')
+        self.assertEqual(Task.objects.get().created_by, self.user2)
+    
+    def test_resumes_from_checkpoint(self):
+        path = self.write('tasks.jsonl', '\n'.join(
+            json.dumps({'title': f'Task {i}', 'created_by': 'testuser'}) for i in range(5)
+        ))
+        ImportCheckpoint.objects.create(name=path, path=path, records=3, imported=3)
+        out, _ = self.run_import(path, '--batch-size', '1')
+        self.assertIn('Resuming after record 3', out)
+        self.assertIn('Imported 5 tasks', out)
+        self.assertEqual(sorted(Task.objects.values_list('title', flat=True)), ['Task 3', 'Task 4'])
+        self.assertFalse(ImportCheckpoint.objects.exists())
+        
+        ImportCheckpoint.objects.create(name=path, path=os.path.join(self.directory, 'other.jsonl'))
+        with self.assertRaises(CommandError):
+            self.run_import(path)
+        self.run_import(path, '--restart')
+        self.assertEqual(Task.objects.count(), 7)
+    
+    def test_interrupted_batch_is_not_imported_twice(self):
+        path = self.write('tasks.jsonl', '\n'.join(
+            json.dumps({'title': f'Task {i}', 'created_by': 'testuser'}) for i in range(4)
+        ))
+        save_checkpoint = ImportCheckpoint.objects.update_or_create
+        calls = []
+        
+        def die_on_second_batch(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 2:
+                raise KeyboardInterrupt
+            return save_checkpoint(*args, **kwargs)
+        
+        with mock.patch.object(ImportCheckpoint.objects, 'update_or_create', side_effect=die_on_second_batch):
+            with self.assertRaises(KeyboardInterrupt):
+                self.run_import(path, '--batch-size', '2')
+        # The second batch rolled back together with its checkpoint
+        self.assertEqual(Task.objects.count(), 2)
+        
+        out, _ = self.run_import(path, '--batch-size', '2')
+        self.assertIn('Resuming after record 2', out)
+        self.assertEqual(sorted(Task.objects.values_list('title', flat=True)), [f'Task {i}' for i in range(4)])
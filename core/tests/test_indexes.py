@@ -0,0 +1,55 @@
+from io import StringIO
+from unittest import skipUnless
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.http import QueryDict
+from core.models import Task
+from core.management.commands.explain_task_queries import task_view_querysets
+
+
+class TaskIndexTest(TestCase):
+    """Test cases for task indexes and query plans"""
+    
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        Task.objects.create(title='Test Task', created_by=self.user, assigned_to=self.user)
+    
+    def explain(self, label, **params):
+        query_params = QueryDict(mutable=True)
+        query_params.update(params)
+        return task_view_querysets(self.user, query_params)[label].explain()
+    
+    @skipUnless(connection.vendor == 'sqlite', 'Plan text is SQLite specific')
+    def test_my_tasks_uses_assignee_index(self):
+        """Test that my_tasks is served by the assignee index without a sort"""
+        plan = self.explain('my_tasks')
+        self.assertIn('task_assignee_recent_idx', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+    
+    @skipUnless(connection.vendor == 'sqlite', 'Plan text is SQLite specific')
+    def test_my_tasks_status_filter_uses_composite_index(self):
+        """Test that filtering my_tasks by status uses the composite index"""
+        plan = self.explain('my_tasks', status='pending')
+        self.assertIn('task_assignee_status_idx', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+    
+    @skipUnless(connection.vendor == 'sqlite', 'Plan text is SQLite specific')
+    def test_manager_task_list_uses_recent_index(self):
+        """Test that the unscoped listing walks the recency index"""
+        plan = self.explain('task_list.manager')
+        self.assertIn('task_recent_idx', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+    
+    def test_explain_command(self):
+        """Test that the explain command prints a plan for every view query"""
+        out = StringIO()
+        call_command('explain_task_queries', user='testuser', stdout=out)
+        for label in task_view_querysets(self.user, QueryDict()):
+            self.assertIn(label, out.getvalue())
@@ -0,0 +1,73 @@
+import json
+from unittest import mock
+
+from django.test import TestCase, Client, override_settings
+from django.contrib.auth.models import User
+from django.db import connection
+from django.urls import reverse
+from core.middleware import QueryStats
+from core.models import Task
+
+
+@override_settings(QUERY_INSTRUMENTATION=True, QUERY_INSTRUMENTATION_HEADERS=True)
+class QueryInstrumentationMiddlewareTest(TestCase):
+    """Test cases for per-request query instrumentation"""
+    
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        Task.objects.create(title='Test Task', created_by=self.user)
+        self.client = Client()
+        self.client.login(email='test@example.com', password='testpass123')
+    
+    def test_server_timing_header_and_log(self):
+        with self.assertLogs('core.queries', level='INFO') as logs:
+            response = self.client.get(reverse('core:task_list'))
+        self.assertIn('Server-Timing', response.headers)
+        self.assertRegex(response.headers['Server-Timing'], r'^db;desc="\d+ queries";dur=[\d.]+, ')
+        
+        record = logs.records[0]
+        data = json.loads(record.getMessage().split(' ', 1)[1])
+        self.assertEqual(data['path'], reverse('core:task_list'))
+        self.assertEqual(data['status'], 200)
+        self.assertGreater(data['queries'], 0)
+        self.assertEqual(record.query_stats['queries'], data['queries'])
+    
+    async def test_async_requests(self):
+        await self.async_client.aforce_login(self.user)
+        with self.assertLogs('core.queries', level='INFO') as logs:
+            response = await self.async_client.get(reverse('core:task_list'))
+        self.assertIn('Server-Timing', response.headers)
+        self.assertGreater(logs.records[0].query_stats['queries'], 0)
+    
+    @override_settings(QUERY_INSTRUMENTATION_HEADERS=False)
+    def test_headers_optional(self):
+        with self.assertLogs('core.queries', level='INFO'):
+            response = self.client.get(reverse('core:task_list'))
+        self.assertNotIn('Server-Timing', response.headers)
+    
+    @override_settings(QUERY_INSTRUMENTATION_SAMPLE_RATE=0.5)
+    def test_unsampled_requests_are_skipped(self):
+        with mock.patch('core.middleware.random.random', return_value=0.9):
+            response = self.client.get(reverse('core:task_list'))
+        self.assertNotIn('Server-Timing', response.headers)
+    
+    @override_settings(QUERY_INSTRUMENTATION=False)
+    def test_disabled_by_default(self):
+        response = Client().get(reverse('account_login'))
+        self.assertNotIn('Server-Timing', response.headers)
+    
+    def test_query_stats_counts_duplicates(self):
+        stats = QueryStats()
+        with connection.execute_wrapper(stats):
+            list(Task.objects.filter(pk=1))
+            list(Task.objects.filter(pk=1))
+            list(Task.objects.filter(pk=2))
+        self.assertEqual(stats.count, 3)
+        self.assertEqual(stats.duplicates, 1)
+        self.assertEqual(stats.similar, 2)
+        self.assertIn('core_task', stats.as_dict()['slowest_sql'])
@@ -156,6 +156,26 @@ class TaskModelTest(TestCase):
         tasks = Task.objects.all()
         self.assertEqual(tasks[0], task2)  # Most recent first
         self.assertEqual(tasks[1], task1)
+    
+    def test_task_visible_to(self):
+        """Test visibility queryset for created and assigned tasks"""
+        user3 = User.objects.create_user(
+            username='testuser3',
+            email='test3@example.com',
+            password='testpass123'
+        )
+        created = Task.objects.create(title='Created Task', created_by=self.user)
+        assigned = Task.objects.create(title='Assigned Task', created_by=self.user2, assigned_to=self.user)
+        both = Task.objects.create(title='Own Task', created_by=self.user, assigned_to=self.user)
+        other = Task.objects.create(title='Other Task', created_by=self.user2, assigned_to=user3)
+        
+        visible = Task.objects.visible_to(self.user)
+        self.assertEqual(visible.count(), 3)
+        self.assertCountEqual(visible, [created, assigned, both])
+        self.assertEqual(list(visible.filter(status='pending').order_by('-created_at')[:1]), [both])
+        
+        self.assertTrue(assigned.is_visible_to(self.user))
+        self.assertFalse(other.is_visible_to(self.user))
 
 
 class UserProfileModelTest(TestCase):
@@ -0,0 +1,101 @@
+from django.test import TestCase, Client, override_settings
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from core.models import Task
+from core.pagination import CursorPaginator, EstimatedCountPaginator
+
+
+class CursorPaginatorTest(TestCase):
+    """Test cases for keyset pagination of task listings"""
+    
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.user.profile.role = 'manager'
+        self.user.profile.save()
+        
+        # Identical timestamps force the id tie-breaker to be exercised
+        now = timezone.now()
+        Task.objects.bulk_create([
+            Task(title=f'Task {i}', created_by=self.user) for i in range(30)
+        ])
+        Task.objects.filter(id__lte=Task.objects.order_by('id')[14].id).update(created_at=now)
+        self.expected = list(Task.objects.order_by('-created_at', '-id'))
+    
+    def test_walk_forward_and_back(self):
+        """Test that pages cover every task once in both directions"""
+        paginator = CursorPaginator(Task.objects.all(), 12)
+        pages = [paginator.get_page(None)]
+        while pages[-1].has_next():
+            pages.append(paginator.get_page(pages[-1].next_cursor))
+        
+        self.assertEqual([len(page) for page in pages], [12, 12, 6])
+        self.assertEqual([task for page in pages for task in page], self.expected)
+        self.assertFalse(pages[0].has_previous())
+        
+        previous = paginator.get_page(pages[2].previous_cursor)
+        self.assertEqual(list(previous), list(pages[1]))
+        self.assertTrue(previous.has_next())
+        self.assertTrue(previous.has_previous())
+        first = paginator.get_page(previous.previous_cursor)
+        self.assertEqual(list(first), list(pages[0]))
+        self.assertFalse(first.has_previous())
+    
+    def test_invalid_cursor_returns_first_page(self):
+        """Test that malformed cursors fall back to the first page"""
+        paginator = CursorPaginator(Task.objects.all(), 12)
+        for cursor in ['garbage', '!!!', 'bm9wZXwxfDI']:
+            self.assertEqual(list(paginator.get_page(cursor)), self.expected[:12])
+    
+    def test_capped_count(self):
+        """Test the optional capped row count"""
+        self.assertIsNone(CursorPaginator(Task.objects.all(), 12).count)
+        
+        paginator = CursorPaginator(Task.objects.all(), 12, count_limit=20)
+        self.assertEqual(paginator.count, 20)
+        self.assertTrue(paginator.count_is_capped)
+        
+        paginator = CursorPaginator(Task.objects.all(), 12, count_limit=100)
+        self.assertEqual(paginator.count, 30)
+        self.assertFalse(paginator.count_is_capped)
+    
+    def test_estimated_count_paginator(self):
+        """Test the admin paginator caps counts and the pages they reach"""
+        paginator = EstimatedCountPaginator(Task.objects.filter(created_by=self.user), 5)
+        paginator.count_limit = 12
+        self.assertEqual(paginator.count, 12)
+        self.assertTrue(paginator.count_is_capped)
+        self.assertFalse(paginator.count_is_estimated)
+        self.assertEqual(paginator.num_pages, 3)
+        
+        paginator = EstimatedCountPaginator(Task.objects.all(), 5)
+        self.assertEqual(paginator.count, 30)
+        self.assertFalse(paginator.count_is_capped)
+        self.assertEqual(paginator.num_pages, 6)
+    
+    def test_task_list_cursor_mode(self):
+        """Test opting into cursor pagination from the task list"""
+        client = Client()
+        client.login(email='test@example.com', password='testpass123')
+        response = client.get(reverse('core:task_list'), {'cursor': '', 'status': 'pending'})
+        self.assertEqual(response.status_code, 200)
+        page_obj = response.context['page_obj']
+        self.assertTrue(page_obj.is_cursor_page)
+        self.assertContains(response, f'?cursor={page_obj.next_cursor}&amp;status=pending')
+        
+        response = client.get(reverse('core:task_list'), {'cursor': page_obj.next_cursor})
+        self.assertEqual(list(response.context['page_obj']), self.expected[12:24])
+    
+    @override_settings(TASK_LIST_CURSOR_PAGINATION=True, TASK_LIST_COUNT_LIMIT=25)
+    def test_cursor_mode_setting(self):
+        """Test enabling cursor pagination globally with a capped header count"""
+        client = Client()
+        client.login(email='test@example.com', password='testpass123')
+        response = client.get(reverse('core:task_list'))
+        self.assertTrue(response.context['page_obj'].is_cursor_page)
+        self.assertContains(response, '25+ tasks')
@@ -0,0 +1,168 @@
+from django.test import TestCase, Client
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from datetime import timedelta
+from core import urls
+from core.models import Task
+from core.tests.utils import QueryBudgetMixin
+
+
+class ViewQueryCountTest(QueryBudgetMixin, TestCase):
+    """Pin the number of queries each core view runs, independent of page size"""
+    
+    # Every named route in core/urls.py must have a budget test below
+    COVERED_VIEWS = {
+        'dashboard', 'task_list', 'my_tasks', 'task_create', 'task_detail',
+        'task_edit', 'task_delete', 'task_complete', 'tag_suggestions', 'task_export',
+        'task_events',
+    }
+    
+    def setUp(self):
+        """Set up test data"""
+        self.client = Client()
+        self.manager = self.create_user('manager', role='manager')
+        self.developer = self.create_user('developer', role='developer')
+        self.task = Task.objects.create(
+            title='Test Task',
+            created_by=self.manager,
+            assigned_to=self.developer,
+            due_date=timezone.now() + timedelta(days=1),
+            tags='backend, bug'
+        )
+        self.add_tasks(3)
+    
+    def create_user(self, name, role='developer'):
+        user = User.objects.create_user(
+            username=name,
+            email=f'{name}@example.com',
+            password='testpass123',
+            first_name=name.title()
+        )
+        user.profile.role = role
+        user.profile.save()
+        return user
+    
+    def add_tasks(self, count):
+        """Tasks for both users, each assigned to a different extra user"""
+        for i in range(count):
+            assignee = User.objects.create(
+                username=f'assignee{Task.objects.count()}',
+                first_name='Assignee'
+            )
+            Task.objects.create(
+                title=f'Task {i}',
+                created_by=self.manager if i % 2 else self.developer,
+                assigned_to=assignee,
+                priority='urgent',
+                tags='frontend',
+                due_date=timezone.now() + timedelta(days=i)
+            )
+    
+    def login(self, user):
+        self.client.login(email=user.email, password='testpass123')
+        # Warm the lazily built counter row so budgets measure steady state
+        self.client.get(reverse('core:dashboard'))
+    
+    def test_every_view_is_covered(self):
+        names = {pattern.name for pattern in urls.urlpatterns}
+        self.assertEqual(names - self.COVERED_VIEWS, set())
+    
+    def test_dashboard(self):
+        self.login(self.manager)
+        with self.assertMaxQueries(7):
+            self.client.get(reverse('core:dashboard'))
+    
+    def test_listings_do_not_grow_with_page_size(self):
+        self.login(self.manager)
+        for name, params in [
+            ('core:task_list', {}),
+            ('core:task_list', {'cursor': ''}),
+            ('core:task_list', {'search': 'task', 'status': 'pending'}),
+            ('core:my_tasks', {}),
+            ('core:dashboard', {}),
+        ]:
+            with self.subTest(view=name, params=params):
+                with self.assertMaxQueries(7) as before:
+                    self.client.get(reverse(name), params)
+                self.add_tasks(12)
+                with self.assertMaxQueries(len(before)):
+                    self.client.get(reverse(name), params)
+    
+    def test_task_list_for_member(self):
+        self.login(self.developer)
+        with self.assertMaxQueries(7):
+            response = self.client.get(reverse('core:task_list'))
+        self.assertEqual(response.status_code, 200)
+    
+    def test_my_tasks(self):
+        self.login(self.developer)
+        with self.assertMaxQueries(6):
+            self.client.get(reverse('core:my_tasks'))
+    
+    def test_task_create(self):
+        self.login(self.manager)
+        with self.assertMaxQueries(4):
+            self.client.get(reverse('core:task_create'))
+        with self.assertMaxQueries(9):
+            response = self.client.post(reverse('core:task_create'), {
+                'title': 'New Task',
+                'status': 'pending',
+                'priority': 'low',
+                'tags': 'backend',
+            })
+        self.assertEqual(response.status_code, 302)
+    
+    def test_task_detail(self):
+        self.login(self.developer)
+        with self.assertMaxQueries(5):
+            response = self.client.get(reverse('core:task_detail', args=[self.task.id]))
+        self.assertContains(response, 'Developer')
+    
+    def test_task_edit(self):
+        self.login(self.manager)
+        url = reverse('core:task_edit', args=[self.task.id])
+        with self.assertMaxQueries(5):
+            self.client.get(url)
+        with self.assertMaxQueries(11):
+            response = self.client.post(url, {
+                'title': 'Edited Task',
+                'status': 'in_progress',
+                'priority': 'low',
+                'assigned_to': self.developer.id,
+                'tags': 'backend',
+            })
+        self.assertEqual(response.status_code, 302)
+    
+    def test_task_delete(self):
+        self.login(self.manager)
+        url = reverse('core:task_delete', args=[self.task.id])
+        with self.assertMaxQueries(4):
+            self.client.get(url)
+        with self.assertMaxQueries(7):
+            response = self.client.post(url)
+        self.assertEqual(response.status_code, 302)
+    
+    def test_task_complete(self):
+        self.login(self.developer)
+        with self.assertMaxQueries(6):
+            self.client.get(reverse('core:task_complete', args=[self.task.id]))
+    
+    def test_tag_suggestions(self):
+        self.login(self.developer)
+        with self.assertMaxQueries(3):
+            self.client.get(reverse('core:tag_suggestions'), {'q': 'b'})
+    
+    def test_task_events(self):
+        # Under WSGI the stream is refused after loading the session and user
+        self.login(self.developer)
+        with self.assertMaxQueries(2):
+            self.client.get(reverse('core:task_events'))
+    
+    def test_task_export(self):
+        self.login(self.developer)
+        with self.assertMaxQueries(4) as before:
+            b''.join(self.client.get(reverse('core:task_export')).streaming_content)
+        self.add_tasks(12)
+        with self.assertMaxQueries(len(before)):
+            b''.join(self.client.get(reverse('core:task_export')).streaming_content)
@@ -0,0 +1,124 @@
+from django.test import TestCase, Client, override_settings
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.migrations.recorder import MigrationRecorder
+from django.urls import reverse
+from core.models import Task
+from core.apps import SEARCH_MIGRATION, restore_search_schema
+from core.search import drop_search_schema, ensure_search_schema, search_schema_installed, search_tasks
+
+
+class TaskSearchTest(TestCase):
+    """Test cases for the full-text task search backend"""
+    
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.title_match = Task.objects.create(
+            title='Deploy backend service',
+            description='Roll out the new release',
+            created_by=self.user
+        )
+        self.tag_match = Task.objects.create(
+            title='Fix login form',
+            description='Users cannot sign in',
+            tags='frontend, backend',
+            created_by=self.user
+        )
+        self.description_match = Task.objects.create(
+            title='Write release notes',
+            description='Summarize the backend changes',
+            created_by=self.user
+        )
+        self.no_match = Task.objects.create(
+            title='Design landing page',
+            created_by=self.user
+        )
+    
+    def search(self, query, ranked=False):
+        return list(search_tasks(Task.objects.all(), query, ranked=ranked))
+    
+    def test_matches_title_description_and_tags(self):
+        """Test that all indexed fields are searched"""
+        self.assertCountEqual(
+            self.search('backend'),
+            [self.title_match, self.tag_match, self.description_match]
+        )
+    
+    def test_prefix_and_multiple_terms(self):
+        """Test prefix matching and that every term must match"""
+        self.assertCountEqual(self.search('back'), [self.title_match, self.tag_match, self.description_match])
+        self.assertCountEqual(self.search('backend release'), [self.title_match, self.description_match])
+    
+    def test_ranking_prefers_title_matches(self):
+        """Test that ranked results put title matches first"""
+        results = self.search('backend', ranked=True)
+        self.assertEqual(results[0], self.title_match)
+        self.assertEqual(results[-1], self.description_match)
+    
+    def test_index_follows_updates_and_deletes(self):
+        """Test that the index is maintained on save, update and delete"""
+        self.no_match.title = 'Design backend dashboard'
+        self.no_match.save()
+        self.assertIn(self.no_match, self.search('dashboard'))
+        
+        Task.objects.filter(pk=self.no_match.pk).update(title='Design landing page')
+        self.assertEqual(self.search('dashboard'), [])
+        
+        self.title_match.delete()
+        self.assertEqual(self.search('deploy'), [])
+    
+    def test_operator_characters_are_literal(self):
+        """Test that search syntax in user input cannot break the query"""
+        self.assertEqual(self.search('"backend" OR NOT *'), self.search('backend OR NOT'))
+        self.assertCountEqual(self.search('!!!'), [])
+    
+    def test_restores_dropped_triggers(self):
+        """Test that missing triggers are recreated and the index rebuilt"""
+        if connection.vendor != 'sqlite':
+            self.skipTest('SQLite trigger handling')
+        with connection.cursor() as cursor:
+            cursor.execute('DROP TRIGGER core_task_fts_au')
+        self.assertTrue(ensure_search_schema(connection))
+        self.assertFalse(ensure_search_schema(connection))
+        self.assertIn(self.title_match, self.search('deploy'))
+    
+    def test_post_migrate_restores_schema_only_while_migrated(self):
+        """Test that the post_migrate hook leaves the schema alone below migration 0005"""
+        if connection.vendor != 'sqlite':
+            self.skipTest('SQLite trigger handling')
+        recorder = MigrationRecorder(connection)
+        recorder.record_unapplied(*SEARCH_MIGRATION)
+        drop_search_schema(connection)
+        restore_search_schema(sender=None, using=connection.alias)
+        self.assertFalse(search_schema_installed(connection))
+        
+        recorder.record_applied(*SEARCH_MIGRATION)
+        restore_search_schema(sender=None, using=connection.alias)
+        self.assertTrue(search_schema_installed(connection))
+        self.assertIn(self.title_match, self.search('deploy'))
+    
+    @override_settings(TASK_SEARCH_BACKEND='core.search.IContainsSearchBackend')
+    def test_icontains_backend(self):
+        """Test the substring fallback backend"""
+        self.assertCountEqual(self.search('ackend'), [self.title_match, self.tag_match, self.description_match])
+    
+    def test_task_list_and_admin_use_search(self):
+        """Test that the task list and admin changelist search through the backend"""
+        self.user.is_staff = True
+        self.user.is_superuser = True
+        self.user.save()
+        client = Client()
+        client.login(email='test@example.com', password='testpass123')
+        
+        response = client.get(reverse('core:task_list'), {'search': 'backend'})
+        self.assertEqual(list(response.context['page_obj'])[0], self.title_match)
+        self.assertNotContains(response, self.no_match.title)
+        
+        response = client.get(reverse('admin:core_task_changelist'), {'q': 'deploy'})
+        self.assertContains(response, self.title_match.title)
+        self.assertNotContains(response, self.tag_match.title)
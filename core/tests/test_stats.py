@@ -0,0 +1,75 @@
+from django.test import TestCase, Client
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from datetime import timedelta
+from core.models import Task
+from core.stats import task_stats, user_task_stats
+
+
+class TaskStatsTest(TestCase):
+    """Test cases for the aggregated task statistics service"""
+    
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.user2 = User.objects.create_user(
+            username='testuser2',
+            email='test2@example.com',
+            password='testpass123'
+        )
+        past = timezone.now() - timedelta(days=1)
+        
+        Task.objects.create(title='Pending Task', created_by=self.user, status='pending')
+        Task.objects.create(title='Overdue Task', created_by=self.user, status='in_progress', due_date=past)
+        Task.objects.create(title='Done Task', created_by=self.user, status='completed', due_date=past)
+        # Created and assigned by the same user must only be counted once
+        Task.objects.create(title='Own Task', created_by=self.user, assigned_to=self.user, status='cancelled')
+        Task.objects.create(title='Assigned Task', created_by=self.user2, assigned_to=self.user, status='pending')
+        Task.objects.create(title='Other Task', created_by=self.user2, status='pending')
+    
+    def test_user_task_stats(self):
+        """Test counters for a user's created and assigned tasks"""
+        stats = user_task_stats(self.user)
+        self.assertEqual(stats, {
+            'total_tasks': 5,
+            'pending_tasks': 2,
+            'in_progress_tasks': 1,
+            'completed_tasks': 1,
+            'cancelled_tasks': 1,
+            'overdue_tasks': 1,
+        })
+    
+    def test_user_task_stats_single_query(self):
+        """Test that all counters are computed in one query"""
+        with self.assertNumQueries(1):
+            user_task_stats(self.user)
+    
+    def test_task_stats_on_queryset(self):
+        """Test counters over an arbitrary queryset"""
+        stats = task_stats(Task.objects.filter(status='pending'))
+        self.assertEqual(stats['total_tasks'], 3)
+        self.assertEqual(stats['pending_tasks'], 3)
+        self.assertEqual(stats['completed_tasks'], 0)
+    
+    def test_dashboard_uses_stats(self):
+        """Test that the dashboard renders the aggregated counters"""
+        client = Client()
+        client.login(email='test@example.com', password='testpass123')
+        response = client.get(reverse('core:dashboard'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['total_tasks'], 5)
+        self.assertEqual(response.context['overdue_tasks'], 1)
+    
+    def test_admin_changelist_stats(self):
+        """Test that the task changelist shows counters for the filtered rows"""
+        User.objects.create_superuser(username='admin', email='admin@example.com', password='adminpass123')
+        client = Client()
+        client.login(username='admin@example.com', password='adminpass123')
+        response = client.get(reverse('admin:core_task_changelist'), {'status': 'pending'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['task_stats']['total_tasks'], 3)
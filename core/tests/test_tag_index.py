@@ -0,0 +1,101 @@
+from django.test import TestCase, Client
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.urls import reverse
+from core.models import Task
+from core.tag_index import TagIndex, SharedTagIndex, shared_index, suggest_tags, tag_changes
+
+
+class TagIndexTest(TestCase):
+    """Test cases for the in-memory tag prefix index"""
+
+    def test_suggest_ranks_prefix_matches_by_count(self):
+        index = TagIndex({'backend': 5, 'bug': 9, 'build': 5, 'frontend': 20})
+        self.assertEqual(index.suggest('b'), [('bug', 9), ('backend', 5), ('build', 5)])
+        self.assertEqual(index.suggest('BU', limit=1), [('bug', 9)])
+        self.assertEqual(index.suggest('x'), [])
+
+    def test_common_prefix_uses_frequency_order(self):
+        counts = {f'tag{i}': i for i in range(1, 200)}
+        counts['other'] = 1000
+        index = TagIndex(counts)
+        self.assertEqual(index.suggest('tag', limit=3), [('tag199', 199), ('tag198', 198), ('tag197', 197)])
+        self.assertEqual(index.suggest('', limit=2), [('other', 1000), ('tag199', 199)])
+
+    def test_apply_updates_counts_in_place(self):
+        index = TagIndex({'bug': 2, 'backend': 1})
+        index.apply({'bug': -2, 'backend': 2, 'beta': 1})
+        self.assertEqual(index.suggest('b'), [('backend', 3), ('beta', 1)])
+        self.assertEqual(len(index), 2)
+
+    def test_tag_changes(self):
+        self.assertEqual(tag_changes('Bug, frontend', 'bug, backend'), {'backend': 1, 'frontend': -1})
+        self.assertEqual(tag_changes('', 'a, A'), {'a': 1})
+
+
+class SharedTagIndexTest(TestCase):
+    """Test cases for keeping the tag index current across saves"""
+
+    def setUp(self):
+        """Set up test data"""
+        cache.clear()
+        shared_index.reset()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.task = Task.objects.create(title='Task', tags='bug, backend', created_by=self.user)
+        Task.objects.create(title='Other', tags='bug', created_by=self.user)
+
+    def tearDown(self):
+        shared_index.reset()
+
+    def test_built_from_database(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(suggest_tags('b'), [('bug', 2), ('backend', 1)])
+        with self.assertNumQueries(0):
+            suggest_tags('b')
+
+    def test_saves_update_index_without_queries(self):
+        suggest_tags()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.tags = 'backend, frontend'
+            self.task.save()
+            Task.objects.create(title='New', tags='frontend', created_by=self.user)
+        with self.assertNumQueries(0):
+            self.assertEqual(suggest_tags(), [('frontend', 2), ('backend', 1), ('bug', 1)])
+
+    def test_delete_updates_index(self):
+        suggest_tags()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.delete()
+        self.assertEqual(suggest_tags(), [('bug', 1)])
+
+    def test_other_process_replays_deltas(self):
+        other = SharedTagIndex()
+        other.get()
+        suggest_tags()
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.create(title='New', tags='backend', created_by=self.user)
+        with self.assertNumQueries(0):
+            self.assertEqual(other.get().suggest('back'), [('backend', 2)])
+
+    def test_invalidate_forces_rebuild(self):
+        suggest_tags()
+        other = SharedTagIndex()
+        other.get()
+        other.invalidate()
+        with self.assertNumQueries(1):
+            suggest_tags()
+
+    def test_suggestions_view(self):
+        client = Client()
+        url = reverse('core:tag_suggestions')
+        self.assertEqual(client.get(url).status_code, 302)
+
+        client.login(email='test@example.com', password='testpass123')
+        response = client.get(url, {'q': 'b', 'limit': 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'results': [{'name': 'bug', 'count': 2}]})
+        self.assertEqual(len(client.get(url, {'limit': 'x'}).json()['results']), 2)
@@ -0,0 +1,102 @@
+from django.test import TestCase, Client
+from django.contrib.auth.models import User
+from django.urls import reverse
+from core.models import Task, Tag, TaskTag
+from core.tags import parse_tags, sync_task_tags, tag_counts
+
+
+class TagTest(TestCase):
+    """Test cases for normalized task tags"""
+    
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.user2 = User.objects.create_user(
+            username='testuser2',
+            email='test2@example.com',
+            password='testpass123'
+        )
+        self.frontend_task = Task.objects.create(
+            title='Frontend Task',
+            tags='Frontend, bug',
+            created_by=self.user
+        )
+        self.backend_task = Task.objects.create(
+            title='Backend Task',
+            tags='backend, bug, BUG',
+            created_by=self.user
+        )
+        self.other_task = Task.objects.create(
+            title='Other Task',
+            tags='front',
+            created_by=self.user2
+        )
+    
+    def tag_names(self, task):
+        return sorted(task.tag_set.values_list('name', flat=True))
+    
+    def test_parse_tags(self):
+        """Test trimming and case-insensitive de-duplication"""
+        self.assertEqual(parse_tags(' a, B ,,b, c '), ['a', 'B', 'c'])
+        self.assertEqual(parse_tags(''), [])
+        self.assertEqual(parse_tags(None), [])
+    
+    def test_tags_synced_on_create(self):
+        """Test that saving a task links normalized tags"""
+        self.assertEqual(self.tag_names(self.frontend_task), ['bug', 'frontend'])
+        self.assertEqual(self.tag_names(self.backend_task), ['backend', 'bug'])
+        self.assertEqual(Tag.objects.filter(name='bug').count(), 1)
+    
+    def test_tags_synced_on_edit(self):
+        """Test that changing the tag text replaces the links"""
+        self.frontend_task.tags = 'design'
+        self.frontend_task.save()
+        self.assertEqual(self.tag_names(self.frontend_task), ['design'])
+        
+        self.frontend_task.tags = ''
+        self.frontend_task.save()
+        self.assertEqual(self.tag_names(self.frontend_task), [])
+    
+    def test_unchanged_tags_skip_sync(self):
+        """Test that saves that don't touch tags don't rewrite links"""
+        task = Task.objects.get(pk=self.frontend_task.pk)
+        task.status = 'in_progress'
+        with self.assertNumQueries(2):
+            # The UPDATE plus the counter delta for the creator
+            task.save()
+    
+    def test_exact_tag_filter(self):
+        """Test that tag filtering does not match partial tags"""
+        self.assertCountEqual(Task.objects.filter(tag_set__name='front'), [self.other_task])
+        self.assertCountEqual(Task.objects.filter(tag_set__name='bug'), [self.frontend_task, self.backend_task])
+    
+    def test_tag_counts(self):
+        """Test grouped per-tag counts"""
+        with self.assertNumQueries(1):
+            counts = tag_counts()
+        self.assertEqual(counts[0], ('bug', 2))
+        self.assertIn(('front', 1), counts)
+        self.assertEqual(tag_counts(Task.objects.filter(created_by=self.user2)), [('front', 1)])
+        self.assertEqual(len(tag_counts(limit=2)), 2)
+    
+    def test_bulk_sync(self):
+        """Test syncing tags for bulk-created tasks"""
+        tasks = Task.objects.bulk_create([
+            Task(title=f'Bulk {i}', tags='bulk, import', created_by=self.user) for i in range(5)
+        ])
+        sync_task_tags(tasks, replace=False)
+        self.assertEqual(TaskTag.objects.filter(tag__name='bulk').count(), 5)
+    
+    def test_task_list_tag_filter(self):
+        """Test filtering the task list by tag"""
+        client = Client()
+        client.login(email='test@example.com', password='testpass123')
+        response = client.get(reverse('core:task_list'), {'tag': 'BUG'})
+        self.assertEqual(response.status_code, 200)
+        self.assertCountEqual(response.context['page_obj'].object_list, [self.frontend_task, self.backend_task])
+        self.assertEqual(response.context['popular_tags'][0], ('bug', 2))
+        self.assertContains(response, 'Tag: BUG')
@@ -207,6 +207,63 @@ class TaskViewsTest(TestCase):
         self.assertContains(response, self.task.title)
 
 
+class AsyncViewsTest(TestCase):
+    """Test cases for the async read views served through the ASGI handler"""
+    
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.user2 = User.objects.create_user(
+            username='testuser2',
+            email='test2@example.com',
+            password='testpass123'
+        )
+        self.task = Task.objects.create(
+            title='Async Task',
+            created_by=self.user,
+            assigned_to=self.user2,
+            priority='urgent',
+            tags='backend'
+        )
+        self.hidden_task = Task.objects.create(title='Hidden Task', created_by=self.user)
+    
+    async def test_dashboard(self):
+        response = await self.async_client.get(reverse('core:dashboard'))
+        self.assertEqual(response.status_code, 302)
+        await self.async_client.aforce_login(self.user2)
+        response = await self.async_client.get(reverse('core:dashboard'))
+        self.assertContains(response, 'Async Task')
+        self.assertEqual(response.context['total_tasks'], 1)
+    
+    async def test_listings(self):
+        await self.async_client.aforce_login(self.user2)
+        for name in ('core:task_list', 'core:my_tasks'):
+            response = await self.async_client.get(reverse(name), {'tag': 'backend'})
+            self.assertContains(response, 'Async Task')
+            self.assertNotContains(response, 'Hidden Task')
+            self.assertEqual(response.context['popular_tags'], [('backend', 1)])
+    
+    async def test_task_detail(self):
+        await self.async_client.aforce_login(self.user2)
+        response = await self.async_client.get(reverse('core:task_detail', args=[self.task.id]))
+        self.assertContains(response, 'Async Task')
+        response = await self.async_client.get(reverse('core:task_detail', args=[self.hidden_task.id]))
+        self.assertRedirects(response, reverse('core:task_list'), fetch_redirect_response=False)
+        response = await self.async_client.get(reverse('core:task_detail', args=[9999]))
+        self.assertEqual(response.status_code, 404)
+    
+    async def test_not_modified(self):
+        await self.async_client.aforce_login(self.user2)
+        url = reverse('core:task_list')
+        response = await self.async_client.get(url)
+        response = await self.async_client.get(url, headers={'If-None-Match': response['ETag']})
+        self.assertEqual(response.status_code, 304)
+
+
 class AuthenticationViewsTest(TestCase):
     """Test cases for authentication views"""
     
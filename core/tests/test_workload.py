@@ -0,0 +1,103 @@
+from decimal import Decimal
+from io import StringIO
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from core.bulk import bulk_create_tasks, bulk_delete_tasks, update_tasks
+from core.models import Task
+from core.profile import UserProfile
+from core.workload import find_allocation_drift
+
+
+class HoursAllocatedTest(TestCase):
+    """Test cases for maintaining profiles' allocated hours from their open tasks"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.user2 = User.objects.create_user(
+            username='testuser2',
+            email='test2@example.com',
+            password='testpass123'
+        )
+
+    def hours(self, user):
+        return UserProfile.objects.get(user=user).current_hours_allocated
+
+    def assertHoursInSync(self):
+        """Assert that stored allocations match a fresh computation"""
+        self.assertEqual(find_allocation_drift(), {})
+
+    def test_saves_move_hours(self):
+        """Test assignment, estimate, status and reassignment changes"""
+        task = Task.objects.create(title='Task', created_by=self.user, assigned_to=self.user, estimated_hours=Decimal('4.5'))
+        Task.objects.create(title='Unassigned', created_by=self.user, estimated_hours=8)
+        self.assertEqual(self.hours(self.user), Decimal('4.5'))
+
+        task.estimated_hours = 6
+        task.save()
+        self.assertEqual(self.hours(self.user), 6)
+
+        task.assigned_to = self.user2
+        task.save()
+        self.assertEqual((self.hours(self.user), self.hours(self.user2)), (0, 6))
+
+        task.status = 'completed'
+        task.save()
+        self.assertEqual(self.hours(self.user2), 0)
+
+        task.status = 'in_progress'
+        task.save()
+        self.assertEqual(self.hours(self.user2), 6)
+
+        Task.objects.get(pk=task.pk).delete()
+        self.assertEqual(self.hours(self.user2), 0)
+        self.assertHoursInSync()
+
+    def test_bulk_writes(self):
+        """Test the set-based writes of core.bulk"""
+        bulk_create_tasks([
+            Task(title=f'Task {i}', created_by=self.user, assigned_to=self.user, estimated_hours=2)
+            for i in range(4)
+        ])
+        self.assertEqual(self.hours(self.user), 8)
+
+        update_tasks(Task.objects.all(), {'assigned_to': self.user2}, chunk_size=3)
+        self.assertEqual((self.hours(self.user), self.hours(self.user2)), (0, 8))
+        update_tasks(Task.objects.filter(title='Task 0'), {'status': 'cancelled'})
+        self.assertEqual(self.hours(self.user2), 6)
+        bulk_delete_tasks(Task.objects.all())
+        self.assertEqual(self.hours(self.user2), 0)
+        self.assertHoursInSync()
+
+    def test_profile_saves_keep_concurrent_deltas(self):
+        """Test that saving a profile read before a task change keeps the change"""
+        stale = UserProfile.objects.get(user=self.user)
+        Task.objects.create(title='Task', created_by=self.user, assigned_to=self.user, estimated_hours=5)
+        stale.department = 'Engineering'
+        stale.save()
+        # Logging in saves the user, which saves its cached profile
+        self.user.profile = stale
+        self.user.save()
+        self.assertEqual(self.hours(self.user), 5)
+        self.assertEqual(UserProfile.objects.get(user=self.user).department, 'Engineering')
+    
+    def test_rebuild_command_check_and_fix(self):
+        """Test detecting and repairing allocations changed behind the signals"""
+        Task.objects.create(title='Task', created_by=self.user, assigned_to=self.user, estimated_hours=5)
+        Task.objects.update(estimated_hours=7)
+
+        with self.assertRaises(CommandError):
+            call_command('rebuild_hours_allocated', check=True, stdout=StringIO())
+
+        out = StringIO()
+        with self.assertNumQueries(1):
+            call_command('rebuild_hours_allocated', stdout=out)
+        self.assertIn('Recomputed allocated hours for 2 profiles', out.getvalue())
+        self.assertEqual(self.hours(self.user), 7)
+        self.assertHoursInSync()
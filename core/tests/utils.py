@@ -0,0 +1,19 @@
+from contextlib import contextmanager
+
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudgetMixin:
+    """TestCase mixin for asserting an upper bound on executed queries"""
+
+    @contextmanager
+    def assertMaxQueries(self, num, using='default'):
+        with CaptureQueriesContext(connections[using]) as captured:
+            yield captured
+        executed = len(captured)
+        if executed > num:
+            queries = '\n'.join(
+                f'{i}. {query["sql"]}' for i, query in enumerate(captured.captured_queries, start=1)
+            )
+            self.fail(f'{executed} queries executed, at most {num} expected\nCaptured queries were:\n{queries}')
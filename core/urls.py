@@ -11,9 +11,14 @@ urlpatterns = [
     # Task management URLs
     path('tasks/', views.task_list, name='task_list'),
     path('tasks/my/', views.my_tasks, name='my_tasks'),
+    path('tasks/export/', views.task_export, name='task_export'),
+    path('tasks/events/', views.task_events, name='task_events'),
     path('tasks/create/', views.task_create, name='task_create'),
     path('tasks/<int:task_id>/', views.task_detail, name='task_detail'),
     path('tasks/<int:task_id>/edit/', views.task_edit, name='task_edit'),
     path('tasks/<int:task_id>/delete/', views.task_delete, name='task_delete'),
     path('tasks/<int:task_id>/complete/', views.task_complete, name='task_complete'),
+    
+    # Tag autocomplete
+    path('tags/suggest/', views.tag_suggestions, name='tag_suggestions'),
 ]
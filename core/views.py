@@ -1,53 +1,69 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
 from django.shortcuts import render, get_object_or_404, redirect
-from django.http import HttpResponse
+from django.http import Http404, HttpResponse, HttpResponseBadRequest, JsonResponse, StreamingHttpResponse
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.db.models import Q, Count
-from django.core.paginator import Paginator
+from django.contrib.auth.models import User
+from django.db import connection
 from django.utils import timezone
-from datetime import datetime, timedelta
-from functools import wraps
 from .models import Task
+from .profile import UserProfile
 from .forms import TaskForm
+from .conditional import conditional_page, dashboard_validators, task_detail_validators, task_list_validators
+from .events import broker, event_stream
+from .export import EXPORT_FORMATS, aexport_lines, export_lines, export_queryset
+from .filters import filter_tasks, listed_tasks
+from .pagination import paginate_tasks
+from .tags import tag_counts
+from .tag_index import suggest_tags
+from .stats import user_counter_stats
 
-def ensure_profile(view_func):
-    """Decorator to ensure user has a profile"""
-    @wraps(view_func)
-    def wrapper(request, *args, **kwargs):
-        if request.user.is_authenticated:
-            if not hasattr(request.user, 'profile'):
-                from .profile import UserProfile
-                UserProfile.objects.create(user=request.user, role='developer')
-        return view_func(request, *args, **kwargs)
-    return wrapper
+async def load_user(request):
+    """The request's user, loaded without blocking and shared with the sync template context"""
+    request.user = await request.auser()
+    return request.user
 
-def dashboard(request):
+async def aensure_profile(user, role='developer'):
+    """Create a missing profile for a loaded user; the profile is cached on ``user``"""
+    try:
+        if User.profile.is_cached(user):
+            return user.profile
+    except UserProfile.DoesNotExist:
+        pass
+    profile, _ = await UserProfile.objects.aget_or_create(user=user, defaults={'role': role})
+    user.profile = profile
+    return profile
+
+def release_connection():
+    """Close this thread's connection, returning it to the pool; one in a transaction can't be released"""
+    if not connection.in_atomic_block:
+        connection.close()
+
+async def arender(request, template_name, context):
+    """Render in a worker thread: templates may still touch the ORM lazily
+    
+    Querysets left unevaluated (such as fragment-cached panels) only run
+    when the template needs them.
+    """
+    return await sync_to_async(render)(request, template_name, context)
+
+@conditional_page(dashboard_validators)
+async def dashboard(request):
     """Main dashboard with task statistics and overview"""
-    if not request.user.is_authenticated:
+    user = await load_user(request)
+    if not user.is_authenticated:
         # Redirect to login instead of showing demo
         return redirect('account_login')
     
-    # Ensure user has profile
-    if not hasattr(request.user, 'profile'):
-        from .profile import UserProfile
-        UserProfile.objects.create(user=request.user, role='developer')
-    
-    # User-specific dashboard
-    user_tasks = Task.objects.filter(
-        Q(created_by=request.user) | Q(assigned_to=request.user)
-    ).distinct()
-    
-    stats = {
-        'total_tasks': user_tasks.count(),
-        'pending_tasks': user_tasks.filter(status='pending').count(),
-        'in_progress_tasks': user_tasks.filter(status='in_progress').count(),
-        'completed_tasks': user_tasks.filter(status='completed').count(),
-        'overdue_tasks': user_tasks.filter(
-            due_date__lt=timezone.now(),
-            status__in=['pending', 'in_progress']
-        ).count(),
-    }
+    await aensure_profile(user)
+    # Counters are read from the user's materialized counter row
+    stats = await sync_to_async(user_counter_stats)(user)
     
+    # User-specific dashboard; the panels are fragment cached and only
+    # queried on a cache miss
+    user_tasks = Task.objects.visible_to(user).for_cards()
     recent_tasks = user_tasks.order_by('-created_at')[:5]
     high_priority_tasks = user_tasks.filter(priority='urgent').order_by('-created_at')[:3]
     
@@ -59,79 +75,79 @@ def dashboard(request):
         'recent_tasks': recent_tasks,
         'high_priority_tasks': high_priority_tasks,
     }
-    return render(request, 'core/dashboard.html', context)
+    return await arender(request, 'core/dashboard.html', context)
+
+async def task_listing(request, user, tasks, tag_scope, with_assignment=True):
+    """Context shared by task_list and my_tasks
+    
+    Popular tags are counted over ``tag_scope``, or every task when None.
+    """
+    tasks, filters = filter_tasks(tasks.order_by('-created_at').for_cards(), request.GET, user, with_assignment)
+    popular_tags = await sync_to_async(tag_counts)(tag_scope, limit=10)
+    page_obj = await sync_to_async(paginate_tasks)(request, tasks)
+    return {
+        'page_obj': page_obj,
+        'popular_tags': popular_tags,
+        **filters,
+        'status_choices': Task.STATUS_CHOICES,
+        'priority_choices': Task.PRIORITY_CHOICES,
+    }
 
 @login_required
-def task_list(request):
+@conditional_page(task_list_validators)
+async def task_list(request):
     """List all tasks with filtering and search"""
+    user = await load_user(request)
+    profile = await aensure_profile(user)
     # Base queryset - admins and managers can see all tasks
-    if request.user.profile.can_view_all_tasks():
-        tasks = Task.objects.all().order_by('-created_at')
-    else:
-        tasks = Task.objects.filter(
-            Q(created_by=request.user) | Q(assigned_to=request.user)
-        ).distinct().order_by('-created_at')
-    
-    # Search functionality
-    search_query = request.GET.get('search', '')
-    if search_query:
-        tasks = tasks.filter(
-            Q(title__icontains=search_query) |
-            Q(description__icontains=search_query) |
-            Q(tags__icontains=search_query)
-        )
-    
-    # Filter by status
-    status_filter = request.GET.get('status', '')
-    if status_filter:
-        tasks = tasks.filter(status=status_filter)
-    
-    # Filter by priority
-    priority_filter = request.GET.get('priority', '')
-    if priority_filter:
-        tasks = tasks.filter(priority=priority_filter)
-    
-    # Filter by assignment
-    assignment_filter = request.GET.get('assignment', '')
-    if assignment_filter == 'assigned_to_me':
-        tasks = tasks.filter(assigned_to=request.user)
-    elif assignment_filter == 'created_by_me':
-        tasks = tasks.filter(created_by=request.user)
-    
-    # Pagination
-    paginator = Paginator(tasks, 12)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    tasks = listed_tasks(user)
+    tag_scope = None if profile.can_view_all_tasks() else tasks
     
     context = {
         'title': 'All Tasks',
         'description': 'Manage your tasks efficiently',
-        'page_obj': page_obj,
-        'search_query': search_query,
-        'status_filter': status_filter,
-        'priority_filter': priority_filter,
-        'assignment_filter': assignment_filter,
-        'status_choices': Task.STATUS_CHOICES,
-        'priority_choices': Task.PRIORITY_CHOICES,
+        **await task_listing(request, user, tasks, tag_scope),
     }
-    return render(request, 'core/task_list.html', context)
+    return await arender(request, 'core/task_list.html', context)
 
 @login_required
-def task_detail(request, task_id):
+def task_export(request):
+    """Stream the tasks ``task_list`` would show, as CSV or JSON lines (``?format=jsonl``)"""
+    export_format = request.GET.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        return HttpResponseBadRequest(f"Unknown export format '{export_format}'")
+    content_type, extension = EXPORT_FORMATS[export_format]
+    
+    tasks = export_queryset(request.user, request.GET)
+    # ASGI buffers sync iterators into a list before sending anything
+    lines = aexport_lines if isinstance(request, ASGIRequest) else export_lines
+    response = StreamingHttpResponse(lines(tasks, export_format), content_type=content_type)
+    filename = f'tasks-{timezone.now():%Y%m%d}.{extension}'
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+@login_required
+@conditional_page(task_detail_validators)
+async def task_detail(request, task_id):
     """Show detailed view of a single task"""
-    task = get_object_or_404(Task, id=task_id)
+    user = await load_user(request)
+    try:
+        task = await Task.objects.with_people().aget(id=task_id)
+    except Task.DoesNotExist:
+        raise Http404('No Task matches the given query.')
     
     # Check if user has permission to view this task
-    if not (request.user == task.created_by or request.user == task.assigned_to or request.user.is_superuser):
+    if not (task.is_visible_to(user) or user.is_superuser):
         messages.error(request, 'You do not have permission to view this task.')
         return redirect('core:task_list')
     
+    await aensure_profile(user)
     context = {
         'title': task.title,
         'description': 'Task details and management',
         'task': task,
     }
-    return render(request, 'core/task_detail.html', context)
+    return await arender(request, 'core/task_detail.html', context)
 
 @login_required
 def task_create(request):
@@ -172,7 +188,7 @@ def task_edit(request, task_id):
     task = get_object_or_404(Task, id=task_id)
     
     # Check if user has permission to edit this task
-    if not (request.user == task.created_by or request.user == task.assigned_to or request.user.profile.can_manage_tasks()):
+    if not (task.is_visible_to(request.user) or request.user.profile.can_manage_tasks()):
         messages.error(request, 'You do not have permission to edit this task.')
         return redirect('core:task_detail', task_id=task.id)
     
@@ -204,7 +220,7 @@ def task_edit(request, task_id):
 @login_required
 def task_delete(request, task_id):
     """Delete a task"""
-    task = get_object_or_404(Task, id=task_id)
+    task = get_object_or_404(Task.objects.with_people(), id=task_id)
     
     # Check if user has permission to delete this task
     if not (request.user == task.created_by or request.user.is_superuser):
@@ -230,7 +246,7 @@ def task_complete(request, task_id):
     task = get_object_or_404(Task, id=task_id)
     
     # Check if user has permission to complete this task
-    if not (request.user == task.created_by or request.user == task.assigned_to or request.user.is_superuser):
+    if not (task.is_visible_to(request.user) or request.user.is_superuser):
         messages.error(request, 'You do not have permission to complete this task.')
         return redirect('core:task_detail', task_id=task.id)
     
@@ -245,40 +261,53 @@ def task_complete(request, task_id):
     return redirect('core:task_detail', task_id=task.id)
 
 @login_required
-def my_tasks(request):
+async def my_tasks(request):
     """Show tasks assigned to the current user"""
-    tasks = Task.objects.filter(assigned_to=request.user).order_by('-created_at')
+    user = await load_user(request)
+    await aensure_profile(user)
+    tasks = Task.objects.filter(assigned_to=user)
     
     # Apply same filtering logic as task_list
-    search_query = request.GET.get('search', '')
-    if search_query:
-        tasks = tasks.filter(
-            Q(title__icontains=search_query) |
-            Q(description__icontains=search_query) |
-            Q(tags__icontains=search_query)
-        )
-    
-    status_filter = request.GET.get('status', '')
-    if status_filter:
-        tasks = tasks.filter(status=status_filter)
-    
-    priority_filter = request.GET.get('priority', '')
-    if priority_filter:
-        tasks = tasks.filter(priority=priority_filter)
-    
-    # Pagination
-    paginator = Paginator(tasks, 12)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
-    
     context = {
         'title': 'My Tasks',
         'description': 'Tasks assigned to you',
-        'page_obj': page_obj,
-        'search_query': search_query,
-        'status_filter': status_filter,
-        'priority_filter': priority_filter,
-        'status_choices': Task.STATUS_CHOICES,
-        'priority_choices': Task.PRIORITY_CHOICES,
+        **await task_listing(request, user, tasks, tasks, with_assignment=False),
     }
-    return render(request, 'core/task_list.html', context)
+    return await arender(request, 'core/task_list.html', context)
+
+@login_required
+def tag_suggestions(request):
+    """Tags matching a prefix, most used first; without ``q`` this is the tag cloud"""
+    try:
+        limit = min(max(int(request.GET.get('limit', 10)), 1), 50)
+    except ValueError:
+        limit = 10
+    suggestions = suggest_tags(request.GET.get('q', ''), limit)
+    return JsonResponse({
+        'results': [{'name': name, 'count': count} for name, count in suggestions],
+    })
+
+@login_required
+async def task_events(request):
+    """Server-Sent Events stream of changes to the tasks the user can see"""
+    if not isinstance(request, ASGIRequest):
+        # A stream would hold a WSGI worker forever; 204 tells EventSource not to reconnect
+        return HttpResponse(status=204)
+    if broker.count() >= settings.TASK_EVENTS_MAX_SUBSCRIBERS:
+        return HttpResponse(status=503, headers={'Retry-After': '30'})
+    
+    user = await load_user(request)
+    profile = await aensure_profile(user)
+    stream = event_stream(
+        user.pk,
+        sees_all=user.is_superuser or profile.can_view_all_tasks(),
+        resume='Last-Event-ID' in request.headers,
+    )
+    # The stream never queries, and the connection would otherwise stay
+    # checked out until the client disconnects
+    await sync_to_async(release_connection)()
+    response = StreamingHttpResponse(stream, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Stop nginx from buffering the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
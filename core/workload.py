@@ -0,0 +1,102 @@
+"""``UserProfile.current_hours_allocated`` kept equal to the user's open workload
+
+A user's allocation is the summed ``estimated_hours`` of the open tasks
+assigned to them. Task saves, deletes and ``tasks_changed`` bulk writes
+apply the difference with ``F()`` increments, so concurrent workers never
+overwrite each other's changes. ``manage.py rebuild_hours_allocated``
+recomputes every profile with one grouped UPDATE after writes that bypass
+the signals (raw SQL, queryset ``update()``).
+"""
+from decimal import Decimal
+
+from django.db.models import DecimalField, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .profile import UserProfile
+from .signals import tasks_changed
+
+
+def task_allocation(state):
+    """``(user_id, hours)`` a task in ``state`` allocates, or None"""
+    from .models import Task
+
+    if state is None or state['assigned_to_id'] is None or not state['estimated_hours']:
+        return None
+    if state['status'] not in Task.OPEN_STATUSES:
+        return None
+    # str() keeps floats assigned in Python from carrying binary noise
+    return state['assigned_to_id'], Decimal(str(state['estimated_hours']))
+
+
+def allocation_deltas(changes):
+    """Per-user hour deltas for ``(old_state, new_state)`` changes"""
+    deltas = {}
+    for old_state, new_state in changes:
+        for allocation, sign in ((task_allocation(old_state), -1), (task_allocation(new_state), 1)):
+            if allocation is not None:
+                user_id, hours = allocation
+                deltas[user_id] = deltas.get(user_id, 0) + sign * hours
+    return deltas
+
+
+def apply_allocation_changes(changes):
+    """Apply the changes with one UPDATE per distinct delta"""
+    users_by_delta = {}
+    for user_id, delta in allocation_deltas(changes).items():
+        if delta:
+            users_by_delta.setdefault(delta, []).append(user_id)
+    for delta, user_ids in users_by_delta.items():
+        UserProfile.objects.filter(user_id__in=user_ids).update(
+            current_hours_allocated=F('current_hours_allocated') + delta
+        )
+
+
+def open_hours_subquery():
+    """Summed estimated hours of the open tasks assigned to ``OuterRef('user_id')``"""
+    from .models import Task
+
+    hours = (
+        Task.objects.order_by()
+        .filter(assigned_to=OuterRef('user_id'), status__in=Task.OPEN_STATUSES)
+        .values('assigned_to')
+        .annotate(hours=Sum('estimated_hours'))
+        .values('hours')
+    )
+    return Coalesce(Subquery(hours), Value(Decimal(0)), output_field=DecimalField())
+
+
+def rebuild_hours_allocated(user_ids=None):
+    """Recompute allocations with a single grouped UPDATE; returns the profiles updated"""
+    profiles = UserProfile.objects.all()
+    if user_ids is not None:
+        profiles = profiles.filter(user_id__in=user_ids)
+    return profiles.update(current_hours_allocated=open_hours_subquery())
+
+
+def find_allocation_drift():
+    """``{user_id: (stored, expected)}`` for every profile whose allocation is off"""
+    rows = UserProfile.objects.annotate(expected=open_hours_subquery()).values_list(
+        'user_id', 'current_hours_allocated', 'expected'
+    )
+    return {user_id: (stored, expected) for user_id, stored, expected in rows if stored != expected}
+
+
+@receiver(post_save, sender='core.Task')
+def update_allocation_on_save(sender, instance, **kwargs):
+    new_state = instance.get_tracked_state()
+    if new_state is None:
+        new_state = sender.objects.filter(pk=instance.pk).values(*sender.TRACKED_FIELDS).first()
+    apply_allocation_changes([(getattr(instance, '_previous_state', None), new_state)])
+
+
+@receiver(post_delete, sender='core.Task')
+def update_allocation_on_delete(sender, instance, **kwargs):
+    state = getattr(instance, '_loaded_state', None) or instance.get_tracked_state()
+    apply_allocation_changes([(state, None)])
+
+
+@receiver(tasks_changed)
+def update_allocation_on_bulk_change(sender, changes, **kwargs):
+    apply_allocation_changes([(old_state, new_state) for _, old_state, new_state in changes])
@@ -0,0 +1,13 @@
+"""Gunicorn settings, loaded automatically from the project root
+
+Serves the WSGI app with sync workers by default. ``DJANGO_ASGI=true``
+switches to the ASGI app on uvicorn workers, which run the async task
+views natively. ``WEB_CONCURRENCY`` sets the number of workers either way.
+"""
+import os
+
+if os.environ.get('DJANGO_ASGI', '').lower() in ('1', 'true', 'yes'):
+    wsgi_app = 'task_manager.asgi:application'
+    worker_class = 'uvicorn_worker.UvicornWorker'
+else:
+    wsgi_app = 'task_manager.wsgi:application'
@@ -0,0 +1,11 @@
+// Apply autocomplete changelist filters (core.admin.AutocompleteFilter) as soon as a value is picked
+'use strict';
+django.jQuery(function($) {
+    $(document).on('change', 'select[data-filter-url]', function() {
+        const url = new URL(this.dataset.filterUrl, window.location.href);
+        if (this.value) {
+            url.searchParams.set(this.name, this.value);
+        }
+        window.location.href = url.href;
+    });
+});
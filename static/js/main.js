@@ -226,6 +226,40 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     }
     
+    // Live task updates over Server-Sent Events (served by the ASGI app)
+    const eventsUrl = document.body.dataset.taskEventsUrl;
+    if (eventsUrl && window.EventSource) {
+        const source = new EventSource(eventsUrl);
+        let notice = null;
+        const showChanges = function() {
+            if (notice) {
+                return;
+            }
+            notice = document.createElement('div');
+            notice.className = 'alert alert-primary alert-dismissible fade show';
+            notice.setAttribute('role', 'status');
+            notice.innerHTML = `
+                <i class="fas fa-sync-alt me-2"></i>Tasks have changed.
+                <a href="#" class="alert-link">Refresh</a>
+                <button type="button" class="btn-close" data-bs-dismiss="alert"></button>
+            `;
+            notice.querySelector('.alert-link').addEventListener('click', function(e) {
+                e.preventDefault();
+                window.location.reload();
+            });
+            notice.addEventListener('closed.bs.alert', function() {
+                notice = null;
+            });
+            document.querySelector('main .container').prepend(notice);
+        };
+        ['created', 'updated', 'completed', 'deleted', 'resync'].forEach(function(type) {
+            source.addEventListener(type, showChanges);
+        });
+        window.addEventListener('pagehide', function() {
+            source.close();
+        });
+    }
+    
 });
 
 // Utility functions
@@ -0,0 +1,67 @@
+"""Build ``CACHES`` entries from a URL, in the spirit of dj-database-url
+
+Supported schemes:
+
+* ``redis://`` / ``rediss://``: Django's Redis backend (shared by all workers)
+* ``memcached://host:port[,host:port]``: pymemcache (shared)
+* ``file:///absolute/path``: one directory shared by the processes of a host,
+  handy as a stand-in for Redis in tests and single-machine setups. Its
+  ``incr`` is a read and a write, so the invalidation bus (``core.cache_bus``)
+  is only reliable with a single process
+* ``locmem://[name]``: per-process memory, the development default
+* ``dummy://``: caches nothing
+"""
+import os
+from urllib.parse import urlsplit, parse_qsl
+
+BACKENDS = {
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+    'rediss': 'django.core.cache.backends.redis.RedisCache',
+    'memcached': 'django.core.cache.backends.memcached.PyMemcacheCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'dummy': 'django.core.cache.backends.dummy.DummyCache',
+}
+
+# Environment variables hosting platforms set to identify the running release
+RELEASE_ENV_VARS = ['DJANGO_RELEASE', 'HEROKU_RELEASE_VERSION', 'RAILWAY_DEPLOYMENT_ID']
+
+
+def parse_cache_url(url):
+    """Return a ``CACHES`` entry for ``url``; query parameters become ``OPTIONS``
+
+    ``timeout`` in the query string sets the default ``TIMEOUT``.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in BACKENDS:
+        raise ValueError(f"Unsupported cache URL scheme '{parts.scheme}' (expected one of {', '.join(BACKENDS)})")
+
+    config = {'BACKEND': BACKENDS[parts.scheme]}
+    options = dict(parse_qsl(parts.query))
+    if 'timeout' in options:
+        config['TIMEOUT'] = int(options.pop('timeout'))
+
+    if parts.scheme in ('redis', 'rediss'):
+        config['LOCATION'] = url.split('?', 1)[0]
+    elif parts.scheme == 'memcached':
+        config['LOCATION'] = parts.netloc.split(',')
+    elif parts.scheme == 'file':
+        config['LOCATION'] = parts.path
+    elif parts.scheme == 'locmem':
+        config['LOCATION'] = parts.netloc or parts.path.strip('/')
+    if options:
+        config['OPTIONS'] = options
+    return config
+
+
+def cache_key_prefix(prefix='task_manager', environ=os.environ):
+    """Key prefix scoped to the running release, so each deploy starts from a cold cache
+
+    Workers of an old and a new release can share one cache server during a
+    rolling deploy without reading each other's cached HTML or counters.
+    """
+    for name in RELEASE_ENV_VARS:
+        release = environ.get(name)
+        if release:
+            return f'{prefix}:{release}'
+    return prefix
@@ -0,0 +1,53 @@
+"""Build ``DATABASES['default']`` from ``DATABASE_URL`` and connection settings
+
+By default connections persist for ``DJANGO_DB_CONN_MAX_AGE`` seconds, so
+requests reuse an open (TLS) connection instead of negotiating a new one,
+and ``CONN_HEALTH_CHECKS`` replaces connections the server has dropped
+before they are used. ``DJANGO_DB_POOL=true`` switches to psycopg 3's
+connection pool (PostgreSQL only). It is the default under ASGI, where
+persistent connections would be tied to short-lived worker threads.
+"""
+import os
+
+import dj_database_url
+
+DEFAULT_DB_OPTIONS = 'sslmode=require&channel_binding=require'
+
+
+def env_flag(environ, name, default='false'):
+    return environ.get(name, default).lower() in ('1', 'true', 'yes')
+
+
+def parse_db_options(text):
+    """``'a=1&b=2'`` as ``{'a': '1', 'b': '2'}``; entries without ``=`` are ignored"""
+    options = {}
+    for option in text.split('&'):
+        if '=' in option:
+            key, value = option.split('=', 1)
+            options[key] = value
+    return options
+
+
+def database_config(url, environ=os.environ):
+    """A ``DATABASES`` entry for ``url`` with the connection settings from ``environ``"""
+    pool = env_flag(environ, 'DJANGO_DB_POOL', environ.get('DJANGO_ASGI', 'false'))
+    config = dj_database_url.parse(
+        url,
+        # Pooled connections go back to the pool after each request; Django
+        # refuses to combine the pool with persistent connections
+        conn_max_age=0 if pool else int(environ.get('DJANGO_DB_CONN_MAX_AGE', '600')),
+        conn_health_checks=env_flag(environ, 'DJANGO_DB_CONN_HEALTH_CHECKS', 'true'),
+        # Needed behind PgBouncer in transaction mode (e.g. Neon's pooled endpoint)
+        disable_server_side_cursors=env_flag(environ, 'DJANGO_DB_DISABLE_SERVER_SIDE_CURSORS'),
+    )
+    options = {**config.get('OPTIONS', {}), **parse_db_options(environ.get('DJANGO_DB_OPTIONS', DEFAULT_DB_OPTIONS))}
+    if pool:
+        options['pool'] = {
+            'min_size': int(environ.get('DJANGO_DB_POOL_MIN_SIZE', '2')),
+            'max_size': int(environ.get('DJANGO_DB_POOL_MAX_SIZE', '10')),
+            # Seconds a request waits for a free connection before failing
+            'timeout': float(environ.get('DJANGO_DB_POOL_TIMEOUT', '10')),
+        }
+    if options:
+        config['OPTIONS'] = options
+    return config
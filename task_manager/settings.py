@@ -1,7 +1,9 @@
 """Settings for task_manager - Environment variables managed via env.py"""
 from pathlib import Path
 import os
-import dj_database_url
+
+from task_manager.cache import parse_cache_url, cache_key_prefix
+from task_manager.database import database_config
 
 # Load local environment defaults
 try:
@@ -40,6 +42,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # Outermost so it sees every query; inactive unless QUERY_INSTRUMENTATION is set
+    'core.middleware.QueryInstrumentationMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -83,17 +87,10 @@ else:
     database_url = os.environ.get("DATABASE_URL", "").strip()
     if not database_url:
         raise RuntimeError("DATABASE_URL must be set in production (DEBUG=False)")
+    # Persistent connections or a connection pool; see task_manager/database.py
     DATABASES = {
-        'default': dj_database_url.parse(database_url)
+        'default': database_config(database_url)
     }
-    db_options = os.environ.get('DJANGO_DB_OPTIONS', 'sslmode=require&channel_binding=require')
-    if db_options:
-        options_dict = {}
-        for option in db_options.split('&'):
-            if '=' in option:
-                key, value = option.split('=', 1)
-                options_dict[key] = value
-        DATABASES['default']['OPTIONS'] = options_dict
 
 AUTH_PASSWORD_VALIDATORS = []
 
@@ -122,6 +119,35 @@ LOGIN_URL = '/accounts/login/'
 LOGIN_REDIRECT_URL = '/'
 LOGOUT_REDIRECT_URL = '/accounts/login/'
 
+# 📄 TASK LIST PAGINATION
+# Cursor (keyset) pagination avoids COUNT(*) and OFFSET on large task tables
+TASK_LIST_CURSOR_PAGINATION = os.environ.get('DJANGO_TASK_LIST_CURSOR_PAGINATION', 'false').lower() == 'true'
+# Rows counted for the header in cursor mode ("1000+ tasks"); 0 disables the count
+TASK_LIST_COUNT_LIMIT = int(os.environ.get('DJANGO_TASK_LIST_COUNT_LIMIT', '1000'))
+
+# 🔌 REST API (core.api)
+REST_FRAMEWORK = {
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        'rest_framework.authentication.SessionAuthentication',
+        'rest_framework_simplejwt.authentication.JWTAuthentication',
+    ],
+    'DEFAULT_PERMISSION_CLASSES': [
+        'rest_framework.permissions.IsAuthenticated',
+    ],
+}
+
+# 🔍 TASK SEARCH
+# Empty picks PostgreSQL full-text or SQLite FTS5 from the database vendor
+TASK_SEARCH_BACKEND = os.environ.get('DJANGO_TASK_SEARCH_BACKEND', '')
+
+# 🩺 QUERY INSTRUMENTATION
+# Per-request query count, SQL time, duplicates and slowest statement
+QUERY_INSTRUMENTATION = os.environ.get('DJANGO_QUERY_INSTRUMENTATION', 'false').lower() == 'true'
+# Fraction of requests measured, e.g. 0.01 in production
+QUERY_INSTRUMENTATION_SAMPLE_RATE = float(os.environ.get('DJANGO_QUERY_INSTRUMENTATION_SAMPLE_RATE', '1.0'))
+# Expose the numbers to clients as Server-Timing headers
+QUERY_INSTRUMENTATION_HEADERS = os.environ.get('DJANGO_QUERY_INSTRUMENTATION_HEADERS', str(DEBUG)).lower() == 'true'
+
 # 📧 EMAIL CONFIGURATION
 EMAIL_BACKEND = os.environ.get('DJANGO_EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
 EMAIL_HOST = os.environ.get('DJANGO_EMAIL_HOST', '')
@@ -160,12 +186,43 @@ SECURE_HSTS_INCLUDE_SUBDOMAINS = os.environ.get('DJANGO_SECURE_HSTS_INCLUDE_SUBD
 SECURE_HSTS_PRELOAD = os.environ.get('DJANGO_SECURE_HSTS_PRELOAD', 'false').lower() == 'true'
 
 # 🚀 CACHING CONFIGURATION
-CACHES = {
-    'default': {
-        'BACKEND': os.environ.get('DJANGO_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
-        'LOCATION': os.environ.get('DJANGO_CACHE_LOCATION', 'unique-snowflake'),
+# DJANGO_CACHE_URL (or REDIS_URL) selects a cache shared by every worker, e.g.
+# redis://host:6379/1, memcached://host:11211 or file:///var/tmp/django_cache.
+# Without one each process gets a private in-memory cache.
+cache_url = os.environ.get('DJANGO_CACHE_URL') or os.environ.get('REDIS_URL')
+if cache_url:
+    CACHES = {'default': parse_cache_url(cache_url)}
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': os.environ.get('DJANGO_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+            'LOCATION': os.environ.get('DJANGO_CACHE_LOCATION', 'unique-snowflake'),
+        }
     }
-}
+# Keys are namespaced per release (see task_manager/cache.py)
+CACHES['default']['KEY_PREFIX'] = cache_key_prefix(os.environ.get('DJANGO_CACHE_KEY_PREFIX', 'task_manager'))
+# Lifetime of cached task cards and dashboard panels, in seconds
+TASK_FRAGMENT_CACHE_TIMEOUT = int(os.environ.get('DJANGO_TASK_FRAGMENT_CACHE_TIMEOUT', '300'))
+
+# 📡 LIVE TASK EVENTS (Server-Sent Events, served by the ASGI app)
+# 'local' reaches streams in the worker that made the change; 'cache' relays
+# events through CACHES['default'] so every worker sharing it sees them
+TASK_EVENTS_BUS = os.environ.get('DJANGO_TASK_EVENTS_BUS', 'local')
+# Events queued for a slow client before it is told to reload instead
+TASK_EVENTS_MAX_PENDING = int(os.environ.get('DJANGO_TASK_EVENTS_MAX_PENDING', '100'))
+# Open streams per worker process; further clients get 503 and retry later
+TASK_EVENTS_MAX_SUBSCRIBERS = int(os.environ.get('DJANGO_TASK_EVENTS_MAX_SUBSCRIBERS', '2000'))
+# Seconds between keepalive comments on idle streams
+TASK_EVENTS_HEARTBEAT = int(os.environ.get('DJANGO_TASK_EVENTS_HEARTBEAT', '15'))
+# Seconds between bus reads in 'cache' mode
+TASK_EVENTS_POLL_INTERVAL = float(os.environ.get('DJANGO_TASK_EVENTS_POLL_INTERVAL', '1.0'))
+
+# 🧹 ADMIN BULK ACTIONS (complete, cancel, reassign, priority, tags)
+# Tasks per UPDATE and transaction
+TASK_BULK_CHUNK_SIZE = int(os.environ.get('DJANGO_TASK_BULK_CHUNK_SIZE', '1000'))
+# Selections larger than this run in a background thread with a progress
+# page; 0 always runs them within the request
+TASK_BULK_BACKGROUND_THRESHOLD = int(os.environ.get('DJANGO_TASK_BULK_BACKGROUND_THRESHOLD', '5000'))
 
 # 📊 LOGGING CONFIGURATION
 # En local (DEBUG=True) escribimos a archivo y consola; en producción solo consola
@@ -211,6 +268,11 @@ if DEBUG:
                 'level': os.environ.get('DJANGO_LOG_LEVEL', 'INFO'),
                 'propagate': False,
             },
+            'core.queries': {
+                'handlers': ['file', 'console'],
+                'level': 'INFO',
+                'propagate': False,
+            },
         },
     }
 else:
@@ -240,6 +302,11 @@ else:
                 'level': os.environ.get('DJANGO_LOG_LEVEL', 'INFO'),
                 'propagate': False,
             },
+            'core.queries': {
+                'handlers': ['console'],
+                'level': 'INFO',
+                'propagate': False,
+            },
         },
     }
 
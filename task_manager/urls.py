@@ -11,6 +11,7 @@ admin.site.index_title = "Welcome to Task Manager Pro Administration"
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('accounts/', include('allauth.urls')),
+    path('api/', include('core.api.urls')),
     path('', include('core.urls')),
 ]
 